@@ -0,0 +1,68 @@
+"""
+Compare the run times of the serial, thread and process backends.
+
+This script generates the same set of curves with each backend of the
+surgebinder() function and prints the run time of each backend, for
+request sizes that are typical for function perturbation. All backends
+compute identical curves, which is confirmed for every run.
+
+Usage:
+------
+python backends.py [engine] [n_workers]
+
+The engine defaults to "vectorized" and the number of workers to the
+number of processors of the machine.
+"""
+# Import the necessary libraries
+import os
+import io
+import sys
+import time
+import contextlib
+import numpy as np
+from smurves import surgebinder
+
+def timing(n_curves,
+           engine,
+           backend,
+           n_workers):
+    """
+    Generate a set of seeded curves and measure the run time.
+    """
+    start = time.perf_counter()
+    # Silence the progress printouts of the curve generation
+    with contextlib.redirect_stdout(io.StringIO()):
+        x_values, values = surgebinder(n_curves = n_curves,
+                                       x_interval = [0.0, 5.0],
+                                       y_interval = [-1.0, 3.0],
+                                       n_measure = 2000,
+                                       direction_maximum = 3,
+                                       seed = 42,
+                                       engine = engine,
+                                       dense = True,
+                                       backend = backend,
+                                       n_workers = n_workers)
+    return time.perf_counter() - start, values
+
+if __name__ == "__main__":
+    engine = sys.argv[1] if len(sys.argv) > 1 else "vectorized"
+    n_workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+    print("Engine: %s, workers: %d\n" % (engine, n_workers))
+    # Compile the kernels before timing if the compiled engine is used
+    timing(n_curves = 10,
+           engine = engine,
+           backend = "serial",
+           n_workers = None)
+    for n_curves in [1000, 10000]:
+        reference = None
+        for backend in ["serial", "threads", "processes"]:
+            seconds, values = timing(n_curves = n_curves,
+                                     engine = engine,
+                                     backend = backend,
+                                     n_workers = n_workers)
+            if reference is None:
+                reference = values
+            identical = np.array_equal(values, reference)
+            print("%6d curves, %-9s: %7.3f s (identical: %s)"
+                  % (n_curves, backend, seconds, identical))
+        print()
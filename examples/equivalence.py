@@ -0,0 +1,195 @@
+"""
+Test whether the engines and backends sample the same curve distribution.
+
+This script generates large seeded sets of curves with the reference
+implementation, i.e. the "numpy" engine with the serial backend, and
+with each candidate, using different seeds so that the sets are
+independent samples. It then compares the two sets with two-sample
+tests, and prints the run time of each candidate next to the results:
+
+    - the marginal distribution of the y-axis values at every tenth
+      measurement point, with Kolmogorov-Smirnov tests,
+    - the number of direction changes per curve, with a chi-squared test,
+    - the positions of the direction changes, with a Kolmogorov-Smirnov
+      test,
+    - the forces, i.e. the absolute second derivatives of the curves at
+      a random point between the change points of each curve, with a
+      Kolmogorov-Smirnov test,
+    - the acceptance rate of the curve attempts, with a z-test for two
+      proportions.
+
+The change points and forces are recovered from the curves, as each
+partial path is a parabola with a constant second derivative whose sign
+flips at every change point, so that any engine can be tested without
+access to its internals. The p-values of the marginals are corrected for
+the number of tests, and a candidate passes if no test rejects the
+equivalence at the given significance level. The script requires SciPy.
+
+Usage:
+------
+python equivalence.py [n_curves] [alpha]
+
+The number of curves per set defaults to 20000 and the significance
+level to 0.01. The exit status is 1 if any candidate fails.
+"""
+# Import the necessary libraries
+import io
+import re
+import sys
+import time
+import contextlib
+import numpy as np
+from scipy import stats
+from smurves import surgebinder
+
+# The parameter sets on which the candidates are tested
+settings = {"default": dict(x_interval = [0.0, 5.0],
+                            y_interval = [-1.0, 3.0],
+                            n_measure = 200,
+                            direction_maximum = 3),
+            "constrained": dict(x_interval = [0.0, 5.0],
+                                y_interval = [0.0, 2.0],
+                                n_measure = 200,
+                                direction_maximum = 4,
+                                convergence_point = [0.0, 1.0],
+                                random_launch = True,
+                                change_spacing = 10,
+                                change_ratio = 0.5)}
+
+# The candidates that are compared to the reference implementation
+candidates = {"vectorized": dict(engine = "vectorized"),
+              "numba": dict(engine = "numba"),
+              "threads": dict(engine = "vectorized",
+                              backend = "threads",
+                              n_workers = 4),
+              "sobol": dict(engine = "vectorized",
+                            sampling = "sobol")}
+
+def sampling(n_curves,
+             seed,
+             setting,
+             candidate):
+    """
+    Generate a set of seeded curves and measure the run time.
+    """
+    start = time.perf_counter()
+    # Silence the progress printouts of the curve generation
+    printouts = io.StringIO()
+    with contextlib.redirect_stdout(printouts):
+        x_values, values = surgebinder(n_curves = n_curves,
+                                       seed = seed,
+                                       dense = True,
+                                       **setting,
+                                       **candidate)
+    seconds = time.perf_counter() - start
+    # Read the numbers of accepted curves and attempts from the printouts
+    accepted, attempts = map(int, re.search(r"Accepted (\d+) of (\d+) curve "
+                                            r"attempts",
+                                            printouts.getvalue()).groups())
+    return seconds, x_values, values, accepted, attempts
+
+def structure(x_values,
+              values):
+    """
+    Recover the change points and forces from the curves.
+    """
+    step = x_values[1] - x_values[0]
+    curvature = np.diff(values, n = 2, axis = 1) / step**2
+    # Ignore the numerical noise of flat parts of the curves
+    scale = np.max(np.abs(curvature))
+    signs = np.where(np.abs(curvature) > 1e-6 * scale, np.sign(curvature), 0)
+    counts = np.zeros(len(values), dtype = np.int64)
+    positions = []
+    for row in range(0, len(values)):
+        bent = np.flatnonzero(signs[row])
+        flips = bent[1:][np.diff(signs[row, bent]) != 0]
+        counts[row] = len(flips)
+        positions.append(x_values[flips + 1])
+    # Use the curvature at a random point away from the change points
+    steady = ((signs[:, 1:-1] != 0) & (signs[:, 1:-1] == signs[:, :-2])
+              & (signs[:, 1:-1] == signs[:, 2:]))
+    rng = np.random.default_rng(0)
+    forces = []
+    for row in np.flatnonzero(np.any(steady, axis = 1)):
+        point = rng.choice(np.flatnonzero(steady[row])) + 1
+        forces.append(abs(curvature[row, point]))
+    forces = np.asarray(forces)
+    return counts, np.concatenate(positions), forces
+
+def comparison(reference,
+               candidate):
+    """
+    Compute the p-values of the two-sample tests of two sets of curves.
+    """
+    x_values, values, accepted, attempts = reference
+    other_x, other_values, other_accepted, other_attempts = candidate
+    # Correct the marginal tests for their number
+    columns = range(5, values.shape[1], 10)
+    marginals = min(1.0, len(columns) * min(stats.ks_2samp(values[:, i],
+                                                           other_values[:, i]).pvalue
+                                            for i in columns))
+    counts, positions, forces = structure(x_values, values)
+    other_counts, other_positions, other_forces = structure(other_x,
+                                                            other_values)
+    # Compare the numbers of change points in a contingency table
+    bins = np.arange(0, max(counts.max(), other_counts.max()) + 2)
+    table = np.array([np.histogram(counts, bins)[0],
+                      np.histogram(other_counts, bins)[0]])
+    table = table[:, table.sum(axis = 0) > 0]
+    if table.shape[1] > 1:
+        changes = stats.chi2_contingency(table).pvalue
+    else:
+        changes = 1.0
+    if (len(positions) > 0) and (len(other_positions) > 0):
+        places = stats.ks_2samp(positions, other_positions).pvalue
+    else:
+        places = 1.0
+    # Compare one force per curve, as neighbouring ones are equal
+    strengths = stats.ks_2samp(forces, other_forces).pvalue
+    # Compare the acceptance rates with a z-test for two proportions
+    acceptance = accepted / attempts
+    other_acceptance = other_accepted / other_attempts
+    pooled = (accepted + other_accepted) / (attempts + other_attempts)
+    error = np.sqrt(pooled * (1 - pooled) * (1 / attempts + 1 / other_attempts))
+    if error > 0:
+        z = (acceptance - other_acceptance) / error
+        rates = 2 * stats.norm.sf(abs(z))
+    else:
+        rates = 1.0
+    return {"marginals": marginals,
+            "changes": changes,
+            "positions": places,
+            "forces": strengths,
+            "acceptance": rates}
+
+if __name__ == "__main__":
+    n_curves = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    alpha = float(sys.argv[2]) if len(sys.argv) > 2 else 0.01
+    print("Curves per set: %d, significance level: %g\n" % (n_curves, alpha))
+    # Compile the kernels before timing
+    sampling(n_curves = 10,
+             seed = 0,
+             setting = settings["default"],
+             candidate = dict(engine = "numba"))
+    failures = 0
+    for name, setting in settings.items():
+        seconds, *reference = sampling(n_curves = n_curves,
+                                       seed = 1,
+                                       setting = setting,
+                                       candidate = dict(engine = "numpy"))
+        print("%s, reference: %7.3f s, acceptance %.3f"
+              % (name, seconds, reference[2] / reference[3]))
+        for seed, (label, candidate) in enumerate(candidates.items(), 2):
+            seconds, *sample = sampling(n_curves = n_curves,
+                                        seed = seed,
+                                        setting = setting,
+                                        candidate = candidate)
+            pvalues = comparison(reference, sample)
+            passed = min(pvalues.values()) >= alpha
+            failures = failures + (not passed)
+            print("  %-10s: %7.3f s, %s (%s)"
+                  % (label, seconds, "pass" if passed else "FAIL",
+                     ", ".join("%s p = %.3f" % item
+                               for item in pvalues.items())))
+        print()
+    sys.exit(1 if failures > 0 else 0)
@@ -56,10 +56,43 @@ School of Physics & Astronomy
 The University of Edinburgh
 """
 # Import the necessary libraries
+import io
+import os
 import sys
+import json
+import math
+import time
+import queue
+import shutil
+import signal
+import socket
+import asyncio
+import zipfile
+import argparse
+import operator
+import tempfile
 import warnings
+import functools
+import itertools
+import threading
+import contextlib
+import socketserver
+import multiprocessing
+import concurrent.futures
 import numpy as np
-from random import uniform, sample
+
+# Import the optional just-in-time compiler if it is available
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+# Import the optional quasi-random sequences if they are available
+try:
+    from scipy.stats import qmc
+except ImportError:
+    qmc = None
 
 # Ignore irrelevant lower outputs
 warnings.filterwarnings("ignore")
@@ -76,7 +109,19 @@ def surgebinder(n_curves,
                 change_range = None,
                 change_spacing = None,
                 change_ratio = None,
-                start_force = None):
+                start_force = None,
+                seed = None,
+                first_curve = 0,
+                engine = "numpy",
+                dense = False,
+                dtype = np.float64,
+                backend = "serial",
+                n_workers = None,
+                sampling = "random",
+                antithetic = False,
+                accept = None,
+                anchors = None,
+                time_budget = None):
     """
     Generate random smooth curves while fulfilling given constraints.
 
@@ -173,12 +218,135 @@ def surgebinder(n_curves,
         if a function perturbation should only happen after a certain
         point, which can be specified by setting this parameter.
 
+    seed : int >= 0, defaults to None
+        The seed that keys the counter-based random number generators of
+        all curves. Each curve index draws from its own stream, so that
+        the same seed always reproduces the same curve for a given index.
+        If no seed is provided, a fresh seed is drawn from the system.
+
+    first_curve : int >= 0, defaults to 0
+        The index of the first curve that is to be generated. Together
+        with 'seed', this allows regenerating any slice of a seeded set
+        of curves, e.g. the curves with indices 1000 to 1009, without
+        having to generate all of the curves that come before them.
+
+    engine : str, defaults to "numpy"
+        The backend that computes the curves, as either "numpy" for the
+        reference implementation that computes one curve at a time,
+        "vectorized" for NumPy array operations across whole batches of
+        curves, or "numba" for a compiled kernel that computes batches
+        in parallel across curves. If Numba isn't installed, the "numba"
+        engine falls back to "vectorized". All engines draw from the
+        same random streams and compute the same curves for each index.
+
+    dense : bool, defaults to False
+        The indicator whether the curves should be returned as a single
+        array of y-axis values together with the x-axis values that are
+        shared by all curves, instead of a list with one array per curve.
+
+    dtype : numpy.dtype, defaults to numpy.float64
+        The floating-point type of the generated curves, as either
+        numpy.float64 or numpy.float32. For numpy.float32, the curves
+        are evaluated and stored in single precision, which halves the
+        memory of the output, while the few per-curve forces and angles
+        are still sampled in double precision. The y-axis interval is
+        checked on the stored values, and the values deviate from the
+        ones for numpy.float64 by less than 1e-6 times the largest
+        absolute bound of the y-axis interval.
+
+    backend : str, defaults to "serial"
+        The way in which the work is spread over several workers, as
+        either "serial" for computing all curves in the calling thread,
+        "threads" for a pool of threads that write disjoint ranges of
+        rows into one shared output array, or "processes" for a pool of
+        processes whose ranges of rows are copied into the output. Each
+        curve index keeps its own random stream, so that all backends
+        compute the same curves. Threads only help for the "vectorized"
+        engine, whose large array operations release the interpreter
+        lock, while the "numba" engine already runs in parallel.
+
+    n_workers : int >= 1, defaults to None
+        The number of threads or processes of the backend, with None
+        using the number of processors of the machine.
+
+    sampling : str, defaults to "random"
+        The way in which the random values of the first attempt of each
+        curve are drawn, as either "random" for independent draws from
+        the curve's random stream, "sobol" for a scrambled Sobol sequence
+        over the curve indices, or "lhs" for a Latin hypercube over the
+        requested curves. The quasi-random point of a curve sets its
+        starting point, number of change points, initial direction,
+        launch angle, change points and force variates, which covers the
+        constraint space more evenly than independent draws. Attempts
+        that are retried after leaving the y-axis interval use the
+        curve's random stream, i.e. independent draws from the same
+        constrained distribution. The Sobol points follow the curve
+        indices, so that slices with 'first_curve' are reproducible,
+        while the Latin hypercube depends on the number of curves. Both
+        require SciPy, without which the sampling falls back to "random".
+
+    antithetic : bool, defaults to False
+        The indicator whether the curves should be generated in mirrored
+        pairs, with each curve with an even index followed by its mirror
+        image about its starting point on the y-axis. Both curves of a
+        pair have to stay within the y-axis interval, and only one curve
+        of each pair is computed, which halves the work per curve and
+        reduces the variance of ensemble averages. The pairs follow the
+        generation process only if the y-axis interval is symmetric
+        around the starting points, e.g. for a convergence point in the
+        middle of the interval.
+
+    accept : callable, defaults to None
+        The acceptance test of the user for constraints beyond the y-axis
+        interval, e.g. on slopes, curvatures or integrals. It is called
+        as accept(x, Y) with the x-axis values shared by all curves and
+        an array Y with one row of y-axis values per curve, for each new
+        batch of curves that stay within the y-axis interval, and has to
+        return one boolean value per row. Rejected curves are redrawn
+        from their random streams like curves that leave the interval.
+        For the "processes" backend, the test has to be picklable, e.g.
+        a function defined at the top level of a module.
+
+    anchors : list of tuples with three single floats, defaults to None
+        The points through which all curves should pass, as a list of
+        (x-axis value, y-axis value, tolerance) tuples. Each anchor point
+        is moved to the nearest measurement point, at which every curve
+        gets a change point, and the force of the partial path that ends
+        there is set so that the path hits a target drawn uniformly from
+        the window of the anchor point, instead of being sampled. The
+        curves thus pass through the windows by construction and only
+        have to stay within the y-axis interval. Anchor points can't be
+        combined with mirrored pairs and have to lie after 'start_force'.
+
+    time_budget : float > 0, defaults to None
+        The number of seconds after which the generation stops, for
+        returning as many curves as fit into the time instead of waiting
+        for all of them, which bounds the run time of the redrawing for
+        low acceptance rates. The curves are generated in batches of
+        growing size, and no new attempts are started once the time is
+        spent. The returned curves are the first ones of the requested
+        curve indices, and thus identical to the ones without a budget.
+        A budget can't be combined with the "processes" backend, as the
+        start of the processes alone takes longer than typical budgets.
+
     Returns:
     --------
     curves: list
         The generated curves in a list, with one list element per curve.
         Each list elemenet contains two rows, the first for the x-axis
         measurement points and the second for the y-axis measurements.
+        If 'dense' is True, a tuple of the x-axis values shared by all
+        curves and an array with one row of y-axis values per curve is
+        returned instead.
+
+    complete : bool
+        The indicator whether all requested curves have been generated
+        within the time budget, only returned if 'time_budget' is set.
+
+    acceptance : float
+        The observed share of curve attempts that have been accepted,
+        for sizing the next request, only returned if 'time_budget' is
+        set.
 
     Attributes:
     -----------
@@ -197,228 +365,673 @@ def surgebinder(n_curves,
           change_range = change_range,
           change_spacing = change_spacing,
           change_ratio = change_ratio,
-          start_force = start_force)
-    print("Generating random curves ...\n")
-    # If no change range is given, set limits to 10% and 90%
-    if change_range == None:
-        change_range = [0.1, 0.9]
-    # If no change spacing is given, set the spacing to 1
-    if change_spacing == None:
-        change_spacing = 1
-    # Check if one singular convergence point was requested
-    if convergence_point == None:
-        convergence_flag = True
+          start_force = start_force,
+          seed = seed,
+          first_curve = first_curve,
+          engine = engine,
+          dense = dense,
+          dtype = dtype,
+          backend = backend,
+          n_workers = n_workers,
+          sampling = sampling,
+          antithetic = antithetic,
+          accept = accept,
+          anchors = anchors,
+          time_budget = time_budget)
+    # Start the clock of the time budget if one is given
+    if time_budget is not None:
+        deadline = time.perf_counter() + time_budget
     else:
-        convergence_flag = False
-    # Calculate both the step size and measurement locations
-    difference = np.diff([x_interval[0], x_interval[1]])
-    step_size = np.divide(difference, n_measure - 1)
-    steps = [x_interval[0] + np.multiply(i, step_size)
-             for i in range(0, n_measure)]
-    if n_curves >= 10:
-        # Set 10%-based printout milestones for progress updates
-        iter_range = np.array_split(np.arange(0, n_curves), 10)
-        print_points = [entry[-1] for entry in iter_range]
-        perc = 0
-        progress_update = 0
+        deadline = None
+    # Fall back to the NumPy batch engine if Numba isn't available
+    if (engine == "numba") and (njit is None):
+        print("Numba isn't installed, using the vectorized engine instead\n")
+        engine = "vectorized"
+    # Fall back to independent draws if SciPy isn't available
+    if (sampling != "random") and (qmc is None):
+        print("SciPy isn't installed, using random sampling instead\n")
+        sampling = "random"
+    print("Generating random curves ...\n")
+    # Set up the measurement points and the change point settings
+    preparation_output = preparation(x_interval = x_interval,
+                                     n_measure = n_measure,
+                                     log_scale = log_scale,
+                                     change_range = change_range,
+                                     change_spacing = change_spacing,
+                                     start_force = start_force)
+    steps, offsets, step_size = preparation_output[0:3]
+    change_range, change_spacing = preparation_output[3:5]
+    flat_state, flat_value, x_values = preparation_output[5:8]
+    # Place the anchor points onto the measurement points
+    anchors = anchorage(anchors = anchors,
+                        x_interval = x_interval,
+                        x_values = x_values,
+                        n_measure = n_measure,
+                        flat_state = flat_state,
+                        flat_value = flat_value,
+                        right_convergence = right_convergence)
+    # Compute one plan per pair of mirrored curves if requested
+    if antithetic == True:
+        first_plan = first_curve // 2
+        n_plans = (first_curve + n_curves + 1) // 2 - first_plan
     else:
-        progress_update = 0
-        print_points = None
-        perc = None
-    # Set an indicator for a requested flat state at the start
-    if start_force == None:
-        flat_state = False
-        flat_value = None
+        first_plan = first_curve
+        n_plans = n_curves
+    # Keep the batches of a time budget, of which only a prefix is reached
+    if deadline is not None:
+        values = None
+        chunks = {}
+    elif antithetic == True:
+        # Align the first returned row, which is a mirror for odd indices
+        pairs = allocation(shape = (2 * n_plans, n_measure),
+                           dtype = dtype,
+                           lead = ((first_curve % 2) * n_measure
+                                   * np.dtype(dtype).itemsize))
+        values = pairs[0::2]
     else:
-        flat_state = True
-        # If for log-scale, recalculate the flat state ending
-        if log_scale == True:
-            log_steps = logarithmic(x_interval = x_interval,
-                                    n_measure = n_measure)
-            log_cut = np.min(np.where(np.asarray(log_steps) > start_force)[0])
-            start_force = steps[log_cut]
-        flat_value = start_force
-    # Save the number of curves to be generated separately
-    curve_request = n_curves
-    # Initialize the number of curves already generated
-    done_curves = 0
-    # Generate curves with the previously set preferences
-    generator_output = generator(n_curves = n_curves,
-                                 curve_request = curve_request,
-                                 x_interval = x_interval,
-                                 y_interval = y_interval,
-                                 convergence_flag = convergence_flag,
-                                 convergence_point = convergence_point,
-                                 flat_state = flat_state,
-                                 direction_maximum = direction_maximum,
-                                 steps = steps,
-                                 step_size = step_size,
-                                 change_range = change_range,
-                                 change_spacing = change_spacing,
-                                 change_ratio = change_ratio,
-                                 start_force = start_force,
-                                 flat_value = flat_value,
-                                 log_scale = log_scale,
-                                 random_launch = random_launch,
+        values = allocation(shape = (n_curves, n_measure), dtype = dtype)
+    # Set 10%-based printout milestones for progress updates
+    print_points, perc, progress_update = milestones(n_curves = n_plans)
+    # Derive the key shared by the random streams of all curves
+    key = keychain(seed = seed)
+    # Draw the quasi-random points of the first attempts if requested
+    points = quasirandom(key = key,
+                         n_curves = n_plans,
+                         first_curve = first_plan,
+                         direction_maximum = direction_maximum,
+                         n_anchors = 0 if anchors is None else len(anchors),
+                         sampling = sampling)
+    # Bind the settings that are shared by all rows of curves
+    task = functools.partial(dispatcher,
+                             key = key,
+                             x_interval = x_interval,
+                             y_interval = y_interval,
+                             convergence_point = convergence_point,
+                             flat_state = flat_state,
+                             flat_value = flat_value,
+                             direction_maximum = direction_maximum,
+                             steps = steps,
+                             offsets = offsets,
+                             step_size = step_size,
+                             change_range = change_range,
+                             change_spacing = change_spacing,
+                             change_ratio = change_ratio,
+                             random_launch = random_launch,
+                             engine = engine,
+                             dtype = dtype,
+                             antithetic = antithetic,
+                             anchors = anchors,
+                             accept = accept,
+                             deadline = deadline,
+                             x_values = x_values,
+                             right_convergence = right_convergence)
+    if (backend == "serial") and (deadline is None):
+        dispatcher_output = task(n_curves = n_plans,
+                                 first_curve = first_plan,
                                  print_points = print_points,
                                  perc = perc,
                                  progress_update = progress_update,
-                                 done_curves = done_curves)
-    # Save the curves and the progress parameters to variables
-    curves = generator_output[0]
-    print_points = generator_output[1]
-    perc = generator_output[2]
-    progress_update = generator_output[3]
-    done_curves = generator_output[4]
-    # If curves got deleted, generate new ones to compensate
-    while len(curves) < curve_request:
-        # Generate a new curve with the previously set preferences
-        generator_output = generator(n_curves = 1,
-                                     curve_request = curve_request,
-                                     x_interval = x_interval,
-                                     y_interval = y_interval,
-                                     convergence_flag = convergence_flag,
-                                     convergence_point = convergence_point,
-                                     flat_state = flat_state,
-                                     direction_maximum = direction_maximum,
-                                     steps = steps,
-                                     step_size = step_size,
-                                     change_range = change_range,
-                                     change_spacing = change_spacing,
-                                     change_ratio = change_ratio,
-                                     start_force = start_force,
-                                     flat_value = flat_value,
-                                     log_scale = log_scale,
-                                     random_launch = random_launch,
-                                     print_points = print_points,
-                                     perc = perc,
-                                     progress_update = progress_update,
-                                     done_curves = done_curves)
-        # Save the curves and the progress parameters to variables
-        new_curves = generator_output[0]
-        print_points = generator_output[1]
-        perc = generator_output[2]
-        progress_update = generator_output[3]
-        done_curves = generator_output[4]
-        # Add the newly generate curves to the full lit of curves
-        if len(new_curves) > 0:
-            for i in range(0, len(new_curves)):
-                curves.append(new_curves[i])
+                                 points = points,
+                                 curves = values)
+        attempts = dispatcher_output[4]
+        completed = dispatcher_output[5]
+    elif backend == "serial":
+        completed = np.zeros(n_plans, dtype = bool)
+        attempts = 0
+        first = 0
+        size = 64
+        begin = time.perf_counter()
+        # Generate batches of growing size until the time is spent
+        while ((first < n_plans) and (size > 0)
+               and (time.perf_counter() < deadline)):
+            last = min(n_plans, first + size)
+            if points is None:
+                chunk_points = None
+            else:
+                chunk_points = points[first:last]
+            # Silence the progress printouts of the single batches
+            dispatcher_output = task(n_curves = last - first,
+                                     first_curve = first_plan + first,
+                                     print_points = [],
+                                     perc = 0,
+                                     progress_update = last - first,
+                                     points = chunk_points,
+                                     curves = None)
+            chunks[first] = dispatcher_output[0]
+            attempts = attempts + dispatcher_output[4]
+            completed[first:last] = dispatcher_output[5]
+            # Print progress updates to inform about remaining time
+            progress_output = progress(done_curves = np.sum(completed),
+                                       curve_request = n_plans,
+                                       print_points = print_points,
+                                       perc = perc,
+                                       progress_update = progress_update)
+            print_points, perc, progress_update = progress_output
+            first = last
+            # Grow the batches only as far as the remaining time allows
+            now = time.perf_counter()
+            rate = np.sum(completed[0:last]) / max(now - begin, 1e-9)
+            size = min(2 * size, int(rate * (deadline - now)))
+    else:
+        if n_workers == None:
+            n_workers = os.cpu_count()
+        if backend == "threads":
+            pool = concurrent.futures.ThreadPoolExecutor(n_workers)
+        else:
+            # Start fresh processes, as forking breaks compiled threads
+            context = multiprocessing.get_context("spawn")
+            pool = concurrent.futures.ProcessPoolExecutor(n_workers,
+                                                          mp_context = context)
+        # Split the curve indices into disjoint ranges of rows
+        n_ranges = min(n_plans, 4 * n_workers)
+        # Use short ranges in order for a time budget to finish early ones
+        if deadline is not None:
+            n_ranges = max(n_ranges, -(-n_plans // 64))
+        ranges = np.array_split(np.arange(0, n_plans), n_ranges)
+        attempts = 0
+        done_curves = 0
+        completed = np.zeros(n_plans, dtype = bool)
+        # Submit all ranges at once, or a few at a time for a time budget
+        if deadline is None:
+            n_flight = len(ranges)
+        else:
+            n_flight = 2 * n_workers
+        upcoming = iter(ranges)
+        with pool as executor:
+            futures = {}
+            while True:
+                # Keep the workers busy until the time budget is spent
+                while ((len(futures) < n_flight)
+                       and ((deadline is None)
+                            or (time.perf_counter() < deadline))):
+                    rows = next(upcoming, None)
+                    if rows is None:
+                        break
+                    first, last = rows[0], rows[-1] + 1
+                    # Let threads write directly into the shared output rows
+                    if (backend == "threads") and (deadline is None):
+                        buffer = values[first:last]
+                    else:
+                        buffer = None
+                    if points is None:
+                        chunk_points = None
+                    else:
+                        chunk_points = points[first:last]
+                    # Silence the progress printouts of the single ranges
+                    future = executor.submit(task,
+                                             n_curves = last - first,
+                                             first_curve = first_plan + first,
+                                             print_points = [],
+                                             perc = 0,
+                                             progress_update = last - first,
+                                             points = chunk_points,
+                                             curves = buffer)
+                    futures[future] = (first, last)
+                if len(futures) == 0:
+                    break
+                finished, _ = concurrent.futures.wait(futures,
+                                                      return_when = concurrent.futures.FIRST_COMPLETED)
+                for future in finished:
+                    first, last = futures.pop(future)
+                    dispatcher_output = future.result()
+                    # Keep the rows of a time budget and of other processes
+                    if deadline is not None:
+                        chunks[first] = dispatcher_output[0]
+                    elif backend == "processes":
+                        values[first:last] = dispatcher_output[0]
+                    attempts = attempts + dispatcher_output[4]
+                    completed[first:last] = dispatcher_output[5]
+                    # Print progress updates to inform about remaining time
+                    done_curves = done_curves + last - first
+                    progress_output = progress(done_curves = done_curves,
+                                               curve_request = n_plans,
+                                               print_points = print_points,
+                                               perc = perc,
+                                               progress_update = progress_update)
+                    print_points, perc, progress_update = progress_output
+                # Cancel the ranges that haven't started once the time is spent
+                if (deadline is not None) and (time.perf_counter() >= deadline):
+                    for future in list(futures):
+                        if future.cancel() == True:
+                            futures.pop(future)
+    print("\nAccepted %d of %d curve attempts" % (np.sum(completed),
+                                                  attempts))
     print("\nPreparing the final output ...")
-    # Transform to log-scale measurements if required by the user
-    if log_scale == True:
-        steps = logarithmic(x_interval = x_interval,
-                            n_measure = n_measure)
-        # Save the log-scale measurement points into the curves
-        for i in range(0, len(curves)):
-            for j in range(0, len(curves[i])):
-                curves[i][j][0] = steps[j]
+    # Keep the curves up to the first one that isn't completed
+    if np.all(completed):
+        n_done = n_plans
+    else:
+        n_done = int(np.argmin(completed))
+    # Assemble the reached prefix from the batches of a time budget
+    if deadline is not None:
+        if antithetic == True:
+            pairs = allocation(shape = (2 * n_done, n_measure),
+                               dtype = dtype,
+                               lead = ((first_curve % 2) * n_measure
+                                       * np.dtype(dtype).itemsize))
+            values = pairs[0::2]
+        else:
+            values = allocation(shape = (n_done, n_measure), dtype = dtype)
+        for first, rows in chunks.items():
+            if first < n_done:
+                last = min(n_done, first + len(rows))
+                values[first:last] = rows[0:last - first]
+    values = values[0:n_done]
+    # Mirror each curve about its starting point into the next row
+    if antithetic == True:
+        mirrors = pairs[1:2 * n_done:2]
+        np.subtract(2 * values[:, 0:1], values, out = mirrors)
+        # Guard the mirrored curves against rounding at the bounds
+        np.clip(mirrors, y_interval[0], y_interval[1], out = mirrors)
+        start = first_curve - 2 * first_plan
+        values = pairs[start:max(start, min(start + n_curves, 2 * n_done))]
     # If right-side convergence is requested, flip the values
     if right_convergence == True:
-        for i in range(0, len(curves)):
-            curves[i][:, 1] = curves[i][:, 1][::-1]
-    # Cut the dataset to the user-requested number of curves
-    #curves = curves[0:orig_request]
+        flipped = allocation(shape = values.shape, dtype = dtype)
+        np.copyto(flipped, values[:, ::-1])
+        values = flipped
     print("\nComplete, returning your curves!")
+    # Return the shared x-axis values and the y-axis values if requested
+    if dense == True:
+        curves = (x_values.astype(dtype), values)
+    else:
+        # Combine the shared x-axis values with each curve's y-axis values
+        output = np.empty((len(values), n_measure, 2), dtype = dtype)
+        output[:, :, 0] = x_values
+        output[:, :, 1] = values
+        curves = list(output)
+    # Report the completeness and acceptance rate for a time budget
+    if time_budget is not None:
+        complete = (len(values) == n_curves)
+        acceptance = float(np.sum(completed) / max(attempts, 1))
+        return curves, complete, acceptance
     # Return the list of random curves as the function output
     return curves
 
-def deletion(curves,
-             y_interval,
-             n_curves):
+def batchbinder(n_curves,
+                x_interval,
+                y_intervals,
+                n_measure,
+                direction_maxima,
+                convergence_points = None,
+                log_scale = False,
+                random_launch = False,
+                right_convergence = False,
+                change_range = None,
+                change_spacing = None,
+                change_ratios = None,
+                start_force = None,
+                seed = None,
+                first_curve = 0,
+                engine = "vectorized",
+                dtype = np.float64,
+                sampling = "random",
+                accept = None,
+                basis = None,
+                batch_size = 1000):
     """
-    Delete curves who overshoot outside of the set y-axis interval.
+    Generate random smooth curves for many parameter sets in one call.
 
-    This function checks curves against the y-axis interval set by the
-    user and deletes them from the list of curves if their trajectory
-    leads outside of that interval. While the gravitational force
-    sampling takes care of staying within the y-axis interval with
-    regard to the final point of each partial path, forward calculation
-    and eventual dismissal of the curves would be too costly and is thus
-    substituted with deletion and, subsequently, the generation of just
-    the number of additional valid curves that are necessary.
+    This is the batched counterpart of the surgebinder() function for
+    parameter sweeps. Each group of curves has its own y-axis interval,
+    maximum number of direction changes, change ratio and convergence
+    point, while all groups share the same x-axis measurement points.
+    The parameters are validated and the measurement points are set up
+    only once, and the curves of all groups are computed together in
+    the same batches instead of in one separate call per parameter set.
 
     Parameters:
     -----------
-     curves: list
-        The generated curves in a list, with one list element per curve.
-        Each list elemenet contains two rows, the first for the x-axis
-        measurement points and the second for the y-axis measurements.
+    n_curves : int >= 1 or list of ints
+        The number of curves that are to be generated for each group,
+        either as one number for all groups or as one number per group.
 
-    y_interval : list
-        The x-axis interval for curves, as [lower point, upper point].
-        This range indicates which y-axis window curves shouldn't leave
-        under any circumstances to make them still useful to the user.
+    x_interval : list with two single floats
+        The x-axis interval for curves, as [left point, rigth point].
+        This range indicates over which x-axis span the measurements
+        for the curves should be done, i.e. the range of the curves.
 
-    n_curves : int
-        The number of curves that are to be returned to the user. This
-        is simply the value that indicates how many curves are needed
-        for whatever goal they'll be used after being generated.
+    y_intervals : list of lists with two single floats
+        The y-axis interval of each group, as [lower point, upper point].
+        The number of entries in this list sets the number of groups.
+
+    n_measure : int >= 0
+        The number of equally-spaced measurement points on the x-axis
+        for each curve. If the parameter 'log_scale' is set to True, the
+        points will be equally-spaced only if depicted on a logarithmic
+        x-axis. Otherwise, they will be equally-spaced on linear scales.
+
+    direction_maxima : list of ints >= 0
+        The maximum number of gravity flips of each group, i.e. the
+        upper end of the range from which the number of gravitational
+        direction change points of a curve is sampled uniformly.
+
+    convergence_points : list, defaults to None
+        The convergence point of each group, as [x-axis value, y-axis
+        value], or None for groups whose starting points on the y-axis
+        are sampled uniformly random from the group's y-axis interval.
+        If the whole parameter is None, no group has a convergence point.
+
+    log_scale : bool, defaults to False
+        The indicator whether the measurements on the x-axis should be
+        on a logarithmic scale, while retaining the behavior of a code
+        calculation for a linear scale. This means that the steps will
+        be equally-spaced when displayed with a logarithmic x-axis.
+
+    random_launch : bool, defaults to False
+        The indicator whether no initial zero launch angle is necessary,
+        i.e. projectiles will start at random angles sampled uniformly
+        between -90 and 90 degrees for each curve separately.
+
+    right_convergence : bool, defaults to False
+        The indicator whether curves should converge on the right side
+        instead of the left side. After computing the curves, their
+        y-axis measurement vectors will be flipped.
+
+    change_range : list with two single floats, defaults to None
+        The x-axis percentiles below and above which no gravity flips
+        should take place, as [lower percentile, upper percentile]. The
+        default behavior is to use the 10th and 90th percentile.
+
+    change_spacing : int > 0, defaults to 1
+        The minimum space on the x-axis in full steps that is required
+        between gravitational direction changes, with hiher values
+        resulting in increased smoothness.
+
+    change_ratios : list, defaults to None
+        The change ratio of each group as a float > 0, or None for groups
+        in which the previous force doesn't limit the next force. If the
+        whole parameter is None, no group uses a change ratio.
+
+    start_force : float, defaults to None
+        The x-axis point before which no y-axis deviation with regard to
+        the projectile's starting point should happen, for all groups.
+
+    seed : int >= 0, defaults to None
+        The seed that keys the counter-based random number generators of
+        all curves. The curves of all groups are numbered consecutively,
+        starting with the first group, and each curve index draws from
+        its own stream. If no seed is provided, a fresh seed is used.
+
+    first_curve : int >= 0, defaults to 0
+        The index of the first curve that is to be generated, which is
+        added to the consecutive numbers of the curves of all groups.
+
+    engine : str, defaults to "vectorized"
+        The batch kernel that computes the curves, as either "vectorized"
+        for NumPy array operations across curves or "numba" for compiled
+        parallel loops. If Numba isn't installed, "vectorized" is used.
+
+    dtype : numpy.dtype, defaults to numpy.float64
+        The floating-point type of the generated curves, as either
+        numpy.float64 or numpy.float32. For numpy.float32, the curves
+        are evaluated and stored in single precision, which halves the
+        memory of the output, while the few per-curve forces and angles
+        are still sampled in double precision. The y-axis interval is
+        checked on the stored values, and the values deviate from the
+        ones for numpy.float64 by less than 1e-6 times the largest
+        absolute bound of the y-axis interval.
+
+    sampling : str, defaults to "random"
+        The way in which the random values of the first attempt of each
+        curve are drawn, as either "random" for independent draws from
+        the curve's random stream, "sobol" for a scrambled Sobol sequence
+        over the curve indices, or "lhs" for a Latin hypercube over the
+        requested curves. The quasi-random point of a curve sets its
+        starting point, number of change points, initial direction,
+        launch angle, change points and force variates, which covers the
+        constraint space more evenly than independent draws. Attempts
+        that are retried after leaving the y-axis interval use the
+        curve's random stream, i.e. independent draws from the same
+        constrained distribution. The Sobol points follow the curve
+        indices, so that slices with 'first_curve' are reproducible,
+        while the Latin hypercube depends on the number of curves. Both
+        require SciPy, without which the sampling falls back to "random".
+
+    accept : callable, defaults to None
+        The acceptance test of the user for constraints beyond the y-axis
+        intervals, which is called as accept(x, Y) for each new batch of
+        curves, see surgebinder(). The curves of a batch can belong to
+        different groups.
+
+    basis : Basis, defaults to None
+        The basis onto which the curves are projected, batch by batch
+        as they are generated, so that only the coefficients of the
+        curves are kept, or None for returning the curves.
+
+    batch_size : int >= 1, defaults to 1000
+        The number of curves per batch for the projection.
 
     Returns:
     --------
-    curves: list
-        The generated curves in a list, with one list element per curve.
-        Each list elemenet contains two rows, the first for the x-axis
-        measurement points and the second for the y-axis measurements.
+    x_values : numpy.ndarray
+        The x-axis measurement points that are shared by all curves.
+
+    curves : numpy.ndarray
+        The y-axis values of the generated curves of all groups, with
+        one row per curve and one column per x-axis measurement point,
+        or the coefficients of the curves, with one column per basis
+        function, if a basis is given. The curves of each group are
+        stored in consecutive rows.
+
+    groups : numpy.ndarray
+        The index of the parameter group of each curve, i.e. of each row
+        of the parameter 'curves', with one value per curve.
 
     Attributes:
     -----------
     None
     """
-    # Remove curves with trajectories beyond the allowed range
-    remove = []
-    delete_flag = False
-    for i in range(0, len(curves)):
-        if (any(curves[i][:, 1] < y_interval[0])
-            or any(curves[i][:, 1] > y_interval[1])):
-            remove.append(i)
-            delete_flag = True
-    for index in sorted(remove, reverse = True):
-        del curves[index]
-    return curves, delete_flag
+    # Expand the optional per-group parameters to one value per group
+    n_groups = len(y_intervals)
+    if type(n_curves) is int:
+        n_curves = [n_curves] * n_groups
+    if convergence_points == None:
+        convergence_points = [None] * n_groups
+    if change_ratios == None:
+        change_ratios = [None] * n_groups
+    # Check if all per-group parameters have one value per group
+    if ((len(n_curves) != n_groups)
+        or (len(direction_maxima) != n_groups)
+        or (len(convergence_points) != n_groups)
+        or (len(change_ratios) != n_groups)):
+        print('ERROR: n_curves, direction_maxima, convergence_points, ' +
+              'change_ratios: Must have the same length as y_intervals')
+        sys.exit()
+    # Check if the engine is one of the available batch kernels
+    if engine not in ["vectorized", "numba"]:
+        print('ERROR: engine: Must be either "vectorized" or "numba"')
+        sys.exit()
+    # Check if the basis and the batch size of the projection are valid
+    if (basis is not None) and (type(basis) is not Basis):
+        print('ERROR: basis: Must be either None or a Basis')
+        sys.exit()
+    if (type(batch_size) is not int) or (batch_size < 1):
+        print('ERROR: batch_size: Must be an integer >= 1')
+        sys.exit()
+    # Check if the provided parameter inputs of each group are valid
+    for group in range(0, n_groups):
+        check(n_curves = n_curves[group],
+              x_interval = x_interval,
+              y_interval = y_intervals[group],
+              n_measure = n_measure,
+              direction_maximum = direction_maxima[group],
+              convergence_point = convergence_points[group],
+              log_scale = log_scale,
+              random_launch = random_launch,
+              right_convergence = right_convergence,
+              change_range = change_range,
+              change_spacing = change_spacing,
+              change_ratio = change_ratios[group],
+              start_force = start_force,
+              seed = seed,
+              first_curve = first_curve,
+              engine = engine,
+              dense = False,
+              dtype = dtype,
+              backend = "serial",
+              n_workers = None,
+              sampling = sampling,
+              antithetic = False,
+              accept = accept,
+              anchors = None,
+              time_budget = None)
+    # Fall back to the NumPy batch engine if Numba isn't available
+    if (engine == "numba") and (njit is None):
+        print("Numba isn't installed, using the vectorized engine instead\n")
+        engine = "vectorized"
+    # Fall back to independent draws if SciPy isn't available
+    if (sampling != "random") and (qmc is None):
+        print("SciPy isn't installed, using random sampling instead\n")
+        sampling = "random"
+    print("Generating random curves ...\n")
+    # Set up the measurement points and the change point settings
+    preparation_output = preparation(x_interval = x_interval,
+                                     n_measure = n_measure,
+                                     log_scale = log_scale,
+                                     change_range = change_range,
+                                     change_spacing = change_spacing,
+                                     start_force = start_force)
+    steps, offsets, step_size = preparation_output[0:3]
+    change_range, change_spacing = preparation_output[3:5]
+    flat_state, flat_value, x_values = preparation_output[5:8]
+    # Assign the consecutive curve indices to their groups
+    groups = np.repeat(np.arange(0, n_groups), n_curves)
+    total = len(groups)
+    # Set 10%-based printout milestones for progress updates
+    print_points, perc, progress_update = milestones(n_curves = total)
+    # Derive the key shared by the random streams of all curves
+    key = keychain(seed = seed)
+    # Draw the quasi-random points of the first attempts if requested
+    points = quasirandom(key = key,
+                         n_curves = total,
+                         first_curve = first_curve,
+                         direction_maximum = max(direction_maxima),
+                         n_anchors = 0,
+                         sampling = sampling)
+    # Compute the curves of all groups together in the same batches, and
+    # project each batch as soon as it is computed if a basis is given
+    if basis is None:
+        size = total
+        curves = allocation(shape = (total, n_measure), dtype = dtype)
+    else:
+        size = batch_size
+        coefficients = None
+    attempts = 0
+    for first in range(0, total, size):
+        last = min(total, first + size)
+        if basis is None:
+            rows = curves
+            chunk_points = points
+            report = (print_points, perc, progress_update)
+        else:
+            rows = allocation(shape = (last - first, n_measure), dtype = dtype)
+            if points is None:
+                chunk_points = None
+            else:
+                chunk_points = points[first:last]
+            # Silence the progress printouts of the single batches
+            report = ([], 0, last - first)
+        accelerator_output = accelerator(n_curves = last - first,
+                                         first_curve = first_curve + first,
+                                         key = key,
+                                         groups = groups[first:last],
+                                         x_interval = x_interval,
+                                         y_intervals = y_intervals,
+                                         convergence_points = convergence_points,
+                                         flat_state = flat_state,
+                                         flat_value = flat_value,
+                                         direction_maxima = direction_maxima,
+                                         steps = steps,
+                                         step_size = step_size,
+                                         change_range = change_range,
+                                         change_spacing = change_spacing,
+                                         change_ratios = change_ratios,
+                                         random_launch = random_launch,
+                                         print_points = report[0],
+                                         perc = report[1],
+                                         progress_update = report[2],
+                                         engine = engine,
+                                         points = chunk_points,
+                                         antithetic = False,
+                                         anchors = None,
+                                         accept = accept,
+                                         deadline = None,
+                                         x_values = x_values,
+                                         right_convergence = right_convergence,
+                                         curves = rows)
+        attempts = attempts + accelerator_output[4]
+        if basis is not None:
+            # Project the batch in the orientation returned to the user
+            if right_convergence == True:
+                rows = rows[:, ::-1]
+            projected = basis.project(rows)
+            if coefficients is None:
+                coefficients = np.empty((total, projected.shape[1]))
+            coefficients[first:last] = projected
+            # Print progress updates to inform about remaining time
+            progress_output = progress(done_curves = last,
+                                       curve_request = total,
+                                       print_points = print_points,
+                                       perc = perc,
+                                       progress_update = progress_update)
+            print_points, perc, progress_update = progress_output
+    print("\nAccepted %d of %d curve attempts" % (total, attempts))
+    print("\nPreparing the final output ...")
+    # Return the coefficients, or flip the values for right-side convergence
+    if basis is not None:
+        curves = coefficients
+    elif right_convergence == True:
+        flipped = allocation(shape = curves.shape, dtype = dtype)
+        np.copyto(flipped, curves[:, ::-1])
+        curves = flipped
+    print("\nComplete, returning your curves!")
+    # Return the shared x-axis values, the curves and their groups
+    return x_values.astype(dtype), curves, groups
 
-def generator(n_curves,
-              curve_request,
-              x_interval,
-              y_interval,
-              convergence_flag,
-              convergence_point,
-              flat_state,
-              direction_maximum,
-              steps,
-              step_size,
-              change_range,
-              change_spacing,
-              change_ratio,
-              start_force,
-              flat_value,
-              log_scale,
-              random_launch,
-              print_points,
-              perc,
-              progress_update,
-              done_curves):
+async def asurgebinder(n_curves,
+                       x_interval,
+                       y_interval,
+                       n_measure,
+                       direction_maximum,
+                       convergence_point = None,
+                       log_scale = False,
+                       random_launch = False,
+                       right_convergence = False,
+                       change_range = None,
+                       change_spacing = None,
+                       change_ratio = None,
+                       start_force = None,
+                       seed = None,
+                       first_curve = 0,
+                       engine = "vectorized",
+                       dense = False,
+                       dtype = np.float64,
+                       sampling = "random",
+                       antithetic = False,
+                       accept = None,
+                       anchors = None,
+                       basis = None,
+                       batch_size = 1000,
+                       executor = None):
     """
-    Generate curves, discard them if necessary and give updates.
+    Generate random smooth curves without blocking the event loop.
 
-    This function generates curves based on its input, discards them if
-    they fall outside of the required y-axis interval, and takes care of
-    progress updates to provide the user with a time estimate.
+    This is the asyncio counterpart of the surgebinder() function for
+    applications that run an event loop. The curves are computed in
+    batches of consecutive curve indices in an executor, and control is
+    returned to the event loop between the batches. If the awaiting task
+    is cancelled, no further batches are started. Since every curve
+    index draws from its own random stream, the curves are identical to
+    the ones of a single surgebinder() call with the same seed.
 
     Parameters:
     -----------
-    n_curves : int
+    n_curves : int >= 1
         The number of curves that are to be returned to the user. This
         is simply the value that indicates how many curves are needed
         for whatever goal they'll be used after being generated.
 
-    curve_request : int
-        The initial number of curves that are returned to the user. As
-        this function is called to generate single additional curves if
-        the original curve generation process had to delete some curves,
-        the number of curves requested has to be saved separately.
-
     x_interval : list with two single floats
         The x-axis interval for curves, as [left point, rigth point].
         This range indicates over which x-axis span the measurements
@@ -429,13 +1042,19 @@ def generator(n_curves,
         This range indicates which y-axis window curves shouldn't leave
         under any circumstances to make them still useful to the user.
 
-    convergence_flag : bool
-        The indicator whether a convergence point is required by the
-        user. If true, curves should perfectly convergence in that
-        exact point on either the left or the right side of the x-axis
-        interval, defending on the user-specified preferences.
+    n_measure : int >= 0
+        The number of equally-spaced measurement points on the x-axis
+        for each curve. If the parameter 'log_scale' is set to True, the
+        points will be equally-spaced only if depicted on a logarithmic
+        x-axis. Otherwise, they will be equally-spaced on linear scales.
 
-    convergence_point : list
+    direction_maximum : int >= 0
+        The maximum number of gravity flips, i.e. direction changes.
+        This value determines the upper end of the range from which a
+        number of gravity direction change points is sample uniformly
+        as integers, with 0 as the lower end of the sampling range.
+
+    convergence_point : list with two single floats, defaults to None
         The point in which all curves should perfectly converge, as
         [x-axis value, y-axis value]. Normally, this refers to left-side
         convergence if the parameter 'right_convergence' isn't set to
@@ -443,29 +1062,27 @@ def generator(n_curves,
         points are sampled uniformly random from the y-axis interval,
         but the projectile will still start at a zero launch angle.
 
-    flat_state : bool
-        The indicator whether the parameter start_force is set to a
-        value different from the default, None. If so, the curves
-        shouldn't deviate on the y-axis before the value determined by
-        start_force on the x-axis is reached.
-
-    direction_maximum : int
-        The maximum number of gravity flips, i.e. direction changes.
-        This value determines the upper end of the range from which a
-        number of gravity direction change points is sample uniformly
-        as integers, with 0 as the lower end of the sampling range.
+    log_scale : bool, defaults to False
+        The indicator whether the measurements on the x-axis should be
+        on a logarithmic scale, while retaining the behavior of a code
+        calculation for a linear scale. This means that the steps will
+        be equally-spaced when displayed with a logarithmic x-axis.
 
-    steps : array-like
-        The x-axis measurement points that are equally-spaced when they
-        are depicted on a logarithmic scale. This ensures the same
-        curve behavior for the linear and logarithmic curve generation.
+    random_launch : bool, defaults to False
+        The indicator whether no initial zero launch angle is necessary,
+        i.e. projectiles will start at random angles sampled uniformly
+        between -90 and 90 degrees for each curve separately.
 
-    step_size : float
-        The step size for the x-axis measurement points at which the
-        location of the projectile along the y-axis are to be measured.
-        Like the gravitational force, this value remains constant.
+    right_convergence : bool, defaults to False
+        The indicator whether curves should converge on the right side
+        instead of the left side. After computing the curves, their
+        y-axis measurement vector will be flipped. If 'log_scale' is set
+        to True and a value for 'start_force' is provided, this means
+        that the 'start_force' threshold value for the first deviation
+        from unity on the y-axis is calculated for left-side convergence
+        before being flipped, which should be considered in the inputs.
 
-    change_range : list
+    change_range : list with two single floats, defaults to None
         The x-axis percentiles below and above which no gravity flips
         should take place to avoid extreme bends in the curves due to
         the gravitational magnitude being sampled up to the maximum
@@ -473,7 +1090,7 @@ def generator(n_curves,
         as [lower percentile, upper percentile]. The default behavior if
         the parameter isn't set is to use the 10th and 90th percentile.
 
-    change_spacing : int
+    change_spacing : int > 0, defaults to 1
         The minimum space on the x-axis in full steps that is required
         between gravitational direction changes, with hiher values
         resulting in increased smoothness. The parameter has to be small
@@ -483,30 +1100,3405 @@ def generator(n_curves,
         divided by the minimum x-axis spacing has to be >= the maximum
         number of direction changes so that all possibilities will fit.
 
-    start_force : float
+    change_ratio : float > 0, defaults to None
+        The value by which the gravitational force of the previous
+        partial trajectory of a given curve is multiplied to get the
+        upper limit of the range from which the next partial trajectory
+        of the same curve is sampled. Like 'change_spacing', this
+        parameter is a way to enforce further smoothness.
+
+    start_force : float, defaults to None
         The x-axis point before which no y-axis deviation with regard to
         the projectile's starting point should happen. This is useful
         if a function perturbation should only happen after a certain
         point, which can be specified by setting this parameter.
 
-    flat_value : float
-        The copy of the parameter start_force that is made to make some
-        of the calculations easier, making it a code-related parameter.
+    seed : int >= 0, defaults to None
+        The seed that keys the counter-based random number generators of
+        all curves. Each curve index draws from its own stream, so that
+        the same seed always reproduces the same curve for a given index.
+        If no seed is provided, a fresh seed is drawn from the system
+        once and shared by all batches.
 
-    log_scale : bool
-        The indicator whether the measurements on the x-axis should be
-        on a logarithmic scale, while retaining the behavior of a code
-        calculation for a linear scale. This means that the steps will
-        be equally-spaced when displayed with a logarithmic x-axis.
+    first_curve : int >= 0, defaults to 0
+        The index of the first curve that is to be generated. Together
+        with 'seed', this allows regenerating any slice of a seeded set
+        of curves, e.g. the curves with indices 1000 to 1009, without
+        having to generate all of the curves that come before them.
 
-    random_launch : bool
-        The indicator whether no initial zero launch angle is necessary,
-        i.e. projectiles will start at random angles sampled uniformly
-        between -90 and 90 degrees for each curve separately.
+    engine : str, defaults to "vectorized"
+        The backend that computes the curves, as either "numpy" for the
+        reference implementation that computes one curve at a time,
+        "vectorized" for NumPy array operations across whole batches of
+        curves, or "numba" for a compiled kernel that computes batches
+        in parallel across curves. If Numba isn't installed, the "numba"
+        engine falls back to "vectorized". All engines draw from the
+        same random streams and compute the same curves for each index.
 
-    print_points : list or None
-        The list of numbers of curves generated that mark a milestone
-        in a 10%-spaced progress scheme. This applies when 10 or more
+    dense : bool, defaults to False
+        The indicator whether the curves should be returned as a single
+        array of y-axis values together with the x-axis values that are
+        shared by all curves, instead of a list with one array per curve.
+
+    dtype : numpy.dtype, defaults to numpy.float64
+        The floating-point type of the generated curves, as either
+        numpy.float64 or numpy.float32, see surgebinder().
+
+    sampling : str, defaults to "random"
+        The way in which the random values of the first attempt of each
+        curve are drawn, as either "random", "sobol" or "lhs", see
+        surgebinder(). The Latin hypercube is drawn for each batch.
+
+    antithetic : bool, defaults to False
+        The indicator whether the curves should be generated in mirrored
+        pairs, see surgebinder().
+
+    accept : callable, defaults to None
+        The acceptance test of the user, which is called as accept(x, Y)
+        for each new batch of curves, see surgebinder().
+
+    anchors : list of tuples with three single floats, defaults to None
+        The points through which all curves should pass, as a list of
+        (x-axis value, y-axis value, tolerance) tuples, see surgebinder().
+
+    basis : Basis, defaults to None
+        The basis onto which each batch of curves is projected in the
+        executor as soon as it is computed, so that only the coefficients
+        of the curves are kept, or None for the curves themselves.
+
+    batch_size : int >= 1, defaults to 1000
+        The number of curves that are computed in one batch. Control is
+        returned to the event loop after each batch, and a cancelled run
+        stops once the batch that is currently computed is finished.
+
+    executor : concurrent.futures.Executor, defaults to None
+        The executor in which the batches are computed, with None using
+        the default executor of the running event loop.
+
+    Returns:
+    --------
+    curves: list
+        The generated curves in a list, with one list element per curve.
+        Each list elemenet contains two rows, the first for the x-axis
+        measurement points and the second for the y-axis measurements.
+        If 'dense' is True, a tuple of the x-axis values shared by all
+        curves and an array with one row of y-axis values per curve is
+        returned instead. If a basis is given, only the coefficients of
+        the curves are returned, with one row per curve and one column
+        per basis function.
+
+    Attributes:
+    -----------
+    None
+    """
+    # Copy the batches of curves into one aligned output as they complete
+    values = None
+    position = 0
+    async for x_values, batch in abatches(n_curves = n_curves,
+                                           x_interval = x_interval,
+                                           y_interval = y_interval,
+                                           n_measure = n_measure,
+                                           direction_maximum = direction_maximum,
+                                           convergence_point = convergence_point,
+                                           log_scale = log_scale,
+                                           random_launch = random_launch,
+                                           right_convergence = right_convergence,
+                                           change_range = change_range,
+                                           change_spacing = change_spacing,
+                                           change_ratio = change_ratio,
+                                           start_force = start_force,
+                                           seed = seed,
+                                           first_curve = first_curve,
+                                           engine = engine,
+                                           dtype = dtype,
+                                           sampling = sampling,
+                                           antithetic = antithetic,
+                                           accept = accept,
+                                           anchors = anchors,
+                                           basis = basis,
+                                           batch_size = batch_size,
+                                           executor = executor):
+        if values is None:
+            values = allocation(shape = (n_curves, batch.shape[1]),
+                                dtype = batch.dtype)
+        values[position:position + len(batch)] = batch
+        position = position + len(batch)
+    # Return only the coefficients of the curves for a basis
+    if basis is not None:
+        return values
+    # Return the shared x-axis values and the y-axis values if requested
+    if dense == True:
+        return x_values, values
+    # Combine the shared x-axis values with each curve's y-axis values
+    output = np.empty((len(values), n_measure, 2), dtype = dtype)
+    output[:, :, 0] = x_values
+    output[:, :, 1] = values
+    curves = list(output)
+    # Return the list of random curves as the function output
+    return curves
+
+async def abatches(n_curves,
+                   x_interval,
+                   y_interval,
+                   n_measure,
+                   direction_maximum,
+                   convergence_point = None,
+                   log_scale = False,
+                   random_launch = False,
+                   right_convergence = False,
+                   change_range = None,
+                   change_spacing = None,
+                   change_ratio = None,
+                   start_force = None,
+                   seed = None,
+                   first_curve = 0,
+                   engine = "vectorized",
+                   dtype = np.float64,
+                   sampling = "random",
+                   antithetic = False,
+                   accept = None,
+                   anchors = None,
+                   basis = None,
+                   batch_size = 1000,
+                   executor = None):
+    """
+    Iterate asynchronously over batches of random smooth curves.
+
+    This asynchronous generator computes the requested curves in batches
+    of consecutive curve indices with a serial session in an executor,
+    and yields every batch as soon as it is completed. The progress is
+    printed once for the whole call, not for each batch. Between the
+    batches, the event loop can serve other tasks, and closing the
+    iterator or cancelling the consuming task stops the generation once
+    the batch that is currently computed is finished.
+
+    Parameters:
+    -----------
+    n_curves : int >= 1
+        The number of curves that are to be returned to the user. This
+        is simply the value that indicates how many curves are needed
+        for whatever goal they'll be used after being generated.
+
+    x_interval : list with two single floats
+        The x-axis interval for curves, as [left point, rigth point].
+        This range indicates over which x-axis span the measurements
+        for the curves should be done, i.e. the range of the curves.
+
+    y_interval : list with two single floats
+        The x-axis interval for curves, as [lower point, upper point].
+        This range indicates which y-axis window curves shouldn't leave
+        under any circumstances to make them still useful to the user.
+
+    n_measure : int >= 0
+        The number of equally-spaced measurement points on the x-axis
+        for each curve. If the parameter 'log_scale' is set to True, the
+        points will be equally-spaced only if depicted on a logarithmic
+        x-axis. Otherwise, they will be equally-spaced on linear scales.
+
+    direction_maximum : int >= 0
+        The maximum number of gravity flips, i.e. direction changes.
+        This value determines the upper end of the range from which a
+        number of gravity direction change points is sample uniformly
+        as integers, with 0 as the lower end of the sampling range.
+
+    convergence_point : list with two single floats, defaults to None
+        The point in which all curves should perfectly converge, as
+        [x-axis value, y-axis value]. Normally, this refers to left-side
+        convergence if the parameter 'right_convergence' isn't set to
+        True. If 'convergence_point' isn't set, projectile starting
+        points are sampled uniformly random from the y-axis interval,
+        but the projectile will still start at a zero launch angle.
+
+    log_scale : bool, defaults to False
+        The indicator whether the measurements on the x-axis should be
+        on a logarithmic scale, while retaining the behavior of a code
+        calculation for a linear scale. This means that the steps will
+        be equally-spaced when displayed with a logarithmic x-axis.
+
+    random_launch : bool, defaults to False
+        The indicator whether no initial zero launch angle is necessary,
+        i.e. projectiles will start at random angles sampled uniformly
+        between -90 and 90 degrees for each curve separately.
+
+    right_convergence : bool, defaults to False
+        The indicator whether curves should converge on the right side
+        instead of the left side. After computing the curves, their
+        y-axis measurement vector will be flipped. If 'log_scale' is set
+        to True and a value for 'start_force' is provided, this means
+        that the 'start_force' threshold value for the first deviation
+        from unity on the y-axis is calculated for left-side convergence
+        before being flipped, which should be considered in the inputs.
+
+    change_range : list with two single floats, defaults to None
+        The x-axis percentiles below and above which no gravity flips
+        should take place to avoid extreme bends in the curves due to
+        the gravitational magnitude being sampled up to the maximum
+        allowable force to hit the upper limit of the y-axis interval,
+        as [lower percentile, upper percentile]. The default behavior if
+        the parameter isn't set is to use the 10th and 90th percentile.
+
+    change_spacing : int > 0, defaults to 1
+        The minimum space on the x-axis in full steps that is required
+        between gravitational direction changes, with hiher values
+        resulting in increased smoothness. The parameter has to be small
+        enough that the provided 'n_measure' parameter divided by the
+        the 'change_spacing' parameter is equal to or larger than the
+        'direction_maximum' parameter, i.e. the number of measurements
+        divided by the minimum x-axis spacing has to be >= the maximum
+        number of direction changes so that all possibilities will fit.
+
+    change_ratio : float > 0, defaults to None
+        The value by which the gravitational force of the previous
+        partial trajectory of a given curve is multiplied to get the
+        upper limit of the range from which the next partial trajectory
+        of the same curve is sampled. Like 'change_spacing', this
+        parameter is a way to enforce further smoothness.
+
+    start_force : float, defaults to None
+        The x-axis point before which no y-axis deviation with regard to
+        the projectile's starting point should happen. This is useful
+        if a function perturbation should only happen after a certain
+        point, which can be specified by setting this parameter.
+
+    seed : int >= 0, defaults to None
+        The seed that keys the counter-based random number generators of
+        all curves. Each curve index draws from its own stream, so that
+        the same seed always reproduces the same curve for a given index.
+        If no seed is provided, a fresh seed is drawn from the system
+        once and shared by all batches.
+
+    first_curve : int >= 0, defaults to 0
+        The index of the first curve that is to be generated. Together
+        with 'seed', this allows regenerating any slice of a seeded set
+        of curves, e.g. the curves with indices 1000 to 1009, without
+        having to generate all of the curves that come before them.
+
+    engine : str, defaults to "vectorized"
+        The backend that computes the curves, as either "numpy" for the
+        reference implementation that computes one curve at a time,
+        "vectorized" for NumPy array operations across whole batches of
+        curves, or "numba" for a compiled kernel that computes batches
+        in parallel across curves. If Numba isn't installed, the "numba"
+        engine falls back to "vectorized". All engines draw from the
+        same random streams and compute the same curves for each index.
+
+    dtype : numpy.dtype, defaults to numpy.float64
+        The floating-point type of the generated curves, as either
+        numpy.float64 or numpy.float32, see surgebinder().
+
+    sampling : str, defaults to "random"
+        The way in which the random values of the first attempt of each
+        curve are drawn, as either "random", "sobol" or "lhs", see
+        surgebinder(). The Latin hypercube is drawn for each batch.
+
+    antithetic : bool, defaults to False
+        The indicator whether the curves should be generated in mirrored
+        pairs, see surgebinder().
+
+    accept : callable, defaults to None
+        The acceptance test of the user, which is called as accept(x, Y)
+        for each new batch of curves, see surgebinder().
+
+    anchors : list of tuples with three single floats, defaults to None
+        The points through which all curves should pass, as a list of
+        (x-axis value, y-axis value, tolerance) tuples, see surgebinder().
+
+    basis : Basis, defaults to None
+        The basis onto which each batch of curves is projected in the
+        executor as soon as it is computed, so that only the coefficients
+        of the curves are kept, or None for the curves themselves.
+
+    batch_size : int >= 1, defaults to 1000
+        The number of curves that are computed in one batch. Control is
+        returned to the event loop after each batch, and a cancelled run
+        stops once the batch that is currently computed is finished.
+
+    executor : concurrent.futures.Executor, defaults to None
+        The executor in which the batches are computed, with None using
+        the default executor of the running event loop.
+
+    Returns:
+    --------
+    x_values : numpy.ndarray
+        The x-axis measurement points that are shared by all curves,
+        yielded again with every batch.
+
+    values : numpy.ndarray
+        The y-axis values of the curves of a batch, with one row per
+        curve and one column per x-axis measurement point, or their
+        coefficients, with one column per basis function, if a basis is
+        given, yielded together with the x-axis values for every batch.
+
+    Attributes:
+    -----------
+    None
+    """
+    # Check if all provided parameter inputs are valid
+    check(n_curves = n_curves,
+          x_interval = x_interval,
+          y_interval = y_interval,
+          n_measure = n_measure,
+          direction_maximum = direction_maximum,
+          convergence_point = convergence_point,
+          log_scale = log_scale,
+          random_launch = random_launch,
+          right_convergence = right_convergence,
+          change_range = change_range,
+          change_spacing = change_spacing,
+          change_ratio = change_ratio,
+          start_force = start_force,
+          seed = seed,
+          first_curve = first_curve,
+          engine = engine,
+          dense = False,
+          dtype = dtype,
+          backend = "serial",
+          n_workers = None,
+          sampling = sampling,
+          antithetic = antithetic,
+          accept = accept,
+          anchors = anchors,
+          time_budget = None)
+    # Check if the basis is valid and the batch size a positive integer
+    if (basis is not None) and (type(basis) is not Basis):
+        print('ERROR: basis: Must be either None or a Basis')
+        sys.exit()
+    if (type(batch_size) is not int) or (batch_size < 1):
+        print('ERROR: batch_size: Must be an integer >= 1')
+        sys.exit()
+    # Draw one seed for all batches if no seed is provided
+    if seed is None:
+        seed = int(np.random.SeedSequence().generate_state(1)[0])
+    # Prepare the settings once for a session without its own printouts
+    session = Session(x_interval = x_interval,
+                      y_interval = y_interval,
+                      n_measure = n_measure,
+                      direction_maximum = direction_maximum,
+                      convergence_point = convergence_point,
+                      log_scale = log_scale,
+                      random_launch = random_launch,
+                      right_convergence = right_convergence,
+                      change_range = change_range,
+                      change_spacing = change_spacing,
+                      change_ratio = change_ratio,
+                      start_force = start_force,
+                      seed = seed,
+                      engine = engine,
+                      dtype = dtype,
+                      backend = "serial",
+                      sampling = sampling,
+                      antithetic = antithetic,
+                      accept = accept,
+                      anchors = anchors)
+    print("Generating random curves ...\n")
+    # Set 10%-based printout milestones for the progress of the whole call
+    print_points, perc, progress_update = milestones(n_curves = n_curves)
+    loop = asyncio.get_running_loop()
+    # Compute the batches one after another in the executor
+    for first in range(0, n_curves, batch_size):
+        task = functools.partial(session.generate,
+                                 n_curves = min(batch_size, n_curves - first),
+                                 first_curve = first_curve + first,
+                                 basis = basis,
+                                 batch_size = batch_size)
+        values = await loop.run_in_executor(executor, task)
+        # Print progress updates to inform about remaining time
+        progress_output = progress(done_curves = first + len(values),
+                                   curve_request = n_curves,
+                                   print_points = print_points,
+                                   perc = perc,
+                                   progress_update = progress_update)
+        print_points, perc, progress_update = progress_output
+        yield session.x_values, values
+    print("\nComplete, returning your curves!")
+
+def resample_into(values,
+                  rows,
+                  rng,
+                  x_interval,
+                  y_interval,
+                  direction_maximum,
+                  convergence_point = None,
+                  log_scale = False,
+                  random_launch = False,
+                  right_convergence = False,
+                  change_range = None,
+                  change_spacing = None,
+                  change_ratio = None,
+                  start_force = None,
+                  engine = "vectorized",
+                  accept = None,
+                  anchors = None,
+                  scratch = None):
+    """
+    Replace selected curves of an existing set of curves in place.
+
+    This function regenerates only the selected rows of an array of
+    y-axis values, with the same constraints and the same refill logic
+    as the generation of new curves, and writes the new curves directly
+    into the given array, e.g. for proposals of samplers that replace a
+    random subset of the curves of an ensemble. The number of measurement
+    points and the floating-point type are taken from the array. The new
+    curves draw from the per-curve random streams of a seed that is drawn
+    from the given random number generator, so that the same generator
+    state always leads to the same new curves. The rows are computed in
+    blocks of about 65536 values, so that the temporary memory of the
+    engines stays below a few megabytes regardless of the number of
+    selected rows. Apart from the plans of the curves, the "numba" and
+    "numpy" engines only need the work space for scattered rows.
+
+    Parameters:
+    -----------
+    values : numpy.ndarray
+        The y-axis values of the existing curves, with one row per curve
+        and one column per x-axis measurement point, as returned with
+        'dense' set to True, in either numpy.float64 or numpy.float32.
+
+    rows : numpy.ndarray
+        The rows that are to be replaced, as either a boolean mask with
+        one value per row or an array of distinct row indices.
+
+    rng : numpy.random.Generator
+        The random number generator from which the seed of the new
+        curves is drawn, which is advanced by each call.
+
+    x_interval : list with two single floats
+        The x-axis interval for curves, as [left point, rigth point].
+        This range indicates over which x-axis span the measurements
+        for the curves should be done, i.e. the range of the curves.
+
+    y_interval : list with two single floats
+        The x-axis interval for curves, as [lower point, upper point].
+        This range indicates which y-axis window curves shouldn't leave
+        under any circumstances to make them still useful to the user.
+
+    direction_maximum : int >= 0
+        The maximum number of gravity flips, i.e. direction changes.
+        This value determines the upper end of the range from which a
+        number of gravity direction change points is sample uniformly
+        as integers, with 0 as the lower end of the sampling range.
+
+    convergence_point : list with two single floats, defaults to None
+        The point in which all curves should perfectly converge, as
+        [x-axis value, y-axis value]. Normally, this refers to left-side
+        convergence if the parameter 'right_convergence' isn't set to
+        True. If 'convergence_point' isn't set, projectile starting
+        points are sampled uniformly random from the y-axis interval,
+        but the projectile will still start at a zero launch angle.
+
+    log_scale : bool, defaults to False
+        The indicator whether the measurements on the x-axis should be
+        on a logarithmic scale, while retaining the behavior of a code
+        calculation for a linear scale. This means that the steps will
+        be equally-spaced when displayed with a logarithmic x-axis.
+
+    random_launch : bool, defaults to False
+        The indicator whether no initial zero launch angle is necessary,
+        i.e. projectiles will start at random angles sampled uniformly
+        between -90 and 90 degrees for each curve separately.
+
+    right_convergence : bool, defaults to False
+        The indicator whether curves should converge on the right side
+        instead of the left side. After computing the curves, their
+        y-axis measurement vector will be flipped. If 'log_scale' is set
+        to True and a value for 'start_force' is provided, this means
+        that the 'start_force' threshold value for the first deviation
+        from unity on the y-axis is calculated for left-side convergence
+        before being flipped, which should be considered in the inputs.
+
+    change_range : list with two single floats, defaults to None
+        The x-axis percentiles below and above which no gravity flips
+        should take place to avoid extreme bends in the curves due to
+        the gravitational magnitude being sampled up to the maximum
+        allowable force to hit the upper limit of the y-axis interval,
+        as [lower percentile, upper percentile]. The default behavior if
+        the parameter isn't set is to use the 10th and 90th percentile.
+
+    change_spacing : int > 0, defaults to 1
+        The minimum space on the x-axis in full steps that is required
+        between gravitational direction changes, with hiher values
+        resulting in increased smoothness. The parameter has to be small
+        enough that the provided 'n_measure' parameter divided by the
+        the 'change_spacing' parameter is equal to or larger than the
+        'direction_maximum' parameter, i.e. the number of measurements
+        divided by the minimum x-axis spacing has to be >= the maximum
+        number of direction changes so that all possibilities will fit.
+
+    change_ratio : float > 0, defaults to None
+        The value by which the gravitational force of the previous
+        partial trajectory of a given curve is multiplied to get the
+        upper limit of the range from which the next partial trajectory
+        of the same curve is sampled. Like 'change_spacing', this
+        parameter is a way to enforce further smoothness.
+
+    start_force : float, defaults to None
+        The x-axis point before which no y-axis deviation with regard to
+        the projectile's starting point should happen. This is useful
+        if a function perturbation should only happen after a certain
+        point, which can be specified by setting this parameter.
+
+    engine : str, defaults to "vectorized"
+        The backend that computes the curves, as either "numpy",
+        "vectorized" or "numba", see surgebinder().
+
+    accept : callable, defaults to None
+        The acceptance test of the user, which is called as accept(x, Y)
+        for each new batch of curves, see surgebinder().
+
+    anchors : list of tuples with three single floats, defaults to None
+        The points through which all curves should pass, as a list of
+        (x-axis value, y-axis value, tolerance) tuples, see surgebinder().
+
+    scratch : numpy.ndarray, defaults to None
+        The work space for the new curves if the selected rows don't form
+        a single range, with at least as many rows as selected rows or as
+        rows of a block, i.e. 65536 // n_measure, and the shape and type
+        of 'values' otherwise. Passing the same work space to repeated
+        calls avoids its allocation.
+
+    Returns:
+    --------
+    attempts : int
+        The total number of curve attempts, including the ones that had
+        to be abandoned for leaving the y-axis interval.
+
+    Attributes:
+    -----------
+    None
+    """
+    # Check if the curves are a two-dimensional array of floats
+    if ((type(values) is not np.ndarray) or (values.ndim != 2)
+        or (values.dtype not in [np.float32, np.float64])):
+        print('ERROR: values: Must be a two-dimensional numpy.ndarray ' +
+              'of numpy.float64 or numpy.float32 values')
+        sys.exit()
+    n_curves, n_measure = values.shape
+    # Convert the selected rows into an array of row indices
+    rows = np.asarray(rows)
+    if rows.dtype == bool:
+        if rows.shape != (n_curves,):
+            print('ERROR: rows: Must have one value per row of values ' +
+                  'if it is a boolean mask')
+            sys.exit()
+        rows = np.flatnonzero(rows)
+    elif ((rows.ndim != 1) or (rows.dtype.kind not in "iu")
+          or np.any(rows < -n_curves) or np.any(rows >= n_curves)
+          or (len(np.unique(rows % max(n_curves, 1))) != len(rows))):
+        print('ERROR: rows: Must be either a boolean mask or an array ' +
+              'of distinct row indices of values')
+        sys.exit()
+    rows = rows % max(n_curves, 1)
+    if len(rows) == 0:
+        return 0
+    # Draw the seed of the new curves from the given generator
+    if type(rng) is not np.random.Generator:
+        print('ERROR: rng: Must be a numpy.random.Generator')
+        sys.exit()
+    seed = int(rng.integers(0, 2**63))
+    # Check if all provided parameter inputs are valid
+    check(n_curves = len(rows),
+          x_interval = x_interval,
+          y_interval = y_interval,
+          n_measure = n_measure,
+          direction_maximum = direction_maximum,
+          convergence_point = convergence_point,
+          log_scale = log_scale,
+          random_launch = random_launch,
+          right_convergence = right_convergence,
+          change_range = change_range,
+          change_spacing = change_spacing,
+          change_ratio = change_ratio,
+          start_force = start_force,
+          seed = seed,
+          first_curve = 0,
+          engine = engine,
+          dense = True,
+          dtype = values.dtype,
+          backend = "serial",
+          n_workers = None,
+          sampling = "random",
+          antithetic = False,
+          accept = accept,
+          anchors = anchors,
+          time_budget = None)
+    # Fall back to the NumPy batch engine if Numba isn't available
+    if (engine == "numba") and (njit is None):
+        engine = "vectorized"
+    # Set up the measurement points and the change point settings
+    preparation_output = preparation(x_interval = x_interval,
+                                     n_measure = n_measure,
+                                     log_scale = log_scale,
+                                     change_range = change_range,
+                                     change_spacing = change_spacing,
+                                     start_force = start_force)
+    steps, offsets, step_size = preparation_output[0:3]
+    change_range, change_spacing = preparation_output[3:5]
+    flat_state, flat_value, x_values = preparation_output[5:8]
+    # Place the anchor points onto the measurement points
+    anchors = anchorage(anchors = anchors,
+                        x_interval = x_interval,
+                        x_values = x_values,
+                        n_measure = n_measure,
+                        flat_state = flat_state,
+                        flat_value = flat_value,
+                        right_convergence = right_convergence)
+    # Compute the rows in blocks of a bounded number of values, so that the
+    # temporaries of the engines don't grow with the number of rows
+    block = max(1, 2 ** 16 // n_measure)
+    direct = np.all(np.diff(rows) == 1)
+    if direct == False:
+        if scratch is None:
+            scratch = np.empty((min(block, len(rows)), n_measure),
+                               dtype = values.dtype)
+        elif ((type(scratch) is not np.ndarray) or (scratch.ndim != 2)
+              or (len(scratch) < min(block, len(rows)))
+              or (scratch.shape[1] != n_measure)
+              or (scratch.dtype != values.dtype)):
+            print('ERROR: scratch: Must be None or a numpy.ndarray with ' +
+                  'at least one row per selected row, or per row of a ' +
+                  'block, and the shape and type of values otherwise')
+            sys.exit()
+    key = keychain(seed = seed)
+    attempts = 0
+    for first in range(0, len(rows), block):
+        selected = rows[first:first + block]
+        # Write a single range of rows directly into the given curves
+        if direct == True:
+            curves = values[selected[0]:selected[-1] + 1]
+        else:
+            curves = scratch[:len(selected)]
+        # The rows are stored before a right-side convergence flip
+        if right_convergence == True:
+            buffer = curves[:, ::-1]
+        else:
+            buffer = curves
+        dispatcher_output = dispatcher(n_curves = len(selected),
+                                       first_curve = first,
+                                       key = key,
+                                       x_interval = x_interval,
+                                       y_interval = y_interval,
+                                       convergence_point = convergence_point,
+                                       flat_state = flat_state,
+                                       flat_value = flat_value,
+                                       direction_maximum = direction_maximum,
+                                       steps = steps,
+                                       offsets = offsets,
+                                       step_size = step_size,
+                                       change_range = change_range,
+                                       change_spacing = change_spacing,
+                                       change_ratio = change_ratio,
+                                       random_launch = random_launch,
+                                       print_points = [],
+                                       perc = 0,
+                                       progress_update = len(selected),
+                                       engine = engine,
+                                       dtype = values.dtype,
+                                       points = None,
+                                       antithetic = False,
+                                       anchors = anchors,
+                                       accept = accept,
+                                       deadline = None,
+                                       x_values = x_values,
+                                       right_convergence = right_convergence,
+                                       curves = buffer)
+        attempts = attempts + dispatcher_output[4]
+        # Scatter the new curves from the work space into the selected rows
+        if direct == False:
+            values[selected] = curves
+    return attempts
+
+class Session:
+    """
+    Keep a warm pool of workers for many small requests of curves.
+
+    A session validates the parameters and prepares the measurement
+    points and settings of the curves once, starts its pool of workers
+    once and compiles the kernels of each worker before the first
+    request. Repeated calls of generate() then only dispatch the rows of
+    curves to the warm workers, which is suited to drivers that request
+    small batches of curves many thousands of times, e.g. within Markov
+    chain Monte Carlo. The requests continue the curve indices of the
+    previous ones, and since every curve index draws from its own random
+    stream, the curves are identical to the ones of a single surgebinder()
+    call with the same seed, regardless of the number of workers.
+
+    Parameters:
+    -----------
+    x_interval : list with two single floats
+        The x-axis interval for curves, as [left point, rigth point].
+        This range indicates over which x-axis span the measurements
+        for the curves should be done, i.e. the range of the curves.
+
+    y_interval : list with two single floats
+        The x-axis interval for curves, as [lower point, upper point].
+        This range indicates which y-axis window curves shouldn't leave
+        under any circumstances to make them still useful to the user.
+
+    n_measure : int >= 0
+        The number of equally-spaced measurement points on the x-axis
+        for each curve. If the parameter 'log_scale' is set to True, the
+        points will be equally-spaced only if depicted on a logarithmic
+        x-axis. Otherwise, they will be equally-spaced on linear scales.
+
+    direction_maximum : int >= 0
+        The maximum number of gravity flips, i.e. direction changes.
+        This value determines the upper end of the range from which a
+        number of gravity direction change points is sample uniformly
+        as integers, with 0 as the lower end of the sampling range.
+
+    convergence_point : list with two single floats, defaults to None
+        The point in which all curves should perfectly converge, as
+        [x-axis value, y-axis value]. Normally, this refers to left-side
+        convergence if the parameter 'right_convergence' isn't set to
+        True. If 'convergence_point' isn't set, projectile starting
+        points are sampled uniformly random from the y-axis interval,
+        but the projectile will still start at a zero launch angle.
+
+    log_scale : bool, defaults to False
+        The indicator whether the measurements on the x-axis should be
+        on a logarithmic scale, while retaining the behavior of a code
+        calculation for a linear scale. This means that the steps will
+        be equally-spaced when displayed with a logarithmic x-axis.
+
+    random_launch : bool, defaults to False
+        The indicator whether no initial zero launch angle is necessary,
+        i.e. projectiles will start at random angles sampled uniformly
+        between -90 and 90 degrees for each curve separately.
+
+    right_convergence : bool, defaults to False
+        The indicator whether curves should converge on the right side
+        instead of the left side. After computing the curves, their
+        y-axis measurement vector will be flipped. If 'log_scale' is set
+        to True and a value for 'start_force' is provided, this means
+        that the 'start_force' threshold value for the first deviation
+        from unity on the y-axis is calculated for left-side convergence
+        before being flipped, which should be considered in the inputs.
+
+    change_range : list with two single floats, defaults to None
+        The x-axis percentiles below and above which no gravity flips
+        should take place to avoid extreme bends in the curves due to
+        the gravitational magnitude being sampled up to the maximum
+        allowable force to hit the upper limit of the y-axis interval,
+        as [lower percentile, upper percentile]. The default behavior if
+        the parameter isn't set is to use the 10th and 90th percentile.
+
+    change_spacing : int > 0, defaults to 1
+        The minimum space on the x-axis in full steps that is required
+        between gravitational direction changes, with hiher values
+        resulting in increased smoothness. The parameter has to be small
+        enough that the provided 'n_measure' parameter divided by the
+        the 'change_spacing' parameter is equal to or larger than the
+        'direction_maximum' parameter, i.e. the number of measurements
+        divided by the minimum x-axis spacing has to be >= the maximum
+        number of direction changes so that all possibilities will fit.
+
+    change_ratio : float > 0, defaults to None
+        The value by which the gravitational force of the previous
+        partial trajectory of a given curve is multiplied to get the
+        upper limit of the range from which the next partial trajectory
+        of the same curve is sampled. Like 'change_spacing', this
+        parameter is a way to enforce further smoothness.
+
+    start_force : float, defaults to None
+        The x-axis point before which no y-axis deviation with regard to
+        the projectile's starting point should happen. This is useful
+        if a function perturbation should only happen after a certain
+        point, which can be specified by setting this parameter.
+
+    seed : int >= 0, defaults to None
+        The seed that keys the counter-based random number generators of
+        all curves. If no seed is provided, a fresh seed is drawn from the
+        system once and shared by all requests of the session.
+
+    engine : str, defaults to "vectorized"
+        The backend that computes the curves, as either "numpy",
+        "vectorized" or "numba", see surgebinder().
+
+    dtype : numpy.dtype, defaults to numpy.float64
+        The floating-point type of the generated curves, as either
+        numpy.float64 or numpy.float32, see surgebinder().
+
+    backend : str, defaults to "threads"
+        The way in which the work is spread over the workers, as either
+        "serial" for computing all curves in the calling thread, or
+        "threads" or "processes" for a pool that is kept for the whole
+        session, see surgebinder(). With the "numba" engine, the threads
+        run a sequential build of the kernel, as the parallel build can't
+        be entered by several threads at once.
+
+    n_workers : int >= 1, defaults to None
+        The number of threads or processes of the pool, with None using
+        the number of processors of the machine.
+
+    sampling : str, defaults to "random"
+        The way in which the random values of the first attempt of each
+        curve are drawn, as either "random", "sobol" or "lhs", see
+        surgebinder(). The Latin hypercube is drawn for each request.
+
+    antithetic : bool, defaults to False
+        The indicator whether the curves should be generated in mirrored
+        pairs, see surgebinder().
+
+    accept : callable, defaults to None
+        The acceptance test of the user, which is called as accept(x, Y)
+        for each new batch of curves, see surgebinder().
+
+    anchors : list of tuples with three single floats, defaults to None
+        The points through which all curves should pass, as a list of
+        (x-axis value, y-axis value, tolerance) tuples, see surgebinder().
+
+    Attributes:
+    -----------
+    x_values : numpy.ndarray
+        The x-axis measurement points that are shared by all curves.
+
+    position : int
+        The index of the next curve, which is advanced by every request.
+    """
+    def __init__(self,
+                 x_interval,
+                 y_interval,
+                 n_measure,
+                 direction_maximum,
+                 convergence_point = None,
+                 log_scale = False,
+                 random_launch = False,
+                 right_convergence = False,
+                 change_range = None,
+                 change_spacing = None,
+                 change_ratio = None,
+                 start_force = None,
+                 seed = None,
+                 engine = "vectorized",
+                 dtype = np.float64,
+                 backend = "threads",
+                 n_workers = None,
+                 sampling = "random",
+                 antithetic = False,
+                 accept = None,
+                 anchors = None):
+        # Check if all provided parameter inputs are valid
+        check(n_curves = 1,
+              x_interval = x_interval,
+              y_interval = y_interval,
+              n_measure = n_measure,
+              direction_maximum = direction_maximum,
+              convergence_point = convergence_point,
+              log_scale = log_scale,
+              random_launch = random_launch,
+              right_convergence = right_convergence,
+              change_range = change_range,
+              change_spacing = change_spacing,
+              change_ratio = change_ratio,
+              start_force = start_force,
+              seed = seed,
+              first_curve = 0,
+              engine = engine,
+              dense = True,
+              dtype = dtype,
+              backend = backend,
+              n_workers = n_workers,
+              sampling = sampling,
+              antithetic = antithetic,
+              accept = accept,
+              anchors = anchors,
+              time_budget = None)
+        # Fall back to the NumPy batch engine if Numba isn't available
+        if (engine == "numba") and (njit is None):
+            print("Numba isn't installed, using the vectorized engine instead\n")
+            engine = "vectorized"
+        # Fall back to independent draws if SciPy isn't available
+        if (sampling != "random") and (qmc is None):
+            print("SciPy isn't installed, using random sampling instead\n")
+            sampling = "random"
+        # Draw one seed for all requests if no seed is provided
+        if seed is None:
+            seed = int(np.random.SeedSequence().generate_state(1)[0])
+        if n_workers == None:
+            n_workers = os.cpu_count()
+        # Set up the measurement points and the change point settings
+        preparation_output = preparation(x_interval = x_interval,
+                                         n_measure = n_measure,
+                                         log_scale = log_scale,
+                                         change_range = change_range,
+                                         change_spacing = change_spacing,
+                                         start_force = start_force)
+        steps, offsets, step_size = preparation_output[0:3]
+        change_range, change_spacing = preparation_output[3:5]
+        flat_state, flat_value, x_values = preparation_output[5:8]
+        # Place the anchor points onto the measurement points
+        anchors = anchorage(anchors = anchors,
+                            x_interval = x_interval,
+                            x_values = x_values,
+                            n_measure = n_measure,
+                            flat_state = flat_state,
+                            flat_value = flat_value,
+                            right_convergence = right_convergence)
+        self.key = keychain(seed = seed)
+        # Bind the settings that are shared by all rows of curves
+        self.task = functools.partial(dispatcher,
+                                      key = self.key,
+                                      x_interval = x_interval,
+                                      y_interval = y_interval,
+                                      convergence_point = convergence_point,
+                                      flat_state = flat_state,
+                                      flat_value = flat_value,
+                                      direction_maximum = direction_maximum,
+                                      steps = steps,
+                                      offsets = offsets,
+                                      step_size = step_size,
+                                      change_range = change_range,
+                                      change_spacing = change_spacing,
+                                      change_ratio = change_ratio,
+                                      random_launch = random_launch,
+                                      engine = engine,
+                                      dtype = dtype,
+                                      antithetic = antithetic,
+                                      anchors = anchors,
+                                      accept = accept,
+                                      deadline = None,
+                                      x_values = x_values,
+                                      right_convergence = right_convergence)
+        self.y_interval = y_interval
+        self.n_measure = n_measure
+        self.direction_maximum = direction_maximum
+        self.right_convergence = right_convergence
+        self.dtype = dtype
+        self.backend = backend
+        self.n_workers = n_workers
+        self.sampling = sampling
+        self.antithetic = antithetic
+        self.n_anchors = 0 if anchors is None else len(anchors)
+        self.x_values = x_values.astype(dtype)
+        self.position = 0
+        self.pool = None
+        # Count the requests and the time the workers spend on them
+        self.n_requests = 0
+        self.n_curves = 0
+        self.n_attempts = 0
+        self.busy = 0.0
+        self.opened = time.perf_counter()
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self,
+                 exc_type,
+                 exc_value,
+                 traceback):
+        self.close()
+        return False
+
+    def open(self):
+        """
+        Start the pool of workers and compile their kernels.
+
+        Parameters:
+        -----------
+        None
+
+        Returns:
+        --------
+        None
+
+        Attributes:
+        -----------
+        None
+        """
+        if self.pool is not None:
+            self.opened = time.perf_counter()
+            return
+        # Compile the kernel in this process with a curve that doesn't count
+        if self.backend == "serial":
+            delegation(task = self.task,
+                       n_curves = 1,
+                       first_curve = 0,
+                       points = None,
+                       curves = None)
+            self.opened = time.perf_counter()
+            return
+        if self.backend == "threads":
+            self.pool = concurrent.futures.ThreadPoolExecutor(self.n_workers)
+        else:
+            # Start fresh processes, as forking breaks compiled threads
+            context = multiprocessing.get_context("spawn")
+            self.pool = concurrent.futures.ProcessPoolExecutor(self.n_workers,
+                                                               mp_context = context,
+                                                               initializer = installation,
+                                                               initargs = (self.task,))
+        # Warm up each worker with a curve that doesn't count as a request
+        futures = [self.pool.submit(delegation,
+                                    task = self.task if self.backend == "threads" else None,
+                                    n_curves = 1,
+                                    first_curve = 0,
+                                    points = None,
+                                    curves = None)
+                   for _ in range(self.n_workers)]
+        concurrent.futures.wait(futures)
+        self.opened = time.perf_counter()
+
+    def close(self):
+        """
+        Shut down the pool of workers.
+
+        Parameters:
+        -----------
+        None
+
+        Returns:
+        --------
+        None
+
+        Attributes:
+        -----------
+        None
+        """
+        if self.pool is not None:
+            self.pool.shutdown(wait = True)
+            self.pool = None
+
+    def generate(self,
+                 n_curves,
+                 first_curve = None,
+                 basis = None,
+                 batch_size = 1000):
+        """
+        Generate the next curves with the warm workers of the session.
+
+        Parameters:
+        -----------
+        n_curves : int >= 1
+            The number of curves that are to be returned to the user.
+
+        first_curve : int >= 0, defaults to None
+            The index of the first curve that is to be generated, with
+            None continuing after the curves of the previous request.
+
+        basis : Basis, defaults to None
+            The basis onto which the curves are projected, batch by batch
+            as they are generated, so that only the coefficients of the
+            curves are kept, or None for returning the curves.
+
+        batch_size : int >= 1, defaults to 1000
+            The number of curves per batch for the projection.
+
+        Returns:
+        --------
+        values : numpy.ndarray
+            The y-axis values of the curves, with one row per curve and
+            one column per x-axis measurement point of 'x_values', or the
+            coefficients of the curves, with one column per basis function,
+            if a basis is given.
+
+        Attributes:
+        -----------
+        None
+        """
+        # Check if the number and first index of the curves are valid
+        if (type(n_curves) is not int) or (n_curves < 1):
+            print('ERROR: n_curves: Must be an integer >= 1')
+            sys.exit()
+        if first_curve is None:
+            first_curve = self.position
+        elif (type(first_curve) is not int) or (first_curve < 0):
+            print('ERROR: first_curve: Must be either None or an integer >= 0')
+            sys.exit()
+        # Project the curves onto the basis batch by batch if requested
+        if basis is not None:
+            if (type(batch_size) is not int) or (batch_size < 1):
+                print('ERROR: batch_size: Must be an integer >= 1')
+                sys.exit()
+            self.n_requests = self.n_requests + 1
+            coefficients = None
+            for first in range(0, n_curves, batch_size):
+                values = self.computation(n_curves = min(batch_size,
+                                                         n_curves - first),
+                                          first_curve = first_curve + first)
+                batch = basis.project(values)
+                if coefficients is None:
+                    coefficients = np.empty((n_curves, batch.shape[1]))
+                coefficients[first:first + len(batch)] = batch
+            return coefficients
+        self.n_requests = self.n_requests + 1
+        return self.computation(n_curves = n_curves,
+                                first_curve = first_curve)
+
+    def computation(self,
+                    n_curves,
+                    first_curve):
+        """
+        Compute a range of curves, which isn't counted as a request.
+
+        This is the shared work of generate(), batches() and fit(), which
+        count a request once for each call of the user.
+
+        Parameters:
+        -----------
+        n_curves : int >= 1
+            The number of curves that are to be returned.
+
+        first_curve : int >= 0
+            The index of the first curve that is to be generated.
+
+        Returns:
+        --------
+        values : numpy.ndarray
+            The y-axis values of the curves, with one row per curve and
+            one column per x-axis measurement point of 'x_values'.
+
+        Attributes:
+        -----------
+        None
+        """
+        # Compute one plan per pair of mirrored curves if requested
+        if self.antithetic == True:
+            first_plan = first_curve // 2
+            n_plans = (first_curve + n_curves + 1) // 2 - first_plan
+            # Align the first returned row, which is a mirror for odd indices
+            pairs = allocation(shape = (2 * n_plans, self.n_measure),
+                               dtype = self.dtype,
+                               lead = ((first_curve % 2) * self.n_measure
+                                       * np.dtype(self.dtype).itemsize))
+            values = pairs[0::2]
+        else:
+            first_plan = first_curve
+            n_plans = n_curves
+            values = allocation(shape = (n_curves, self.n_measure),
+                                dtype = self.dtype)
+        # Draw the quasi-random points of the first attempts if requested
+        points = quasirandom(key = self.key,
+                             n_curves = n_plans,
+                             first_curve = first_plan,
+                             direction_maximum = self.direction_maximum,
+                             n_anchors = self.n_anchors,
+                             sampling = self.sampling)
+        if self.pool is None:
+            _, attempts, seconds = delegation(task = self.task,
+                                              n_curves = n_plans,
+                                              first_curve = first_plan,
+                                              points = points,
+                                              curves = values)
+            self.busy = self.busy + seconds
+        else:
+            # Split the rows only if each worker gets a batch of rows
+            n_ranges = min(self.n_workers, max(1, n_plans // 32))
+            ranges = np.array_split(np.arange(0, n_plans), n_ranges)
+            futures = {}
+            for rows in ranges:
+                first, last = rows[0], rows[-1] + 1
+                # Let threads write directly into the shared output rows
+                if self.backend == "threads":
+                    task = self.task
+                    buffer = values[first:last]
+                else:
+                    task = None
+                    buffer = None
+                if points is None:
+                    chunk_points = None
+                else:
+                    chunk_points = points[first:last]
+                future = self.pool.submit(delegation,
+                                          task = task,
+                                          n_curves = last - first,
+                                          first_curve = first_plan + first,
+                                          points = chunk_points,
+                                          curves = buffer)
+                futures[future] = (first, last)
+            attempts = 0
+            for future in concurrent.futures.as_completed(futures):
+                first, last = futures[future]
+                rows, range_attempts, seconds = future.result()
+                # Copy the rows computed by other processes into the output
+                if self.backend == "processes":
+                    values[first:last] = rows
+                attempts = attempts + range_attempts
+                self.busy = self.busy + seconds
+        # Mirror each curve about its starting point into the next row
+        if self.antithetic == True:
+            mirrors = pairs[1::2]
+            np.subtract(2 * values[:, 0:1], values, out = mirrors)
+            # Guard the mirrored curves against rounding at the bounds
+            np.clip(mirrors, self.y_interval[0], self.y_interval[1], out = mirrors)
+            start = first_curve - 2 * first_plan
+            values = pairs[start:start + n_curves]
+        # If right-side convergence is requested, flip the values
+        if self.right_convergence == True:
+            flipped = allocation(shape = values.shape, dtype = self.dtype)
+            np.copyto(flipped, values[:, ::-1])
+            values = flipped
+        self.position = first_curve + n_curves
+        self.n_curves = self.n_curves + n_curves
+        self.n_attempts = self.n_attempts + attempts
+        return values
+
+    def batches(self,
+                n_curves,
+                batch_size = 1000,
+                first_curve = None):
+        """
+        Iterate over batches of the next curves of the session.
+
+        Each batch is a new C-contiguous array of y-axis values that is
+        aligned to 64 bytes and isn't reused by the session, so that the
+        consumers can wrap it without copying, e.g. with the DLPack or
+        buffer protocols of other array libraries.
+
+        Parameters:
+        -----------
+        n_curves : int >= 1
+            The number of curves over all batches.
+
+        batch_size : int >= 1, defaults to 1000
+            The number of curves per batch.
+
+        first_curve : int >= 0, defaults to None
+            The index of the first curve, with None continuing after the
+            curves of the previous request.
+
+        Returns:
+        --------
+        values : numpy.ndarray
+            The y-axis values of the curves of a batch, with one row per
+            curve, yielded for every batch.
+
+        Attributes:
+        -----------
+        None
+        """
+        if (type(batch_size) is not int) or (batch_size < 1):
+            print('ERROR: batch_size: Must be an integer >= 1')
+            sys.exit()
+        if first_curve is None:
+            first_curve = self.position
+        self.n_requests = self.n_requests + 1
+        for first in range(0, n_curves, batch_size):
+            yield self.computation(n_curves = min(batch_size, n_curves - first),
+                                   first_curve = first_curve + first)
+
+    def fit(self,
+            basis,
+            n_curves,
+            first_curve = None,
+            batch_size = 1000):
+        """
+        Fit the principal components of a basis to a stream of curves.
+
+        The curves are generated batch by batch and passed to the
+        incremental fit of the basis, without keeping them in memory.
+        The next curve index of the session isn't advanced, so that the
+        fitted curves can be projected afterwards with generate().
+
+        Parameters:
+        -----------
+        basis : Basis
+            The "pca" basis that is to be fitted.
+
+        n_curves : int >= 1
+            The number of curves that are used for the fit.
+
+        first_curve : int >= 0, defaults to None
+            The index of the first curve, with None using the next curve
+            index of the session.
+
+        batch_size : int >= 1, defaults to 1000
+            The number of curves per batch of the incremental fit.
+
+        Returns:
+        --------
+        None
+
+        Attributes:
+        -----------
+        None
+        """
+        if (type(batch_size) is not int) or (batch_size < 1):
+            print('ERROR: batch_size: Must be an integer >= 1')
+            sys.exit()
+        position = self.position
+        if first_curve is None:
+            first_curve = position
+        self.n_requests = self.n_requests + 1
+        for first in range(0, n_curves, batch_size):
+            basis.update(self.computation(n_curves = min(batch_size,
+                                                         n_curves - first),
+                                          first_curve = first_curve + first))
+        self.position = position
+
+    def utilization(self):
+        """
+        Report how busy the workers of the session have been.
+
+        Parameters:
+        -----------
+        None
+
+        Returns:
+        --------
+        report : dict
+            The number of workers, requests, curves and curve attempts
+            since the pool was started, together with the seconds that
+            the session has been open, the seconds that the workers have
+            spent on computing curves, and their ratio to the available
+            worker seconds as the utilization of the pool.
+
+        Attributes:
+        -----------
+        None
+        """
+        n_workers = 1 if self.pool is None else self.n_workers
+        seconds = time.perf_counter() - self.opened
+        report = {"n_workers": n_workers,
+                  "n_requests": self.n_requests,
+                  "n_curves": self.n_curves,
+                  "n_attempts": self.n_attempts,
+                  "seconds": seconds,
+                  "busy": self.busy,
+                  "utilization": self.busy / (n_workers * seconds)}
+        return report
+
+class Basis:
+    """
+    Project curves onto a compact basis and reconstruct them again.
+
+    For the training of emulators, curves can be represented by their
+    coefficients on a basis of a few functions instead of their values
+    at all measurement points. The "chebyshev" and "bspline" bases are
+    fixed by the measurement points, and the coefficients are the least
+    squares fit of the basis functions to each curve. The "pca" basis
+    consists of the mean curve and the leading principal components of
+    the curves that are passed to update(), which can be called once for
+    a pilot batch of curves or repeatedly for an incremental fit over a
+    stream of batches, without keeping the curves in memory.
+
+    Parameters:
+    -----------
+    kind : str
+        The basis, as either "chebyshev" for Chebyshev polynomials over
+        the x-axis interval, "bspline" for cubic B-splines with equally
+        spaced knots, or "pca" for principal components.
+
+    n_coeffs : int >= 1
+        The number of basis functions, and thus of coefficients per
+        curve. B-splines require at least four basis functions.
+
+    x_values : numpy.ndarray
+        The x-axis measurement points that are shared by all curves. For
+        curves on a logarithmic scale, the logarithms of the points give
+        the basis functions the same resolution across the interval.
+
+    Attributes:
+    -----------
+    matrix : numpy.ndarray
+        The basis functions at the measurement points, with one column
+        per basis function, or the principal components for "pca".
+
+    mean : numpy.ndarray
+        The mean curve that is subtracted before the projection, which
+        is zero apart from the "pca" basis.
+    """
+    def __init__(self,
+                 kind,
+                 n_coeffs,
+                 x_values):
+        # Check if the basis settings are valid
+        if kind not in ["chebyshev", "bspline", "pca"]:
+            print('ERROR: kind: Must be either "chebyshev", "bspline" or "pca"')
+            sys.exit()
+        if ((type(n_coeffs) is not int) or (n_coeffs < 1)
+            or (n_coeffs > len(x_values))
+            or ((kind == "bspline") and (n_coeffs < 4))):
+            print('ERROR: n_coeffs: Must be an integer >= 1, or >= 4 for ' +
+                  '"bspline", and at most the number of x-axis values')
+            sys.exit()
+        self.kind = kind
+        self.n_coeffs = n_coeffs
+        x_values = np.asarray(x_values, dtype = np.float64)
+        self.mean = np.zeros(len(x_values))
+        self.n_seen = 0
+        # Map the measurement points onto the interval [-1, 1]
+        scaled = (2 * (x_values - x_values[0])
+                  / (x_values[-1] - x_values[0]) - 1)
+        if kind == "chebyshev":
+            self.matrix = np.polynomial.chebyshev.chebvander(scaled,
+                                                             n_coeffs - 1)
+        elif kind == "bspline":
+            self.matrix = splines(positions = scaled,
+                                  n_coeffs = n_coeffs)
+        else:
+            self.matrix = None
+            self.singular = None
+        # Precompute the least squares projection of the fixed bases
+        if self.matrix is not None:
+            self.projector = np.linalg.pinv(self.matrix)
+
+    def update(self,
+               values):
+        """
+        Fit the principal components to another batch of curves.
+
+        The components are updated incrementally from the singular value
+        decomposition of the previous components, weighted by their
+        singular values, the centered new curves, and the shift of the
+        mean curve, so that the result approximates the principal
+        components of all curves that have been passed so far, with the
+        leading components matching them most closely.
+
+        Parameters:
+        -----------
+        values : numpy.ndarray
+            The y-axis values of the curves, with one row per curve.
+
+        Returns:
+        --------
+        None
+
+        Attributes:
+        -----------
+        None
+        """
+        if self.kind != "pca":
+            print('ERROR: kind: Only the "pca" basis can be fitted')
+            sys.exit()
+        values = np.asarray(values, dtype = np.float64)
+        n_new = len(values)
+        batch_mean = np.mean(values, axis = 0)
+        if self.n_seen == 0:
+            stacked = values - batch_mean
+        else:
+            # Add the shift of the mean curve to the previous components
+            shift = (np.sqrt(self.n_seen * n_new / (self.n_seen + n_new))
+                     * (self.mean - batch_mean))
+            stacked = np.vstack([self.singular[:, None] * self.matrix.T,
+                                 values - batch_mean,
+                                 shift])
+        total = self.n_seen + n_new
+        self.mean = (self.n_seen * self.mean + n_new * batch_mean) / total
+        _, singular, components = np.linalg.svd(stacked,
+                                                full_matrices = False)
+        self.singular = singular[0:self.n_coeffs]
+        self.matrix = components[0:self.n_coeffs].T
+        self.projector = self.matrix.T
+        self.n_seen = total
+
+    def project(self,
+                values):
+        """
+        Compute the coefficients of curves on the basis.
+
+        Parameters:
+        -----------
+        values : numpy.ndarray
+            The y-axis values of the curves, with one row per curve.
+
+        Returns:
+        --------
+        coefficients : numpy.ndarray
+            The coefficients of the curves, with one row per curve and
+            one column per basis function.
+
+        Attributes:
+        -----------
+        None
+        """
+        if self.matrix is None:
+            print('ERROR: basis: The "pca" basis has to be fitted with ' +
+                  'update() before the projection')
+            sys.exit()
+        return (np.asarray(values, dtype = np.float64) - self.mean) @ self.projector.T
+
+    def reconstruct(self,
+                    coefficients):
+        """
+        Compute the curves that correspond to coefficients on the basis.
+
+        Parameters:
+        -----------
+        coefficients : numpy.ndarray
+            The coefficients of the curves, with one row per curve.
+
+        Returns:
+        --------
+        values : numpy.ndarray
+            The y-axis values of the curves, with one row per curve.
+
+        Attributes:
+        -----------
+        None
+        """
+        return coefficients @ self.matrix.T + self.mean
+
+def splines(positions,
+            n_coeffs):
+    """
+    Evaluate cubic B-splines with equally spaced knots at given points.
+
+    Parameters:
+    -----------
+    positions : numpy.ndarray
+        The points in the interval [-1, 1] at which the splines are
+        evaluated.
+
+    n_coeffs : int >= 4
+        The number of B-splines.
+
+    Returns:
+    --------
+    matrix : numpy.ndarray
+        The values of the B-splines, with one row per point and one
+        column per B-spline.
+
+    Attributes:
+    -----------
+    None
+    """
+    degree = 3
+    # Clamp the knots by repeating the ends of the interval
+    inner = np.linspace(-1.0, 1.0, n_coeffs - degree + 1)
+    knots = np.concatenate([np.full(degree, -1.0), inner, np.full(degree, 1.0)])
+    # Start with the indicators of the knot spans, closing the last one
+    matrix = np.zeros((len(positions), len(knots) - 1))
+    spans = np.searchsorted(knots, positions, side = "right") - 1
+    spans = np.minimum(spans, len(knots) - degree - 2)
+    matrix[np.arange(len(positions)), spans] = 1.0
+    # Raise the degree with the recursion of Cox and de Boor
+    for order in range(1, degree + 1):
+        raised = np.zeros((len(positions), len(knots) - 1 - order))
+        for i in range(0, len(knots) - 1 - order):
+            left = knots[i + order] - knots[i]
+            right = knots[i + order + 1] - knots[i + 1]
+            if left > 0:
+                raised[:, i] += (positions - knots[i]) / left * matrix[:, i]
+            if right > 0:
+                raised[:, i] += ((knots[i + order + 1] - positions) / right
+                                 * matrix[:, i + 1])
+        matrix = raised
+    return matrix
+
+# The settings of a session that are installed once in each process
+installed_task = None
+
+def installation(task):
+    """
+    Install the bound settings of a session in a worker process.
+
+    Parameters:
+    -----------
+    task : functools.partial
+        The dispatcher() function with the settings that are shared by
+        all rows of curves of a session.
+
+    Returns:
+    --------
+    None
+
+    Attributes:
+    -----------
+    None
+    """
+    global installed_task
+    installed_task = task
+
+def delegation(task,
+               n_curves,
+               first_curve,
+               points,
+               curves):
+    """
+    Compute a range of rows of curves for a session and time it.
+
+    Parameters:
+    -----------
+    task : functools.partial
+        The dispatcher() function with the settings that are shared by
+        all rows of curves, with None using the settings that have been
+        installed in the worker process.
+
+    n_curves : int
+        The number of curves that are to be computed.
+
+    first_curve : int
+        The index of the first curve, which determines the random streams.
+
+    points : numpy.ndarray
+        The quasi-random points of the first attempts, or None.
+
+    curves : numpy.ndarray
+        The array of rows that is to be filled, or None for a new array.
+
+    Returns:
+    --------
+    curves : numpy.ndarray
+        The array of rows that has been filled with the curves.
+
+    attempts : int
+        The number of curve attempts that were needed for the rows.
+
+    seconds : float
+        The time that was spent on computing the rows.
+
+    Attributes:
+    -----------
+    None
+    """
+    if task is None:
+        task = installed_task
+    start = time.perf_counter()
+    # Silence the progress printouts of the rows
+    dispatcher_output = task(n_curves = n_curves,
+                             first_curve = first_curve,
+                             print_points = [],
+                             perc = 0,
+                             progress_update = n_curves,
+                             points = points,
+                             curves = curves)
+    seconds = time.perf_counter() - start
+    return dispatcher_output[0], dispatcher_output[4], seconds
+
+def serve(socket_path,
+          directory = None,
+          n_sessions = 32):
+    """
+    Answer requests for seeded batches of curves on a local socket.
+
+    This daemon listens on a Unix domain socket and serves independent
+    processes on the same machine that need the same kinds of curves.
+    Each connection sends requests as lines of JSON and receives one line
+    of JSON per request. A request holds a list of batches, each with the
+    keyword arguments of surgebinder() apart from 'dense', 'backend',
+    'n_workers' and 'accept', e.g.
+
+        {"batches": [{"n_curves": 100, "x_interval": [0.0, 5.0],
+                      "y_interval": [-1.0, 3.0], "n_measure": 200,
+                      "direction_maximum": 3, "seed": 42}]}
+
+    The settings of every distinct seeded parameter set are prepared
+    once and kept as an opened session with a compiled kernel for later
+    requests, up to a number of sessions beyond which the least recently
+    used one is closed. Requests without a seed get a fresh seed each,
+    and thus new curves for every request. The curves of a batch are
+    not sent over the socket, but written into a memory-mapped file in
+    the given directory, with the x-axis values in the first row and one
+    curve per further row, and the reply lists the paths of the files.
+    Clients are served concurrently, and batches of different parameter
+    sets are computed side by side, while the batches of the same
+    session wait for each other. The daemon runs until it is interrupted.
+
+    Parameters:
+    -----------
+    socket_path : str
+        The path of the Unix domain socket that the daemon listens on.
+
+    directory : str, defaults to None
+        The directory for the memory-mapped files of the replies, with
+        None using a new directory in shared memory if available, or in
+        the temporary directory of the system otherwise.
+
+    n_sessions : int >= 1, defaults to 32
+        The number of warm sessions that are kept for later requests.
+
+    Returns:
+    --------
+    None
+
+    Attributes:
+    -----------
+    None
+    """
+    # Keep the result files in memory if the system allows it
+    if directory is None:
+        if os.path.isdir("/dev/shm"):
+            directory = tempfile.mkdtemp(prefix = "smurves-", dir = "/dev/shm")
+        else:
+            directory = tempfile.mkdtemp(prefix = "smurves-")
+        created = True
+    else:
+        created = False
+    # Keep the sessions in the order of their last use, with one lock each
+    sessions = {}
+    lock = threading.Lock()
+    building = threading.Lock()
+    counter = itertools.count()
+
+    def production(batch):
+        """
+        Compute a batch of curves into a new memory-mapped file.
+        """
+        batch = dict(batch)
+        n_curves = batch.pop("n_curves", None)
+        first_curve = batch.pop("first_curve", 0)
+        if "dtype" in batch:
+            batch["dtype"] = {"float32": np.float32,
+                              "float64": np.float64}.get(batch["dtype"],
+                                                         batch["dtype"])
+        if (type(n_curves) is not int) or (n_curves < 1):
+            raise ValueError('ERROR: n_curves: Must be an integer >= 1')
+        if (type(first_curve) is not int) or (first_curve < 0):
+            raise ValueError('ERROR: first_curve: Must be an integer >= 0')
+        if len(set(batch) & {"dense", "backend", "n_workers", "accept"}) > 0:
+            raise ValueError('ERROR: batch: dense, backend, n_workers and ' +
+                             'accept are set by the server')
+        # Draw a fresh seed for every request without a seed
+        seeded = batch.get("seed") is not None
+        if seeded == False:
+            batch["seed"] = int(np.random.SeedSequence().generate_state(1)[0])
+        # Take the warm session of the parameter set as the latest one
+        name = json.dumps(batch, sort_keys = True, default = str)
+        with lock:
+            entry = sessions.pop(name, None)
+            if entry is not None:
+                sessions[name] = entry
+        if entry is None:
+            # Capture the printouts of one new session at a time
+            with building:
+                messages = io.StringIO()
+                try:
+                    with contextlib.redirect_stdout(messages):
+                        session = Session(backend = "serial", **batch)
+                        session.open()
+                except SystemExit:
+                    raise ValueError(messages.getvalue().strip())
+                except TypeError as error:
+                    raise ValueError('ERROR: batch: %s' % error)
+            entry = (session, threading.Lock())
+            # Keep only the sessions of seeded requests for reuse
+            if seeded == True:
+                evicted = []
+                with lock:
+                    entry = sessions.setdefault(name, entry)
+                    while len(sessions) > n_sessions:
+                        evicted.append(sessions.pop(next(iter(sessions))))
+                # Close the least recently used sessions beyond the limit
+                for old_session, old_lock in evicted:
+                    with old_lock:
+                        old_session.close()
+        session, session_lock = entry
+        # Compute the batches of different sessions side by side
+        with session_lock:
+            values = session.generate(n_curves = n_curves,
+                                      first_curve = first_curve)
+        # Write the shared x-axis values and the curves into a file
+        path = os.path.join(directory, "batch-%d.npy" % next(counter))
+        output = np.lib.format.open_memmap(path,
+                                           mode = "w+",
+                                           dtype = values.dtype,
+                                           shape = (n_curves + 1,
+                                                    values.shape[1]))
+        output[0] = session.x_values
+        output[1:] = values
+        output.flush()
+        del output
+        return path
+
+    class Handler(socketserver.StreamRequestHandler):
+        """
+        Answer the requests of one client connection line by line.
+        """
+        def handle(self):
+            for line in self.rfile:
+                try:
+                    request = json.loads(line)
+                    paths = [production(batch) for batch in request["batches"]]
+                    reply = {"paths": paths}
+                except (ValueError, KeyError, TypeError) as error:
+                    reply = {"error": str(error)}
+                self.wfile.write((json.dumps(reply) + "\n").encode())
+                self.wfile.flush()
+
+    # Replace the socket of a previous daemon that wasn't shut down
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    server = socketserver.ThreadingUnixStreamServer(socket_path, Handler)
+    server.daemon_threads = True
+    # Shut down cleanly on termination as well as on interruption
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, signal.default_int_handler)
+    print("Serving curves on %s, writing batches to %s" % (socket_path,
+                                                          directory))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        os.unlink(socket_path)
+        # Remove the files that haven't been claimed by the clients
+        if created == True:
+            shutil.rmtree(directory, ignore_errors = True)
+
+class Client:
+    """
+    Request seeded batches of curves from a local curve server.
+
+    The client connects to the Unix domain socket of a daemon started
+    with serve() and maps the files of the replies into memory, without
+    copying the curves. Each file is removed as soon as it is mapped, so
+    that its memory is freed once the returned arrays are released.
+
+    Parameters:
+    -----------
+    socket_path : str
+        The path of the Unix domain socket that the daemon listens on.
+
+    Attributes:
+    -----------
+    connection : socket.socket
+        The connection to the daemon, which is kept for all requests.
+    """
+    def __init__(self,
+                 socket_path):
+        self.connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.connection.connect(socket_path)
+        self.stream = self.connection.makefile("rwb")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self,
+                 exc_type,
+                 exc_value,
+                 traceback):
+        self.close()
+        return False
+
+    def close(self):
+        """
+        Close the connection to the daemon.
+
+        Parameters:
+        -----------
+        None
+
+        Returns:
+        --------
+        None
+
+        Attributes:
+        -----------
+        None
+        """
+        self.stream.close()
+        self.connection.close()
+
+    def batches(self,
+                batches):
+        """
+        Request several batches of curves with a single message.
+
+        Parameters:
+        -----------
+        batches : list of dicts
+            The keyword arguments of surgebinder() for each batch, apart
+            from 'dense', 'backend', 'n_workers' and 'accept'.
+
+        Returns:
+        --------
+        results : list of tuples
+            The x-axis values and the array of y-axis values, with one
+            row per curve, for each batch, as read-only memory maps.
+
+        Attributes:
+        -----------
+        None
+        """
+        self.stream.write((json.dumps({"batches": batches}) + "\n").encode())
+        self.stream.flush()
+        reply = json.loads(self.stream.readline())
+        if "error" in reply:
+            raise ValueError(reply["error"])
+        results = []
+        for path in reply["paths"]:
+            output = np.load(path, mmap_mode = "r")
+            os.unlink(path)
+            results.append((output[0], output[1:]))
+        return results
+
+    def request(self,
+                **batch):
+        """
+        Request a single batch of curves from the daemon.
+
+        Parameters:
+        -----------
+        **batch : keyword arguments
+            The keyword arguments of surgebinder() for the batch, apart
+            from 'dense', 'backend', 'n_workers' and 'accept'.
+
+        Returns:
+        --------
+        x_values : numpy.ndarray
+            The x-axis measurement points that are shared by all curves.
+
+        values : numpy.ndarray
+            The y-axis values of the curves, with one row per curve.
+
+        Attributes:
+        -----------
+        None
+        """
+        return self.batches([batch])[0]
+
+class StoreWriter:
+    """
+    Write curves into a chunked and compressed store in the background.
+
+    The rows of y-axis values are collected into chunks of a fixed number
+    of curves, and each full chunk is encoded, compressed and written by
+    a background thread, while the next chunk is filled. With two chunk
+    buffers that take turns, the generation of curves only waits for the
+    disk if the writing falls behind by more than a whole chunk. The
+    store is a ZIP file with one array per chunk, the shared x-axis
+    values and an index of the first row of each chunk, so that any range
+    of rows can be read without decompressing the rest, see Store.
+
+    Before the compression, the bits of each value are read as an integer
+    and replaced by their differences to the bits of the previous value
+    of the same curve, or by the second differences, which are small for
+    smooth curves and thus compress well. The encoding works on integers,
+    so that the stored curves are restored exactly.
+
+    Parameters:
+    -----------
+    path : str
+        The path of the file of the store, which is overwritten.
+
+    x_values : numpy.ndarray
+        The x-axis measurement points that are shared by all curves.
+
+    dtype : numpy.dtype, defaults to numpy.float64
+        The floating-point type of the stored curves, as either
+        numpy.float64 or numpy.float32.
+
+    chunk_size : int >= 1, defaults to 4096
+        The number of curves per chunk, which is the smallest unit that
+        is decompressed when reading rows.
+
+    compression : str, defaults to "zlib"
+        The compression of the chunks, as either "zlib" for fast writing
+        or "lzma" for smaller files.
+
+    encoding : str, defaults to "second"
+        The encoding of the values before the compression, as either
+        "second" for second differences, "delta" for first differences,
+        or "none" for the bits of the values. Second differences shrink
+        smooth curves to about a fifteenth of their size with "zlib".
+
+    Attributes:
+    -----------
+    n_curves : int
+        The number of curves that have been written to the store.
+    """
+    def __init__(self,
+                 path,
+                 x_values,
+                 dtype = np.float64,
+                 chunk_size = 4096,
+                 compression = "zlib",
+                 encoding = "second"):
+        # Check if the settings of the store are valid
+        if dtype not in [np.float32, np.float64]:
+            print('ERROR: dtype: Must be either numpy.float64 or numpy.float32')
+            sys.exit()
+        if (type(chunk_size) is not int) or (chunk_size < 1):
+            print('ERROR: chunk_size: Must be an integer >= 1')
+            sys.exit()
+        if compression not in ["zlib", "lzma"]:
+            print('ERROR: compression: Must be either "zlib" or "lzma"')
+            sys.exit()
+        if encoding not in ["delta", "second", "none"]:
+            print('ERROR: encoding: Must be either "delta", "second" or "none"')
+            sys.exit()
+        self.x_values = np.asarray(x_values, dtype = dtype)
+        self.dtype = np.dtype(dtype)
+        self.chunk_size = chunk_size
+        self.encoding = encoding
+        methods = {"zlib": zipfile.ZIP_DEFLATED, "lzma": zipfile.ZIP_LZMA}
+        self.archive = zipfile.ZipFile(path,
+                                       mode = "w",
+                                       compression = methods[compression],
+                                       allowZip64 = True)
+        # Hand the chunks between the two buffers and the writing thread
+        self.free = queue.Queue()
+        for _ in range(2):
+            self.free.put(np.empty((chunk_size, len(self.x_values)),
+                                   dtype = dtype))
+        self.full = queue.Queue()
+        self.buffer = self.free.get()
+        self.filled = 0
+        self.starts = [0]
+        self.n_curves = 0
+        self.error = None
+        self.thread = threading.Thread(target = self.flushing, daemon = True)
+        self.thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self,
+                 exc_type,
+                 exc_value,
+                 traceback):
+        self.close()
+        return False
+
+    def write(self,
+              values):
+        """
+        Append rows of curves to the store.
+
+        Parameters:
+        -----------
+        values : numpy.ndarray
+            The y-axis values of the curves, with one row per curve and
+            one column per x-axis measurement point.
+
+        Returns:
+        --------
+        None
+
+        Attributes:
+        -----------
+        None
+        """
+        if self.error is not None:
+            raise self.error
+        values = np.asarray(values)
+        if (values.ndim != 2) or (values.shape[1] != len(self.x_values)):
+            print('ERROR: values: Must have one row per curve and one ' +
+                  'column per x-axis value of the store')
+            sys.exit()
+        first = 0
+        while first < len(values):
+            # Copy as many rows as fit into the current chunk
+            n_rows = min(len(values) - first, self.chunk_size - self.filled)
+            self.buffer[self.filled:self.filled + n_rows] = values[first:first + n_rows]
+            self.filled = self.filled + n_rows
+            first = first + n_rows
+            # Hand a full chunk to the writing thread and take the other
+            if self.filled == self.chunk_size:
+                self.handover()
+        self.n_curves = self.n_curves + len(values)
+
+    def handover(self):
+        """
+        Pass the current chunk to the writing thread.
+
+        Parameters:
+        -----------
+        None
+
+        Returns:
+        --------
+        None
+
+        Attributes:
+        -----------
+        None
+        """
+        self.full.put((self.buffer, self.filled))
+        self.starts.append(self.starts[-1] + self.filled)
+        self.buffer = self.free.get()
+        self.filled = 0
+
+    def flushing(self):
+        """
+        Encode, compress and write the full chunks in the background.
+
+        Parameters:
+        -----------
+        None
+
+        Returns:
+        --------
+        None
+
+        Attributes:
+        -----------
+        None
+        """
+        number = 0
+        while True:
+            item = self.full.get()
+            if item is None:
+                return
+            buffer, n_rows = item
+            try:
+                if self.error is None:
+                    codes = encoding(values = buffer[0:n_rows],
+                                     method = self.encoding)
+                    with self.archive.open("chunk-%08d.npy" % number,
+                                           mode = "w",
+                                           force_zip64 = True) as member:
+                        np.lib.format.write_array(member, codes)
+            except Exception as error:
+                self.error = error
+            number = number + 1
+            # Return the written buffer for the next chunk
+            self.free.put(buffer)
+
+    def close(self):
+        """
+        Write the last chunk and the index, and close the store.
+
+        Parameters:
+        -----------
+        None
+
+        Returns:
+        --------
+        None
+
+        Attributes:
+        -----------
+        None
+        """
+        if self.archive is None:
+            return
+        if self.filled > 0:
+            self.handover()
+        self.full.put(None)
+        self.thread.join()
+        # Write the shared x-axis values, the settings and the row index
+        with self.archive.open("x_values.npy", mode = "w") as member:
+            np.lib.format.write_array(member, self.x_values)
+        with self.archive.open("index.npy", mode = "w") as member:
+            np.lib.format.write_array(member, np.asarray(self.starts,
+                                                         dtype = np.int64))
+        self.archive.writestr("settings.json",
+                              json.dumps({"dtype": self.dtype.name,
+                                          "encoding": self.encoding}))
+        self.archive.close()
+        self.archive = None
+        if self.error is not None:
+            raise self.error
+
+class Store:
+    """
+    Read any range of curves from a chunked and compressed store.
+
+    Only the chunks that contain the requested rows are decompressed,
+    and the last decompressed chunk is kept for subsequent reads of
+    neighbouring rows. Rows can be read with read() or with slices, e.g.
+    store[1000:1010] for the curves with indices 1000 to 1009.
+
+    Parameters:
+    -----------
+    path : str
+        The path of a store written with StoreWriter.
+
+    Attributes:
+    -----------
+    x_values : numpy.ndarray
+        The x-axis measurement points that are shared by all curves.
+
+    starts : numpy.ndarray
+        The index of the first row of each chunk, followed by the total
+        number of rows.
+    """
+    def __init__(self,
+                 path):
+        self.archive = zipfile.ZipFile(path, mode = "r")
+        settings = json.loads(self.archive.read("settings.json"))
+        self.dtype = np.dtype(settings["dtype"])
+        self.encoding = settings["encoding"]
+        with self.archive.open("x_values.npy") as member:
+            self.x_values = np.lib.format.read_array(member)
+        with self.archive.open("index.npy") as member:
+            self.starts = np.lib.format.read_array(member)
+        self.cached = (None, None)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self,
+                 exc_type,
+                 exc_value,
+                 traceback):
+        self.close()
+        return False
+
+    def __len__(self):
+        return int(self.starts[-1])
+
+    def __getitem__(self,
+                    rows):
+        if isinstance(rows, slice):
+            selected = range(*rows.indices(len(self)))
+            if len(selected) == 0:
+                return self.read(0, 0)
+            # Read the block that spans the selected rows and step through it
+            first = min(selected)
+            block = self.read(first, max(selected) + 1)
+            return block[selected.start - first::selected.step]
+        row = operator.index(rows)
+        if row < 0:
+            row = row + len(self)
+        if (row < 0) or (row >= len(self)):
+            raise IndexError("row index out of range")
+        return self.read(row, row + 1)[0]
+
+    def chunk(self,
+              number):
+        """
+        Decompress and decode a single chunk of the store.
+
+        Parameters:
+        -----------
+        number : int
+            The position of the chunk in the store.
+
+        Returns:
+        --------
+        values : numpy.ndarray
+            The y-axis values of the curves of the chunk.
+
+        Attributes:
+        -----------
+        None
+        """
+        if self.cached[0] != number:
+            with self.archive.open("chunk-%08d.npy" % number) as member:
+                codes = np.lib.format.read_array(member)
+            self.cached = (number, decoding(codes = codes,
+                                            method = self.encoding,
+                                            dtype = self.dtype))
+        return self.cached[1]
+
+    def read(self,
+             start,
+             stop):
+        """
+        Read a range of consecutive curves from the store.
+
+        Parameters:
+        -----------
+        start : int
+            The index of the first curve that is to be read.
+
+        stop : int
+            The index after the last curve that is to be read.
+
+        Returns:
+        --------
+        values : numpy.ndarray
+            The y-axis values of the curves, with one row per curve and
+            one column per x-axis measurement point.
+
+        Attributes:
+        -----------
+        None
+        """
+        start = max(0, start)
+        stop = min(len(self), stop)
+        values = np.empty((max(0, stop - start), len(self.x_values)),
+                          dtype = self.dtype)
+        if stop <= start:
+            return values
+        # Find the chunks that contain the first and the last row
+        first = int(np.searchsorted(self.starts, start, side = "right")) - 1
+        last = int(np.searchsorted(self.starts, stop - 1, side = "right")) - 1
+        for number in range(first, last + 1):
+            low = max(start, self.starts[number])
+            high = min(stop, self.starts[number + 1])
+            offset = self.starts[number]
+            values[low - start:high - start] = self.chunk(number)[low - offset:high - offset]
+        return values
+
+    def close(self):
+        """
+        Close the file of the store.
+
+        Parameters:
+        -----------
+        None
+
+        Returns:
+        --------
+        None
+
+        Attributes:
+        -----------
+        None
+        """
+        self.archive.close()
+
+def encoding(values,
+             method):
+    """
+    Turn curves into integer differences of the bits of their values.
+
+    Parameters:
+    -----------
+    values : numpy.ndarray
+        The y-axis values of the curves, with one row per curve.
+
+    method : str
+        The encoding, as either "delta" for the first differences along
+        each curve, "second" for the second differences, or "none".
+
+    Returns:
+    --------
+    codes : numpy.ndarray
+        The encoded values, as integers of the same size as the values.
+
+    Attributes:
+    -----------
+    None
+    """
+    # Read the bits of the values as integers, with wrapping differences
+    codes = np.ascontiguousarray(values).view("i%d" % values.dtype.itemsize)
+    for _ in range({"none": 0, "delta": 1, "second": 2}[method]):
+        codes = np.concatenate([codes[:, 0:1], np.diff(codes, axis = 1)],
+                               axis = 1)
+    return codes
+
+def decoding(codes,
+             method,
+             dtype):
+    """
+    Restore curves from the integer differences of the bits of their values.
+
+    Parameters:
+    -----------
+    codes : numpy.ndarray
+        The encoded values, as returned by encoding().
+
+    method : str
+        The encoding, as either "delta", "second" or "none".
+
+    dtype : numpy.dtype
+        The floating-point type of the values.
+
+    Returns:
+    --------
+    values : numpy.ndarray
+        The y-axis values of the curves, with one row per curve.
+
+    Attributes:
+    -----------
+    None
+    """
+    for _ in range({"none": 0, "delta": 1, "second": 2}[method]):
+        codes = np.cumsum(codes, axis = 1, dtype = codes.dtype)
+    return np.ascontiguousarray(codes).view(dtype)
+
+def allocation(shape,
+               dtype,
+               boundary = 64,
+               lead = 0):
+    """
+    Allocate a C-contiguous array that starts at an aligned address.
+
+    The output arrays of the curves are aligned to cache lines, which
+    suits the vector instructions of other array libraries that wrap the
+    arrays without copying, via the DLPack or buffer protocols.
+
+    Parameters:
+    -----------
+    shape : tuple of ints
+        The shape of the array.
+
+    dtype : numpy.dtype
+        The type of the values of the array.
+
+    boundary : int, defaults to 64
+        The number of bytes to whose multiples the start is aligned.
+
+    lead : int, defaults to 0
+        The number of bytes of the array before the aligned address, for
+        arrays of which a view that starts later is returned to the user.
+
+    Returns:
+    --------
+    array : numpy.ndarray
+        The uninitialized array.
+
+    Attributes:
+    -----------
+    None
+    """
+    dtype = np.dtype(dtype)
+    n_bytes = int(np.prod(shape)) * dtype.itemsize
+    # Over-allocate raw bytes and start the array at the next boundary
+    raw = np.empty(n_bytes + boundary, dtype = np.uint8)
+    offset = -(raw.ctypes.data + lead) % boundary
+    return raw[offset:offset + n_bytes].view(dtype).reshape(shape)
+
+def screening(accept,
+              x_values,
+              curves,
+              y_interval,
+              right_convergence,
+              antithetic):
+    """
+    Apply the user-defined acceptance test to a batch of curves.
+
+    This function evaluates the acceptance test of the user on a batch
+    of curves that already stay within the y-axis interval, with the
+    curves given in the same orientation as they are returned. For
+    mirrored pairs, both the curve and its mirror image have to pass the
+    test. The returned indicators replace the acceptance of the curves,
+    so that rejected curves are redrawn like any other rejected curve.
+
+    Parameters:
+    -----------
+    accept : callable
+        The acceptance test of the user, which is called with the shared
+        x-axis values and an array with one row of y-axis values per
+        curve, and returns one boolean indicator per curve.
+
+    x_values : numpy.ndarray
+        The x-axis measurement points that are returned to the user.
+
+    curves : numpy.ndarray
+        The y-axis values of the batch of curves, with one row per curve,
+        in the orientation of the calculation.
+
+    y_interval : list with two single floats
+        The y-axis interval for curves, as [lower point, upper point],
+        to which the mirror images are clipped as in the final output.
+
+    right_convergence : bool
+        The indicator whether the curves are flipped before they are
+        returned to the user, and thus before they are tested.
+
+    antithetic : bool
+        The indicator whether each curve is mirrored about its starting
+        point, in which case the mirror image is tested as well.
+
+    Returns:
+    --------
+    accepted : numpy.ndarray
+        The boolean indicators of the curves that pass the test, with one
+        value per row of the parameter 'curves'.
+
+    Attributes:
+    -----------
+    None
+    """
+    batches = [curves]
+    # Test the mirror images in the same way as the final output
+    if antithetic == True:
+        mirrors = 2 * curves[:, 0:1] - curves
+        np.clip(mirrors, y_interval[0], y_interval[1], out = mirrors)
+        batches.append(mirrors)
+    accepted = np.ones(len(curves), dtype = bool)
+    for batch in batches:
+        if right_convergence == True:
+            batch = batch[:, ::-1]
+        result = np.asarray(accept(x_values, batch), dtype = bool)
+        accepted = accepted & result.reshape(len(curves))
+    return accepted
+
+def dispatcher(n_curves,
+               first_curve,
+               key,
+               x_interval,
+               y_interval,
+               convergence_point,
+               flat_state,
+               flat_value,
+               direction_maximum,
+               steps,
+               offsets,
+               step_size,
+               change_range,
+               change_spacing,
+               change_ratio,
+               random_launch,
+               print_points,
+               perc,
+               progress_update,
+               engine,
+               dtype,
+               points,
+               antithetic,
+               anchors,
+               accept,
+               deadline,
+               x_values,
+               right_convergence,
+               curves):
+    """
+    Generate the curves of a range of consecutive curve indices.
+
+    This function computes the curves with the indices from first_curve
+    onwards with the requested engine, either one curve at a time with
+    the generator() function or in batches with the accelerator()
+    function. It is the unit of work of all backends, as the random
+    stream of each curve only depends on its index, so that disjoint
+    ranges of curve indices can be computed independently in threads or
+    processes and still result in the same curves.
+
+    Parameters:
+    -----------
+    n_curves : int
+        The number of consecutive curve indices that are to be computed.
+
+    first_curve : int
+        The index of the first curve that is to be generated, which
+        selects the random streams of the generated curve indices.
+
+    key : numpy.ndarray
+        The two unsigned 64-bit integers that form the Philox key. The
+        key is identical for all curves and combined with the curve
+        index to select the stream of a specific curve.
+
+    x_interval : list with two single floats
+        The x-axis interval for curves, as [left point, rigth point].
+        This range indicates over which x-axis span the measurements
+        for the curves should be done, i.e. the range of the curves.
+
+    y_interval : list with two single floats
+        The y-axis interval for curves, as [lower point, upper point].
+        This range indicates which y-axis window curves shouldn't leave
+        under any circumstances to make them still useful to the user.
+
+    convergence_point : list with two single floats or None
+        The point in which the curves converge, as [x-axis value, y-axis
+        value], or None if the starting points on the y-axis are sampled
+        uniformly random from the y-axis interval.
+
+    flat_state : bool
+        The indicator whether the parameter start_force is set to a
+        value different from the default, None. If so, the curves
+        shouldn't deviate on the y-axis before the value determined by
+        start_force on the x-axis is reached.
+
+    flat_value : float or None
+        The x-axis point before which no y-axis deviation with regard to
+        the projectile's starting point should happen, on the linear
+        scale of the calculation, or None if no flat start is requested.
+
+    direction_maximum : int
+        The maximum number of gravity flips. This value determines the
+        upper end of the range from which a number of gravity direction
+        change points is sample uniformly as integers.
+
+    steps : array-like
+        The x-axis measurement points on the linear scale of the
+        calculation, at which the y-axis values of the curves are taken.
+
+    offsets : numpy.ndarray
+        The horizontal displacements of the measurement points from the
+        first point, i.e. multiples of the step size.
+
+    step_size : float
+        The step size for the x-axis measurement points at which the
+        location of the projectile along the y-axis are to be measured.
+
+    change_range : list
+        The x-axis percentiles below and above which no gravity flips
+        should take place, as [lower percentile, upper percentile].
+
+    change_spacing : int
+        The minimum space on the x-axis in full steps that is required
+        between gravitational direction changes, with hiher values
+        resulting in increased smoothness.
+
+    change_ratio : float or None
+        The value by which the previous force is multiplied to limit the
+        next force, or None if the forces aren't limited in that way.
+
+    random_launch : bool
+        The indicator whether no initial zero launch angle is necessary,
+        i.e. projectiles will start at random angles sampled uniformly
+        between -90 and 90 degrees for each curve separately.
+
+    print_points : list or None
+        The list of numbers of curves generated that mark a milestone
+        in a 10%-spaced progress scheme. An empty list, together with a
+        'progress_update' of n_curves, silences all progress printouts.
+
+    perc : int or None
+        The percentage of progress that has been printed so far.
+
+    progress_update : int
+        The number of curves for which progress was printed so far.
+
+    engine : str
+        The engine that computes the curves, as either "numpy",
+        "vectorized" or "numba".
+
+    dtype : numpy.dtype
+        The floating-point type of the output array if it is allocated
+        by this function, as either numpy.float64 or numpy.float32.
+
+    points : numpy.ndarray or None
+        The quasi-random points of the first attempts of the curves, with
+        one row per curve, or None if all values are drawn independently
+        from the random streams of the curves.
+
+    antithetic : bool
+        The indicator whether each curve is later mirrored about its
+        starting point, in which case the y-axis interval is narrowed
+        so that the mirrored curve stays within the interval as well.
+
+    anchors : numpy.ndarray or None
+        The anchor points with one row per anchor point, as [index of
+        the measurement point, lower point, upper point] of the window
+        on the y-axis, or None if no anchor points are requested.
+
+    accept : callable or None
+        The acceptance test of the user, which is called with the shared
+        x-axis values and a batch of curves, or None for no test.
+
+    deadline : float or None
+        The time of the performance counter after which no further
+        attempts are started, leaving the unfinished curves incomplete,
+        or None for generating all curves regardless of the time.
+
+    x_values : numpy.ndarray
+        The x-axis measurement points that are returned to the user and
+        passed to the acceptance test.
+
+    right_convergence : bool
+        The indicator whether the curves are flipped before they are
+        returned to the user, and thus before they are tested.
+
+    curves : numpy.ndarray or None
+        The output array with one row per curve index, which is filled
+        in place, or None to allocate a new output array.
+
+    Returns:
+    --------
+    curves : numpy.ndarray
+        The y-axis values of the generated curves, with one row per
+        curve and one column per x-axis measurement point.
+
+    print_points : list or None
+        The list of remaining progress milestones, see above.
+
+    perc : int or None
+        The percentage of progress that has been printed, see above.
+
+    progress_update : int
+        The number of curves for which progress was printed, see above.
+
+    attempts : int
+        The total number of curve attempts, including the ones that had
+        to be abandoned for leaving the y-axis interval.
+
+    completed : numpy.ndarray
+        The indicators whether each curve has been completed, which are
+        all True unless a deadline has stopped the generation early.
+
+    Attributes:
+    -----------
+    None
+    """
+    # Initialize the output if no rows of a shared output are given
+    if curves is None:
+        curves = np.empty((n_curves, len(steps)), dtype = dtype)
+    # Compute the curves in batches with one of the batch kernels
+    if engine in ["vectorized", "numba"]:
+        return accelerator(n_curves = n_curves,
+                           first_curve = first_curve,
+                           key = key,
+                           groups = np.zeros(n_curves, dtype = np.int64),
+                           x_interval = x_interval,
+                           y_intervals = [y_interval],
+                           convergence_points = [convergence_point],
+                           flat_state = flat_state,
+                           flat_value = flat_value,
+                           direction_maxima = [direction_maximum],
+                           steps = steps,
+                           step_size = step_size,
+                           change_range = change_range,
+                           change_spacing = change_spacing,
+                           change_ratios = [change_ratio],
+                           random_launch = random_launch,
+                           print_points = print_points,
+                           perc = perc,
+                           progress_update = progress_update,
+                           engine = engine,
+                           points = points,
+                           antithetic = antithetic,
+                           anchors = anchors,
+                           accept = accept,
+                           deadline = deadline,
+                           x_values = x_values,
+                           right_convergence = right_convergence,
+                           curves = curves)
+    # Initialize the work space that is shared by all curves
+    scratch = np.empty(len(steps), dtype = curves.dtype)
+    attempts = 0
+    completed = np.zeros(n_curves, dtype = bool)
+    # Loop over the curve indices, each with its own random stream
+    for index in range(0, n_curves):
+        rng = stream(key = key,
+                     index = first_curve + index)
+        # Take the first attempt from the quasi-random point if given
+        if points is None:
+            point = None
+        else:
+            point = points[index]
+        # Retry within the curve's stream until a curve is accepted
+        accepted = np.zeros(1, dtype = bool)
+        while accepted[0] == False:
+            # Stop starting new attempts once the deadline has passed
+            if (deadline is not None) and (time.perf_counter() >= deadline):
+                return (curves, print_points, perc, progress_update,
+                        attempts, completed)
+            attempts = attempts + 1
+            # Generate a new curve with the previously set preferences
+            accepted = generator(n_curves = 1,
+                                 x_interval = x_interval,
+                                 y_interval = y_interval,
+                                 convergence_flag = (convergence_point
+                                                     == None),
+                                 convergence_point = convergence_point,
+                                 flat_state = flat_state,
+                                 direction_maximum = direction_maximum,
+                                 steps = steps,
+                                 step_size = step_size,
+                                 change_range = change_range,
+                                 change_spacing = change_spacing,
+                                 change_ratio = change_ratio,
+                                 start_force = flat_value,
+                                 flat_value = flat_value,
+                                 random_launch = random_launch,
+                                 rng = rng,
+                                 point = point,
+                                 antithetic = antithetic,
+                                 anchors = anchors,
+                                 offsets = offsets,
+                                 scratch = scratch,
+                                 curves = curves[index:index + 1])
+            point = None
+            # Apply the acceptance test of the user to the valid curve
+            if (accept is not None) and (accepted[0] == True):
+                accepted = screening(accept = accept,
+                                     x_values = x_values,
+                                     curves = curves[index:index + 1],
+                                     y_interval = y_interval,
+                                     right_convergence = right_convergence,
+                                     antithetic = antithetic)
+        completed[index] = True
+        # Print progress updates to inform about remaining time
+        progress_output = progress(done_curves = index + 1,
+                                   curve_request = n_curves,
+                                   print_points = print_points,
+                                   perc = perc,
+                                   progress_update = progress_update)
+        print_points, perc, progress_update = progress_output
+    return curves, print_points, perc, progress_update, attempts, completed
+
+def generator(n_curves,
+              x_interval,
+              y_interval,
+              convergence_flag,
+              convergence_point,
+              flat_state,
+              direction_maximum,
+              steps,
+              step_size,
+              change_range,
+              change_spacing,
+              change_ratio,
+              start_force,
+              flat_value,
+              random_launch,
+              rng,
+              point,
+              antithetic,
+              anchors,
+              offsets,
+              scratch,
+              curves):
+    """
+    Generate curves and discard them if necessary.
+
+    This function generates curves based on its input and discards them
+    if they fall outside of the required y-axis interval. Each new
+    partial path is checked right after it is calculated, so that curves
+    are abandoned before any of their later partial paths are computed.
+
+    Parameters:
+    -----------
+    n_curves : int
+        The number of curves that are to be returned to the user. This
+        is simply the value that indicates how many curves are needed
+        for whatever goal they'll be used after being generated.
+
+    x_interval : list with two single floats
+        The x-axis interval for curves, as [left point, rigth point].
+        This range indicates over which x-axis span the measurements
+        for the curves should be done, i.e. the range of the curves.
+
+    y_interval : list with two single floats
+        The x-axis interval for curves, as [lower point, upper point].
+        This range indicates which y-axis window curves shouldn't leave
+        under any circumstances to make them still useful to the user.
+
+    convergence_flag : bool
+        The indicator whether a convergence point is required by the
+        user. If true, curves should perfectly convergence in that
+        exact point on either the left or the right side of the x-axis
+        interval, defending on the user-specified preferences.
+
+    convergence_point : list
+        The point in which all curves should perfectly converge, as
+        [x-axis value, y-axis value]. Normally, this refers to left-side
+        convergence if the parameter 'right_convergence' isn't set to
+        True. If 'convergence_point' isn't set, projectile starting
+        points are sampled uniformly random from the y-axis interval,
+        but the projectile will still start at a zero launch angle.
+
+    flat_state : bool
+        The indicator whether the parameter start_force is set to a
+        value different from the default, None. If so, the curves
+        shouldn't deviate on the y-axis before the value determined by
+        start_force on the x-axis is reached.
+
+    direction_maximum : int
+        The maximum number of gravity flips, i.e. direction changes.
+        This value determines the upper end of the range from which a
+        number of gravity direction change points is sample uniformly
+        as integers, with 0 as the lower end of the sampling range.
+
+    steps : array-like
+        The x-axis measurement points that are equally-spaced when they
+        are depicted on a logarithmic scale. This ensures the same
+        curve behavior for the linear and logarithmic curve generation.
+
+    step_size : float
+        The step size for the x-axis measurement points at which the
+        location of the projectile along the y-axis are to be measured.
+        Like the gravitational force, this value remains constant.
+
+    change_range : list
+        The x-axis percentiles below and above which no gravity flips
+        should take place to avoid extreme bends in the curves due to
+        the gravitational magnitude being sampled up to the maximum
+        allowable force to hit the upper limit of the y-axis interval,
+        as [lower percentile, upper percentile]. The default behavior if
+        the parameter isn't set is to use the 10th and 90th percentile.
+
+    change_spacing : int
+        The minimum space on the x-axis in full steps that is required
+        between gravitational direction changes, with hiher values
+        resulting in increased smoothness. The parameter has to be small
+        enough that the provided 'n_measure' parameter divided by the
+        the 'change_spacing' parameter is equal to or larger than the
+        'direction_maximum' parameter, i.e. the number of measurements
+        divided by the minimum x-axis spacing has to be >= the maximum
+        number of direction changes so that all possibilities will fit.
+
+    start_force : float
+        The x-axis point before which no y-axis deviation with regard to
+        the projectile's starting point should happen. This is useful
+        if a function perturbation should only happen after a certain
+        point, which can be specified by setting this parameter.
+
+    flat_value : float
+        The copy of the parameter start_force that is made to make some
+        of the calculations easier, making it a code-related parameter.
+
+    random_launch : bool
+        The indicator whether no initial zero launch angle is necessary,
+        i.e. projectiles will start at random angles sampled uniformly
+        between -90 and 90 degrees for each curve separately.
+
+    rng : numpy.random.Generator
+        The random number generator from which all random values of the
+        generated curves are drawn. For reproducible curves, this is the
+        counter-based stream of the curve index that is being generated.
+
+    point : numpy.ndarray or None
+        The quasi-random point from which the leading random values of
+        the curves are taken, or None to draw them all from 'rng'.
+
+    antithetic : bool
+        The indicator whether each curve is later mirrored about its
+        starting point, in which case the y-axis interval is narrowed
+        so that the mirrored curve stays within the interval as well.
+
+    anchors : numpy.ndarray or None
+        The anchor points with one row per anchor point, as [index of
+        the measurement point, lower point, upper point] of the window
+        on the y-axis, or None if no anchor points are requested.
+
+    offsets : numpy.ndarray
+        The horizontal displacements of the measurement points from the
+        first point, i.e. multiples of the step size. These are shared
+        by all partial paths, which use the first values for their span.
+
+    scratch : numpy.ndarray
+        The work space with one value per measurement point that holds
+        intermediate results of the trajectory calculation, so that no
+        temporary arrays have to be allocated for any of the curves.
+
+    curves : numpy.ndarray
+        The output array with one row per curve and one column per
+        x-axis measurement point, into which the y-axis values of each
+        partial path are written directly. Rows of curves that had to
+        be abandoned are left with partial contents.
+
+    Returns:
+    --------
+    accepted : numpy.ndarray
+        The boolean indicators of the curves that stay within the y-axis
+        interval, with one value per row of the parameter 'curves'.
+
+    Attributes:
+    -----------
+    None
+    """
+    # Initialize the indicators for the accepted curves
+    accepted = np.zeros(n_curves, dtype = bool)
+    # Loop over the required total number of separate curves
+    for curve in range(0, n_curves):
+        # Draw the random plan of the curve from its random stream
+        plan = blueprint(rng = rng,
+                         point = point,
+                         x_interval = x_interval,
+                         y_interval = y_interval,
+                         convergence_flag = convergence_flag,
+                         convergence_point = convergence_point,
+                         flat_state = flat_state,
+                         flat_value = flat_value,
+                         direction_maximum = direction_maximum,
+                         n_measure = len(steps),
+                         change_range = change_range,
+                         change_spacing = change_spacing,
+                         random_launch = random_launch,
+                         anchors = anchors)
+        y_start, direction, launch_angle, change_points = plan[0:4]
+        uniforms, targets = plan[4:6]
+        # Start from the planned point without changing the input
+        start_point = [x_interval[0], y_start]
+        # Narrow the checked interval so that the mirror stays inside
+        low = np.float64(y_interval[0])
+        high = np.float64(y_interval[1])
+        if antithetic == True:
+            low = np.maximum(low, 2 * y_start - y_interval[1])
+            high = np.minimum(high, 2 * y_start - y_interval[0])
+        # Reset the start force if a flat state is requested
+        if flat_state == True:
+            start_force = flat_value
+        # Set the particle's velocity to an arbitrary value
+        velocity = 1.0
+        # Get the maximum force to stay within the intervals
+        rest_time = np.divide(x_interval[1], velocity  )
+        max_range = y_interval[np.maximum(0, direction)] - start_point[1]
+        abs_max = np.multiply(np.negative(direction), (max_range))
+        spread = np.multiply(velocity, np.sin(launch_angle)) - abs_max
+        force_max = np.divide(np.multiply(2, spread), np.square(rest_time))
+        # Randomly sample the force depending on the maximum
+        force = np.multiply(force_max, uniforms[0])
+        # Initialize the counter and the curve's output row
+        counter = 0
+        row = curves[curve]
+        delete_flag = False
+        # Loop over change points to calculate partial curves
+        n_parts = len(change_points) + 1
+        for part in range(0, n_parts):
+            # Set the steps depending on the process' status
+            if part == n_parts - 1:
+                end = len(steps) - 1
+            else:
+                end = change_points[part]
+                # Sample a random force for the partial curve
+                scale_factor = np.divide(len(steps), end - counter + 1)
+                force_max = np.multiply(force_max, scale_factor)
+                if start_force == None:
+                    if (change_ratio == None) or (part == 0):
+                        force = np.multiply(force_max, uniforms[2 * part + 1])
+                    elif save_force == 0.0:
+                        force = np.multiply(force_max, uniforms[2 * part + 1])
+                    else:
+                        ratio_product = np.multiply(save_force, change_ratio)
+                        limiter = np.minimum(force_max, ratio_product)
+                        force = np.multiply(limiter, uniforms[2 * part + 1])
+                else:
+                    force = 0.0
+                    start_force = None
+                # Aim the partial path at the target of an anchor point
+                if not np.isnan(targets[part]):
+                    horizontal = np.multiply(velocity, np.cos(launch_angle))
+                    interim = np.multiply(velocity, np.sin(launch_angle))
+                    time = np.divide(offsets[end - counter], horizontal)
+                    rise = (targets[part] - start_point[1]) * direction
+                    force = 2 * (rise / time + interim) / time
+            # Save the force used to generate the partial curve
+            save_force = force
+            # Calculate the trajectory directly into the output row
+            length = end - counter + 1
+            output = trajectory(force = force,
+                                velocity = velocity,
+                                direction = direction,
+                                start_point = start_point,
+                                launch_angle = launch_angle,
+                                partial_steps = steps[counter:end + 1],
+                                offsets = offsets[0:length],
+                                curve = row[counter:end + 1],
+                                scratch = scratch[0:length])
+            # Assign the values from the trajectory function
+            last_point, launch_angle, velocity = output[0:3]
+            # Abandon the curve as soon as it leaves the y-axis interval
+            if ((row[counter:end + 1].min() < low)
+                or (row[counter:end + 1].max() > high)):
+                delete_flag = True
+                break
+            # Update parameters for the next loop iteration
+            start_point = last_point
+            direction = -direction
+            force = np.negative(force)
+            counter = end
+            # Skip the force for the next part after the final part
+            if part < n_parts - 1:
+                # Get the maximum force to stay within the intervals
+                rest_time = np.divide(x_interval[1] - last_point[0], velocity)
+                max_range = y_interval[np.maximum(0, direction)] - last_point[1]
+                abs_max = np.multiply(np.negative(direction), (max_range))
+                spread = np.multiply(velocity, np.sin(launch_angle)) - abs_max
+                force_max = np.divide(np.multiply(2, spread),
+                                      np.square(rest_time))
+                # Randomly sample the force depending on the maximum
+                if change_ratio == None:
+                    force = np.multiply(force_max, uniforms[2 * part + 2])
+                elif save_force == 0.0:
+                    force = np.multiply(force_max, uniforms[2 * part + 2])
+                else:
+                    limiter = np.minimum(save_force, force_max)
+                    ratio_limit = np.multiply(limiter, change_ratio)
+                    force = np.multiply(ratio_limit, uniforms[2 * part + 2])
+        # Mark the computed curve if it was never abandoned
+        accepted[curve] = not delete_flag
+    return accepted
+
+def blueprint(rng,
+              point,
+              x_interval,
+              y_interval,
+              convergence_flag,
+              convergence_point,
+              flat_state,
+              flat_value,
+              direction_maximum,
+              n_measure,
+              change_range,
+              change_spacing,
+              random_launch,
+              anchors):
+    """
+    Draw the random values that fully determine a single curve attempt.
+
+    This function draws all random values of one curve attempt from the
+    given random stream, i.e. the starting point, the initial direction
+    and launch angle, the change points and one uniform variate for each
+    force that might be sampled along the curve. The forces themselves
+    depend on the curve's trajectory and are only computed from these
+    variates when the curve is calculated, which allows different
+    engines to compute identical curves from the same plan.
+
+    Parameters:
+    -----------
+    rng : numpy.random.Generator
+        The random number generator from which all random values of the
+        generated curves are drawn. For reproducible curves, this is the
+        counter-based stream of the curve index that is being generated.
+
+    point : numpy.ndarray or None
+        The quasi-random point in the unit hypercube from which the
+        values are taken instead of drawing them from 'rng', or None to
+        draw all of them from 'rng'. Its first four values set the
+        starting point, the number of change points, the direction and
+        the launch angle, followed by one value for the first draw of
+        each change point and by the force variates. Change points that
+        are too close to the previous ones are redrawn from 'rng'.
+
+    x_interval : list with two single floats
+        The x-axis interval for curves, as [left point, rigth point].
+        This range indicates over which x-axis span the measurements
+        for the curves should be done, i.e. the range of the curves.
+
+    y_interval : list with two single floats
+        The x-axis interval for curves, as [lower point, upper point].
+        This range indicates which y-axis window curves shouldn't leave
+        under any circumstances to make them still useful to the user.
+
+    convergence_flag : bool
+        The indicator whether no convergence point was provided by the
+        user, in which case the starting point on the y-axis is sampled
+        uniformly random from the y-axis interval for each curve.
+
+    convergence_point : list or None
+        The point in which all curves should perfectly converge, as
+        [x-axis value, y-axis value]. Only the y-axis value is used
+        here, and only if the parameter 'convergence_flag' is False.
+
+    flat_state : bool
+        The indicator whether the parameter start_force is set to a
+        value different from the default, None. If so, the curves
+        shouldn't deviate on the y-axis before the value determined by
+        start_force on the x-axis is reached.
+
+    flat_value : float or None
+        The x-axis point before which no y-axis deviation with regard to
+        the projectile's starting point should happen, on the linear
+        scale of the calculation, or None if no flat start is requested.
+
+    direction_maximum : int
+        The maximum number of gravity flips, i.e. direction changes.
+        This value determines the upper end of the range from which a
+        number of gravity direction change points is sample uniformly
+        as integers, with 0 as the lower end of the sampling range.
+
+    n_measure : int
+        The number of equally-spaced measurement points on the x-axis
+        for each curve, which determines the range of indices in which
+        the gravitational direction change points can be placed.
+
+    change_range : list
+        The x-axis percentiles below and above which no gravity flips
+        should take place, as [lower percentile, upper percentile].
+
+    change_spacing : int
+        The minimum space on the x-axis in full steps that is required
+        between gravitational direction changes, with hiher values
+        resulting in increased smoothness.
+
+    random_launch : bool
+        The indicator whether no initial zero launch angle is necessary,
+        i.e. projectiles will start at random angles sampled uniformly
+        between -90 and 90 degrees for each curve separately.
+
+    anchors : numpy.ndarray or None
+        The anchor points with one row per anchor point, as [index of
+        the measurement point, lower point, upper point] of the window
+        on the y-axis, or None if no anchor points are requested.
+
+    Returns:
+    --------
+    y_start : float
+        The y-axis value from which the projectile starts its flight,
+        which is either the provided convergence point or a sample from
+        the y-axis interval if no convergence point was provided.
+
+    direction : int from the set {-1, 1}
+        The initial direction of gravitational influence for the first
+        partial trajectory of the curve, flipping at each change point.
+
+    launch_angle : float
+        The launch angle with which the projectile starts its flight,
+        which is zero unless a random launch angle was requested.
+
+    change_points : numpy.ndarray
+        The sorted measurement point indices at which the gravitational
+        direction changes, including the end of a requested flat start.
+
+    uniforms : numpy.ndarray
+        The uniform variates for the force samples of the curve, with
+        the first one for the initial force and two for each partial
+        trajectory, i.e. one for the force at its start and one for the
+        force that is sampled for the next part at its end.
+
+    targets : numpy.ndarray
+        The y-axis values at which the partial paths that end at anchor
+        points are aimed, with one value per change point and NaN for
+        the change points that aren't anchor points.
+
+    Attributes:
+    -----------
+    None
+    """
+    # If no convergence point is given sample a random one
+    if convergence_flag == True:
+        if point is None:
+            y_start = rng.uniform(y_interval[0], y_interval[1])
+        else:
+            y_start = y_interval[0] + point[0] * (y_interval[1]
+                                                  - y_interval[0])
+    else:
+        y_start = convergence_point[1]
+    # Get the range of indices allowed for the change points
+    lower_range = int(np.multiply(n_measure, change_range[0]))
+    if flat_state == True:
+        diff_a = flat_value - x_interval[0]
+        diff_b = x_interval[1] - x_interval[0]
+        diff_ratio = np.divide(diff_a, diff_b)
+        flat_change = int(np.multiply(n_measure, diff_ratio))
+        lower_range = np.maximum(lower_range, flat_change)
+    higher_range = int(np.multiply(n_measure, change_range[1]))
+    if point is None:
+        sample_number = rng.integers(0, direction_maximum + 1)
+    else:
+        sample_number = min(int(point[1] * (direction_maximum + 1)),
+                            direction_maximum)
+    # Sample change points with the defined minimum space between
+    change_points = []
+    # Add the flat-start change point to the beginning
+    if flat_state == True:
+        change_points.append(flat_change)
+    # Add the change points at the anchor points
+    if anchors is not None:
+        change_points.extend(int(index) for index in anchors[:, 0])
+    valid_counter = 0
+    draws = 0
+    while valid_counter < sample_number:
+        # Take the first draw of each change point from the point
+        if (point is not None) and (draws < sample_number):
+            change_sample = lower_range + int(point[4 + draws]
+                                              * (higher_range - lower_range))
+        else:
+            change_sample = rng.integers(lower_range, higher_range)
+        draws = draws + 1
+        if all(np.abs(change_sample - other) >= change_spacing
+               for other in change_points):
+            change_points.append(change_sample)
+            valid_counter = valid_counter + 1
+    change_points = np.sort(np.asarray(change_points, dtype = np.int64))
+    # Generate a random initial direction for the force
+    if point is None:
+        direction = rng.choice([-1, 1])
+    elif point[2] < 0.5:
+        direction = -1
+    else:
+        direction = 1
+    # Set the angle to zero for a left-side convergence
+    if random_launch == False:
+        launch_angle = 0.0
+    elif point is None:
+        launch_angle = np.deg2rad(rng.uniform(-90, 90))
+    else:
+        launch_angle = np.deg2rad(-90 + 180 * point[3])
+    # Draw the uniform variates for all possible force samples
+    if point is None:
+        uniforms = rng.random(2 * len(change_points) + 3)
+    else:
+        first = 4 + direction_maximum
+        uniforms = point[first:first + 2 * len(change_points) + 3].copy()
+    # Draw the targets of the partial paths that end at anchor points
+    targets = np.full(len(change_points), np.nan)
+    if anchors is not None:
+        for index, lower, upper in anchors:
+            targets[change_points == index] = rng.uniform(lower, upper)
+    # Return the plan for the curve as the function output
+    return (y_start, direction, launch_angle, change_points, uniforms,
+            targets)
+
+def accelerator(n_curves,
+                first_curve,
+                key,
+                groups,
+                x_interval,
+                y_intervals,
+                convergence_points,
+                flat_state,
+                flat_value,
+                direction_maxima,
+                steps,
+                step_size,
+                change_range,
+                change_spacing,
+                change_ratios,
+                random_launch,
+                print_points,
+                perc,
+                progress_update,
+                engine,
+                points,
+                antithetic,
+                anchors,
+                accept,
+                deadline,
+                x_values,
+                right_convergence,
+                curves):
+    """
+    Generate curves in rounds of batches with one of the batch kernels.
+
+    This function draws the plans for all curves that still need to be
+    generated from their random streams and computes them in one batch,
+    either with the vectorized NumPy kernel or with the compiled kernel.
+    Curves that leave the y-axis interval are redrawn from their own
+    streams in the next round, until every requested curve index holds
+    a valid curve. Each curve belongs to a group of parameters, which
+    allows computing curves for many different parameter sets at once.
+
+    Parameters:
+    -----------
+    n_curves : int
+        The number of curves that are to be returned to the user. This
+        is simply the value that indicates how many curves are needed
+        for whatever goal they'll be used after being generated.
+
+    first_curve : int
+        The index of the first curve that is to be generated, which
+        selects the random streams of the generated curve indices.
+
+    key : numpy.ndarray
+        The two unsigned 64-bit integers that form the Philox key. The
+        key is identical for all curves and combined with the curve
+        index to select the stream of a specific curve.
+
+    groups : numpy.ndarray
+        The index of the parameter group of each curve, pointing into
+        the per-group parameters below, with one value per curve.
+
+    x_interval : list with two single floats
+        The x-axis interval for curves, as [left point, rigth point].
+        This range indicates over which x-axis span the measurements
+        for the curves should be done, i.e. the range of the curves.
+
+    y_intervals : list
+        The y-axis interval of each group, as [lower point, upper point].
+        This range indicates which y-axis window curves shouldn't leave
+        under any circumstances to make them still useful to the user.
+
+    convergence_points : list
+        The convergence point of each group, as [x-axis value, y-axis
+        value], or None for groups whose starting points on the y-axis
+        are sampled uniformly random from the group's y-axis interval.
+
+    flat_state : bool
+        The indicator whether the parameter start_force is set to a
+        value different from the default, None. If so, the curves
+        shouldn't deviate on the y-axis before the value determined by
+        start_force on the x-axis is reached.
+
+    flat_value : float or None
+        The x-axis point before which no y-axis deviation with regard to
+        the projectile's starting point should happen, on the linear
+        scale of the calculation, or None if no flat start is requested.
+
+    direction_maxima : list
+        The maximum number of gravity flips of each group. This value
+        determines the upper end of the range from which a number of
+        gravity direction change points is sample uniformly as integers.
+
+    steps : array-like
+        The x-axis measurement points on the linear scale of the
+        calculation, at which the y-axis values of the curves are taken.
+
+    step_size : float
+        The step size for the x-axis measurement points at which the
+        location of the projectile along the y-axis are to be measured.
+        Like the gravitational force, this value remains constant.
+
+    change_range : list
+        The x-axis percentiles below and above which no gravity flips
+        should take place, as [lower percentile, upper percentile].
+
+    change_spacing : int
+        The minimum space on the x-axis in full steps that is required
+        between gravitational direction changes, with hiher values
+        resulting in increased smoothness.
+
+    change_ratios : list
+        The change ratio of each group, or None for groups in which the
+        previous force doesn't limit the force of the next partial path.
+
+    random_launch : bool
+        The indicator whether no initial zero launch angle is necessary,
+        i.e. projectiles will start at random angles sampled uniformly
+        between -90 and 90 degrees for each curve separately.
+
+    print_points : list or None
+        The list of numbers of curves generated that mark a milestone
+        in a 10%-spaced progress scheme. This applies when 10 or more
         curves are to be generated, otherwise the parameter is None.
 
     perc : int or None
@@ -520,19 +4512,485 @@ def generator(n_curves,
         have been realised. Initialized as zero, this value is only used
         if less than 10 curves are to be generated by the tool.
 
+    engine : str
+        The batch kernel that computes the curves, as either "vectorized"
+        for NumPy array operations or "numba" for the compiled kernel.
+
+    points : numpy.ndarray or None
+        The quasi-random points of the first attempts of the curves, with
+        one row per curve, or None if all values are drawn independently
+        from the random streams of the curves. Retried attempts always
+        draw from the random streams.
+
+    antithetic : bool
+        The indicator whether each curve is later mirrored about its
+        starting point, in which case the y-axis interval is narrowed
+        so that the mirrored curve stays within the interval as well.
+
+    anchors : numpy.ndarray or None
+        The anchor points with one row per anchor point, as [index of
+        the measurement point, lower point, upper point] of the window
+        on the y-axis, or None if no anchor points are requested.
+
+    accept : callable or None
+        The acceptance test of the user, which is called with the shared
+        x-axis values and a batch of curves, or None for no test.
+
+    deadline : float or None
+        The time of the performance counter after which no further
+        attempts are started, leaving the unfinished curves incomplete,
+        or None for generating all curves regardless of the time. For
+        a deadline, each round only takes as many of the missing curves
+        as the observed rate allows to finish before the deadline.
+
+    x_values : numpy.ndarray
+        The x-axis measurement points that are returned to the user and
+        passed to the acceptance test.
+
+    right_convergence : bool
+        The indicator whether the curves are flipped before they are
+        returned to the user, and thus before they are tested.
+
+    curves : numpy.ndarray
+        The output array with one row per curve and one column per
+        x-axis measurement point, which is filled in place. Its type
+        sets the precision in which the curves are evaluated and stored.
+
+    Returns:
+    --------
+    curves : numpy.ndarray
+        The y-axis values of the generated curves, with one row per
+        curve and one column per x-axis measurement point.
+
+    print_points : list or None
+        The list of remaining progress milestones, see above.
+
+    perc : int or None
+        The percentage of progress that has been printed, see above.
+
+    progress_update : int
+        The number of curves for which progress was printed, see above.
+
+    attempts : int
+        The total number of curve attempts, including the ones that had
+        to be abandoned for leaving the y-axis interval.
+
+    completed : numpy.ndarray
+        The indicators whether each curve has been completed, which are
+        all True unless a deadline has stopped the generation early.
+
+    Attributes:
+    -----------
+    None
+    """
+    # Return right away if the deadline has passed before the start
+    if (deadline is not None) and (time.perf_counter() >= deadline):
+        return (curves, print_points, perc, progress_update, 0,
+                np.zeros(n_curves, dtype = bool))
+    # Create the random streams of all requested curve indices
+    rngs = [stream(key = key,
+                   index = index)
+            for index in range(first_curve, first_curve + n_curves)]
+    # Select the batch kernel for the requested engine, as the parallel
+    # kernel can't be entered by several threads of a pool at once
+    if (engine == "numba") and (threading.current_thread()
+                                is threading.main_thread()):
+        compute = kernel
+    elif engine == "numba":
+        compute = sequential
+    else:
+        compute = vectorizer
+    # Expand the per-group parameters into per-curve arrays
+    steps = np.asarray(steps, dtype = np.float64)
+    limits = np.asarray(y_intervals, dtype = np.float64)[groups]
+    ratios = np.asarray([0.0 if ratio == None else ratio
+                         for ratio in change_ratios],
+                        dtype = np.float64)[groups]
+    # Initialize the indices of missing curves
+    pending = np.arange(0, n_curves)
+    tried = np.zeros(n_curves, dtype = bool)
+    attempts = 0
+    size = n_curves if deadline is None else 64
+    begin = time.perf_counter()
+    while (len(pending) > 0) and (size > 0):
+        # Stop starting new rounds once the deadline has passed
+        if (deadline is not None) and (time.perf_counter() >= deadline):
+            break
+        # Hold back the later curves if a round would exceed the deadline
+        waiting = pending[size:]
+        pending = pending[0:size]
+        attempts = attempts + len(pending)
+        # Draw new plans for all missing curves from their streams
+        plans = [blueprint(rng = rngs[i],
+                           point = (None if (points is None) or tried[i]
+                                    else points[i]),
+                           x_interval = x_interval,
+                           y_interval = y_intervals[groups[i]],
+                           convergence_flag = (convergence_points[groups[i]]
+                                               == None),
+                           convergence_point = convergence_points[groups[i]],
+                           flat_state = flat_state,
+                           flat_value = flat_value,
+                           direction_maximum = direction_maxima[groups[i]],
+                           n_measure = len(steps),
+                           change_range = change_range,
+                           change_spacing = change_spacing,
+                           random_launch = random_launch,
+                           anchors = anchors)
+                 for i in pending]
+        # Draw all retried attempts from the random streams
+        tried[pending] = True
+        # Pad the variable-length plan parts into rectangular arrays
+        n_changes = np.asarray([len(plan[3]) for plan in plans],
+                               dtype = np.int64)
+        width = np.max(n_changes)
+        change_points = np.zeros((len(plans), width), dtype = np.int64)
+        uniforms = np.zeros((len(plans), 2 * width + 3))
+        targets = np.full((len(plans), width), np.nan)
+        for i in range(0, len(plans)):
+            change_points[i, 0:n_changes[i]] = plans[i][3]
+            uniforms[i, 0:len(plans[i][4])] = plans[i][4]
+            targets[i, 0:n_changes[i]] = plans[i][5]
+        # Compute the whole batch of curves with the batch kernel
+        accepted = np.zeros(len(plans), dtype = bool)
+        compute(rows = pending,
+                y_starts = np.asarray([plan[0] for plan in plans],
+                                      dtype = np.float64),
+                directions = np.asarray([plan[1] for plan in plans],
+                                        dtype = np.int64),
+                launch_angles = np.asarray([plan[2] for plan in plans],
+                                           dtype = np.float64),
+                change_points = change_points,
+                n_changes = n_changes,
+                uniforms = uniforms,
+                targets = targets,
+                steps = steps,
+                step_size = float(step_size),
+                x_end = float(x_interval[1]),
+                y_intervals = limits[pending],
+                change_ratios = ratios[pending],
+                flat_state = flat_state,
+                antithetic = antithetic,
+                curves = curves,
+                accepted = accepted)
+        # Apply the acceptance test of the user to the valid curves
+        if (accept is not None) and np.any(accepted):
+            screened = screening(accept = accept,
+                                 x_values = x_values,
+                                 curves = curves[pending[accepted]],
+                                 y_interval = y_intervals[0],
+                                 right_convergence = right_convergence,
+                                 antithetic = antithetic)
+            accepted[accepted] = screened
+        # Keep only the rejected curve indices for the next round
+        pending = np.concatenate([pending[~accepted], waiting])
+        # Size the next round by the remaining time and the observed rate
+        if deadline is not None:
+            now = time.perf_counter()
+            rate = attempts / max(now - begin, 1e-9)
+            size = min(2 * size, int(rate * (deadline - now)))
+        # Print progress updates to inform about remaining time
+        progress_output = progress(done_curves = n_curves - len(pending),
+                                   curve_request = n_curves,
+                                   print_points = print_points,
+                                   perc = perc,
+                                   progress_update = progress_update)
+        print_points, perc, progress_update = progress_output
+    completed = np.ones(n_curves, dtype = bool)
+    completed[pending] = False
+    return curves, print_points, perc, progress_update, attempts, completed
+
+def progress(done_curves,
+             curve_request,
+             print_points,
+             perc,
+             progress_update):
+    """
+    Print progress updates for curves that are generated in batches.
+
+    This function prints the same progress updates as the per-curve
+    generation, i.e. 10%-spaced milestones for 10 or more curves and a
+    running count otherwise, for the case in which a whole batch of
+    curves is completed at once and several updates might be due.
+
+    Parameters:
+    -----------
     done_curves : int
         The overall number of viable curves that satisfy the constraints
-        and have been realized. This value is returned and passed again
-        at each call of this function, keeping on overview of the total
-        realized number to print the correct progress information.
+        and have been realized, which is compared to the milestones.
+
+    curve_request : int
+        The initial number of curves that are returned to the user,
+        which determines which kind of progress updates is printed.
+
+    print_points : list or None
+        The list of numbers of curves generated that mark a milestone
+        in a 10%-spaced progress scheme. This applies when 10 or more
+        curves are to be generated, otherwise the parameter is None.
+
+    perc : int or None
+        The percentage in 10% steps indicating how much progress in
+        generating viable curves that satisfy the constraints has been
+        realised. This applies when 10 or more curves are to be
+        generated, otherwise the parameter is None.
+
+    progress_update : int
+        The number of viable curves that satisfy the constraints and
+        have been realised. Initialized as zero, this value is only used
+        if less than 10 curves are to be generated by the tool.
+
+    Returns:
+    --------
+    print_points : list or None
+        The list of remaining progress milestones, see above.
+
+    perc : int or None
+        The percentage of progress that has been printed, see above.
+
+    progress_update : int
+        The number of curves for which progress was printed, see above.
+
+    Attributes:
+    -----------
+    None
+    """
+    if curve_request >= 10:
+        # Print every 10%-milestone that has been passed
+        while (len(print_points) > 0) and (done_curves > print_points[0]):
+            perc = perc + 10
+            print("%d %%" % perc)
+            print_points = print_points[1:len(print_points)]
+    else:
+        # Print the count for every newly finished curve
+        while progress_update < done_curves:
+            progress_update = progress_update + 1
+            print("%d curves generated" % progress_update)
+    return print_points, perc, progress_update
+
+def preparation(x_interval,
+                n_measure,
+                log_scale,
+                change_range,
+                change_spacing,
+                start_force):
+    """
+    Set up the measurement points and settings shared by all curves.
+
+    This function computes the x-axis measurement points on the linear
+    scale of the calculation, fills in the defaults for the change point
+    settings, and converts a requested flat start into the x-axis value
+    on the linear scale at which the first deviation can take place. For
+    a logarithmic scale, the returned x-axis values are computed here
+    once and shared by all curves, while the curves themselves are
+    calculated on the equally-spaced linear steps of the same indices.
+
+    Parameters:
+    -----------
+    x_interval : list with two single floats
+        The x-axis interval for curves, as [left point, rigth point].
+        This range indicates over which x-axis span the measurements
+        for the curves should be done, i.e. the range of the curves.
+
+    n_measure : int
+        The number of equally-spaced measurement points on the x-axis
+        for each curve. If the parameter 'log_scale' is set to True, the
+        points will be equally-spaced only if depicted on a logarithmic
+        x-axis. Otherwise, they will be equally-spaced on linear scales.
+
+    log_scale : bool
+        The indicator whether the measurements on the x-axis should be
+        on a logarithmic scale, while retaining the behavior of a code
+        calculation for a linear scale. This means that the steps will
+        be equally-spaced when displayed with a logarithmic x-axis.
+
+    change_range : list or None
+        The x-axis percentiles below and above which no gravity flips
+        should take place, as [lower percentile, upper percentile], or
+        None to use the default of the 10th and 90th percentile.
+
+    change_spacing : int or None
+        The minimum space on the x-axis in full steps that is required
+        between gravitational direction changes, or None to use the
+        default spacing of one step.
+
+    start_force : float or None
+        The x-axis point before which no y-axis deviation with regard to
+        the projectile's starting point should happen. This is useful
+        if a function perturbation should only happen after a certain
+        point, which can be specified by setting this parameter.
+
+    Returns:
+    --------
+    steps : numpy.ndarray
+        The x-axis measurement points on the linear scale of the
+        calculation, at which the y-axis values of the curves are taken.
+
+    offsets : numpy.ndarray
+        The horizontal displacements of the measurement points from the
+        first point, i.e. multiples of the step size.
+
+    step_size : float
+        The step size for the x-axis measurement points at which the
+        location of the projectile along the y-axis are to be measured.
+
+    change_range : list
+        The x-axis percentiles below and above which no gravity flips
+        should take place, with the default filled in if necessary.
+
+    change_spacing : int
+        The minimum space between gravitational direction changes, with
+        the default filled in if necessary.
+
+    flat_state : bool
+        The indicator whether the parameter start_force is set to a
+        value different from the default, None. If so, the curves
+        shouldn't deviate on the y-axis before the value determined by
+        start_force on the x-axis is reached.
+
+    flat_value : float or None
+        The x-axis point before which no y-axis deviation with regard to
+        the projectile's starting point should happen, on the linear
+        scale of the calculation, or None if no flat start is requested.
+
+    x_values : numpy.ndarray
+        The x-axis measurement points that are returned to the user, i.e.
+        logarithmically spaced points if 'log_scale' is True and the
+        linear steps of the calculation otherwise.
+
+    Attributes:
+    -----------
+    None
+    """
+    # If no change range is given, set limits to 10% and 90%
+    if change_range == None:
+        change_range = [0.1, 0.9]
+    # If no change spacing is given, set the spacing to 1
+    if change_spacing == None:
+        change_spacing = 1
+    # Calculate both the step size and measurement locations
+    difference = np.diff([x_interval[0], x_interval[1]])[0]
+    step_size = np.divide(difference, n_measure - 1)
+    offsets = np.multiply(np.arange(0, n_measure), step_size)
+    steps = x_interval[0] + offsets
+    # Compute the x-axis values that are returned to the user once
+    if log_scale == True:
+        x_values = logarithmic(x_interval = x_interval,
+                               n_measure = n_measure)
+    else:
+        x_values = steps
+    # Set an indicator for a requested flat state at the start
+    if start_force == None:
+        flat_state = False
+        flat_value = None
+    else:
+        flat_state = True
+        # If for log-scale, recalculate the flat state ending
+        if log_scale == True:
+            log_cut = np.min(np.where(x_values > start_force)[0])
+            start_force = steps[log_cut]
+        flat_value = start_force
+    return (steps, offsets, step_size, change_range, change_spacing,
+            flat_state, flat_value, x_values)
+
+def anchorage(anchors,
+              x_interval,
+              x_values,
+              n_measure,
+              flat_state,
+              flat_value,
+              right_convergence):
+    """
+    Place the anchor points of the user onto the measurement points.
+
+    This function moves each anchor point to the nearest measurement
+    point on the x-axis, which becomes a change point of every curve, and
+    converts its tolerance into a window on the y-axis. The partial path
+    that ends at such a change point aims at a target in the window,
+    so that all curves pass through the windows by construction. Anchors
+    are kept after the end of a requested flat start.
+
+    Parameters:
+    -----------
+    anchors : list or None
+        The anchor points of the user as (x-axis value, y-axis value,
+        tolerance), or None if no anchor points are requested.
+
+    x_interval : list with two single floats
+        The x-axis interval for curves, as [left point, rigth point].
+
+    x_values : numpy.ndarray
+        The x-axis measurement points that are returned to the user, on
+        the scale on which the anchor points are given.
+
+    n_measure : int
+        The number of measurement points on the x-axis for each curve.
+
+    flat_state : bool
+        The indicator whether a flat start is requested, in which case
+        the anchor points are placed after the end of the flat start.
+
+    flat_value : float or None
+        The x-axis point before which no y-axis deviation should happen,
+        on the linear scale of the calculation, or None.
+
+    right_convergence : bool
+        The indicator whether the curves are flipped before they are
+        returned to the user, in which case the measurement points of
+        the anchor points are mirrored for the calculation.
+
+    Returns:
+    --------
+    anchors : numpy.ndarray or None
+        The anchor points with one row per anchor point, as [index of
+        the measurement point, lower point, upper point] of the window,
+        or None if no anchor points are requested.
+
+    Attributes:
+    -----------
+    None
+    """
+    if anchors == None:
+        return None
+    # Keep the anchors after the first point and a flat start
+    earliest = 1
+    if flat_state == True:
+        diff_ratio = np.divide(flat_value - x_interval[0],
+                               x_interval[1] - x_interval[0])
+        earliest = int(np.multiply(n_measure, diff_ratio)) + 1
+    placed = np.empty((len(anchors), 3))
+    for i in range(0, len(anchors)):
+        x_anchor, y_anchor, tolerance = anchors[i]
+        index = np.argmin(np.abs(np.asarray(x_values) - x_anchor))
+        # Mirror the index if the curves are flipped after the calculation
+        if right_convergence == True:
+            index = n_measure - 1 - index
+        placed[i] = [max(index, earliest),
+                     y_anchor - tolerance,
+                     y_anchor + tolerance]
+    # Check that no two anchors share the same measurement point
+    if len(np.unique(placed[:, 0])) != len(placed):
+        print('ERROR: anchors: Must be placed at different measurement ' +
+              'points, i.e. further apart or with a larger n_measure')
+        sys.exit()
+    return placed
+
+def milestones(n_curves):
+    """
+    Set up the progress updates for the requested number of curves.
+
+    This function sets the 10%-based printout milestones for progress
+    updates if 10 or more curves are requested, and otherwise prepares
+    the running count of generated curves that is printed instead.
+
+    Parameters:
+    -----------
+    n_curves : int
+        The number of curves that are to be returned to the user. This
+        is simply the value that indicates how many curves are needed
+        for whatever goal they'll be used after being generated.
 
     Returns:
     --------
-    curves: list
-        The generated curves in a list, with one list element per curve.
-        Each list elemenet contains two rows, the first for the x-axis
-        measurement points and the second for the y-axis measurements.
-
     print_points : list or None
         The list of numbers of curves generated that mark a milestone
         in a 10%-spaced progress scheme. This applies when 10 or more
@@ -549,174 +5007,21 @@ def generator(n_curves,
         have been realised. Initialized as zero, this value is only used
         if less than 10 curves are to be generated by the tool.
 
-    done_curves : int
-        The overall number of viable curves that satisfy the constraints
-        and have been realized. This value is returned and passed again
-        at each call of this function, keeping on overview of the total
-        realized number to print the correct progress information.
-
     Attributes:
     -----------
     None
     """
-    # Initialize an empty list for storing the curves later
-    curves = []
-    # Loop over the required total number of separate curves
-    for curve in range(0, n_curves):
-        # If no convergence point is given sample a random one
-        if convergence_flag == True:
-            y_convergence = uniform(y_interval[0], y_interval[1])
-            convergence_point = [x_interval[0], y_convergence]
-            if log_scale == True:
-                convergence_point[0] = np.log10(convergence_point[0])
-        elif log_scale == True:
-             convergence_point[0] = np.log10(convergence_point[0])
-        # Reset the start force if a flat state is requested
-        if flat_state == True:
-            start_force = flat_value
-        # Generate the random force direction change points
-        allowed = range(0, np.random.randint(0, direction_maximum + 1))
-        if start_force == None:
-            lower_range = int(np.multiply(len(steps), change_range[0]))
-        else:
-            diff_a = start_force - x_interval[0]
-            diff_b = x_interval[1] - x_interval[0]
-            diff_ratio = np.divide(diff_a, diff_b)
-            flat_change = int(np.multiply(len(steps), diff_ratio))
-            lower_standard = int(np.multiply(len(steps), change_range[0]))
-            lower_range = np.maximum(lower_standard, flat_change)
-        higher_range = int(np.multiply(len(steps), change_range[1]))
-        sample_range = range(lower_range, higher_range)
-        sample_number = np.random.randint(0, direction_maximum + 1)
-        # Sample change points with the defined minimum space between
-        change_points = []
-        # Add the flat-start change point to the beginning
-        if start_force != None:
-            # Adapt the change points to allow the flat start
-            change_points.append([flat_change])
-        valid_counter = 0
-        while valid_counter < sample_number:
-            change_sample = sample(sample_range, 1)
-            if np.asarray([np.abs(np.diff((change_points[i][0],
-                                           change_sample[0])))[0]
-                           >= change_spacing
-                           for i in range(0, len(change_points))]).all():
-                change_points.append(change_sample)
-                valid_counter = valid_counter + 1
-        change_points = np.sort(np.asarray(change_points).flatten())
-        # Generate a random initial direction for the force
-        direction = np.random.choice([-1, 1])
-        # Set the particle's velocity to an arbitrary value
-        velocity = 1.0
-        # Set the angle to zero for a left-side convergence
-        if random_launch == True:
-            launch_angle = np.deg2rad(uniform(-90, 90))
-        else:
-            launch_angle = 0.0
-        # Get the maximum force to stay within the intervals
-        rest_time = np.divide(x_interval[1], velocity  )
-        max_range = y_interval[np.maximum(0, direction)] - convergence_point[1]
-        abs_max = np.multiply(np.negative(direction), (max_range))
-        spread = np.multiply(velocity, np.sin(launch_angle)) - abs_max
-        force_max = np.divide(np.multiply(2, spread), np.square(rest_time))
-        # Randomly sample the force depending on the maximum
-        force = uniform(0, force_max)
-        # Set the convergence point as the first start point
-        start_point = convergence_point
-        # Initialize a curve path with one point and a counter
-        curve_path = [convergence_point]
-        counter = 0
-        # Initialize the beginning as the last visited point
-        last_point = convergence_point
-        # Loop over change points to calculate partial curves
-        for part in range(0, len(change_points) + 1):
-            # Set the steps depending on the process' status
-            if not list(change_points):
-                partial_steps = steps[counter:len(steps)]
-            else:
-                partial_steps = steps[counter:change_points[0] + 1]
-                counter = change_points[0]
-                change_points = change_points[1:len(change_points)]
-                # Sample a random force for the partial curve
-                scale_factor = np.divide(len(steps), len(partial_steps))
-                force_max = np.multiply(force_max, scale_factor)
-                if start_force == None:
-                    if (change_ratio == None) or (part == 0):
-                        force = uniform(0, force_max)
-                    elif save_force == 0.0:
-                        force = uniform(0, force_max)
-                    else:
-                        #limiter = np.minimum(save_force, force_max)
-                        #force = uniform(0, np.multiply(limiter, change_ratio))
-
-                        ratio_product = np.multiply(save_force, change_ratio)
-                        limiter = np.minimum(force_max, ratio_product)
-                        force = uniform(0, limiter)
-
-                else:
-                    force = 0.0
-                    start_force = None
-            # Save the force used to generate the partial curve
-            save_force = force
-            # Calculate the trajectory for the partial curve
-            output = trajectory(force = force,
-                                velocity = velocity,
-                                direction = direction,
-                                step_size = step_size,
-                                start_point = start_point,
-                                launch_angle = launch_angle,
-                                partial_steps = partial_steps)
-            # Assign the values from the trajectory function
-            partial_path, last_point, launch_angle, velocity = output[0:4]
-            # Update parameters for the next loop iteration
-            start_point = last_point
-            direction = -direction
-            force = np.negative(force)
-
-
-            # Get the maximum force to stay within the intervals
-            rest_time = np.divide(x_interval[1] - last_point[0], velocity)
-            max_range = y_interval[np.maximum(0, direction)] - last_point[1]
-            abs_max = np.multiply(np.negative(direction), (max_range))
-            spread = np.multiply(velocity, np.sin(launch_angle)) - abs_max
-            force_max = np.divide(np.multiply(2, spread), np.square(rest_time))
-            # Randomly sample the force depending on the maximum
-            if change_ratio == None:
-                        force = uniform(0, force_max)
-            elif save_force == 0.0:
-                force = uniform(0, force_max)
-            else:
-                limiter = np.minimum(save_force, force_max)
-                force = uniform(0, np.multiply(limiter, change_ratio))
-
-
-            # Convert the partial path into a congestible format
-            partial_path = np.asarray(partial_path)
-            if not partial_path.ndim < 2:
-                partial_path = partial_path.reshape(partial_path.shape[0],
-                                                    partial_path.shape[1])
-                curve_path = np.vstack((curve_path, partial_path))
-        # Append the computed curve to the complete set of curves
-        append_point = np.asarray(last_point).T
-        append_path = curve_path[1:len(curve_path), :]
-        curve_path = np.vstack((append_path, append_point))
-        curves.append(curve_path)
-        # Delete curves that fall outside of the y-axis interval
-        curves, delete_flag = deletion(curves = curves,
-                                       y_interval = y_interval,
-                                       n_curves = n_curves)
-        # Print progress updates to inform about remaining time
-        done_curves = done_curves + len(curves)
-        if curve_request >= 10:
-            if len(print_points) > 0:
-                if len(curves) + done_curves >= print_points[0]:
-                    perc = perc + 10
-                    print("%d %%" % perc)
-                    print_points = print_points[1:len(print_points)]
-        elif (len(curves) > 0) and (delete_flag is False):
-            progress_update = progress_update + 1
-            print("%d curves generated" % progress_update)
-    return curves, print_points, perc, progress_update, done_curves
+    if n_curves >= 10:
+        # Set 10%-based printout milestones for progress updates
+        iter_range = np.array_split(np.arange(0, n_curves), 10)
+        print_points = [entry[-1] for entry in iter_range]
+        perc = 0
+        progress_update = 0
+    else:
+        progress_update = 0
+        print_points = None
+        perc = None
+    return print_points, perc, progress_update
 
 def logarithmic(x_interval,
                 n_measure):
@@ -776,13 +5081,170 @@ def logarithmic(x_interval,
     # Return the steps and step size as the function output
     return steps
 
+def keychain(seed):
+    """
+    Derive the key shared by the random streams of all curve indices.
+
+    This function turns the user-provided seed into the 128-bit key of
+    the counter-based Philox generator. The seed is passed through a
+    seed sequence first, so that small and similar seeds still lead to
+    well-mixed keys. Without a seed, fresh entropy is used instead.
+
+    Parameters:
+    -----------
+    seed : int >= 0 or None
+        The seed that keys the counter-based random number generators of
+        all curves. Each curve index draws from its own stream, so that
+        the same seed always reproduces the same curve for a given index.
+        If no seed is provided, a fresh seed is drawn from the system.
+
+    Returns:
+    --------
+    key : numpy.ndarray
+        The two unsigned 64-bit integers that form the Philox key. The
+        key is identical for all curves and combined with the curve
+        index to select the stream of a specific curve.
+
+    Attributes:
+    -----------
+    None
+    """
+    # Mix the seed into two 64-bit words for the Philox key
+    key = np.random.SeedSequence(seed).generate_state(2, dtype = np.uint64)
+    # Return the key as the function output
+    return key
+
+def stream(key,
+           index):
+    """
+    Create the counter-based random stream of a single curve index.
+
+    This function returns a random number generator that is addressed
+    by the shared key and the index of a curve. The curve index is put
+    into the upper half of the Philox counter, which leaves each curve
+    2^128 blocks of random numbers before streams could ever overlap.
+    As a result, any curve can be regenerated on its own, and disjoint
+    index ranges can be generated independently, e.g. on separate nodes.
+
+    Parameters:
+    -----------
+    key : numpy.ndarray
+        The two unsigned 64-bit integers that form the Philox key. The
+        key is identical for all curves and combined with the curve
+        index to select the stream of a specific curve.
+
+    index : int >= 0
+        The index of the curve within the seeded set of curves. All of
+        the random values for this curve, including the ones needed for
+        retries after a rejection, are drawn from the same stream.
+
+    Returns:
+    --------
+    rng : numpy.random.Generator
+        The random number generator from which all random values of the
+        curve with the given index are drawn, starting at the beginning
+        of its stream when this function is called.
+
+    Attributes:
+    -----------
+    None
+    """
+    # Place the curve index into the upper half of the counter
+    counter = [0, 0, index, 0]
+    # Create the generator for the stream of the given index
+    rng = np.random.Generator(np.random.Philox(counter = counter,
+                                               key = key))
+    # Return the random stream as the function output
+    return rng
+
+def quasirandom(key,
+                n_curves,
+                first_curve,
+                direction_maximum,
+                n_anchors,
+                sampling):
+    """
+    Draw the quasi-random points of the first attempts of the curves.
+
+    This function returns one point in the unit hypercube per requested
+    curve, from which the blueprint() function takes the random values
+    of the curve's first attempt. The points are either taken from a
+    scrambled Sobol sequence at the positions of the curve indices, or
+    from a Latin hypercube over the requested curves, with a scrambling
+    that is drawn from a separate stream under the key of the curves.
+    The Latin hypercube is seeded with the range of the curve indices as
+    well, so that different slices of a set get different hypercubes.
+
+    Parameters:
+    -----------
+    key : numpy.ndarray
+        The two unsigned 64-bit integers that form the Philox key, which
+        also selects the scrambling of the quasi-random points.
+
+    n_curves : int
+        The number of curves for which points are drawn.
+
+    first_curve : int
+        The index of the first curve, which is the position of the first
+        point in the Sobol sequence and part of the seed of the Latin
+        hypercube.
+
+    direction_maximum : int
+        The largest maximum number of gravity flips of the curves, which
+        determines the number of values that a plan can take from its
+        point, including the end of a flat start and the force variates.
+
+    n_anchors : int
+        The number of anchor points, each of which adds a change point
+        and thus two force variates to every plan.
+
+    sampling : str
+        The way in which the points are drawn, as either "random" for no
+        quasi-random points, "sobol" or "lhs".
+
+    Returns:
+    --------
+    points : numpy.ndarray or None
+        The quasi-random points with one row per curve, or None if the
+        sampling is "random".
+
+    Attributes:
+    -----------
+    None
+    """
+    if sampling == "random":
+        return None
+    # Count the starting point, the numbers, direction and angle, the
+    # first draws of the change points and the force variates
+    n_changes = direction_maximum + 1 + n_anchors
+    dimension = 4 + direction_maximum + 2 * n_changes + 3
+    # Use a stream next to the ones of the curves for the scrambling
+    rng = np.random.Generator(np.random.Philox(counter = [0, 0, 0, 1],
+                                               key = key))
+    scrambling = int(rng.integers(0, 2 ** 63))
+    if sampling == "sobol":
+        sampler = qmc.Sobol(d = dimension,
+                            scramble = True,
+                            seed = scrambling)
+        if first_curve > 0:
+            sampler.fast_forward(first_curve)
+    else:
+        # Draw a separate hypercube for every range of curve indices
+        entropy = np.random.SeedSequence([scrambling, first_curve, n_curves])
+        sampler = qmc.LatinHypercube(d = dimension,
+                                     seed = int(entropy.generate_state(1)[0]))
+    points = sampler.random(n_curves)
+    return points
+
 def trajectory(force,
                velocity,
                direction,
-               step_size,
                start_point,
                launch_angle,
-               partial_steps):
+               partial_steps,
+               offsets,
+               curve,
+               scratch):
     """
     Generate a partial trajectory of a particle with constant force.
 
@@ -791,6 +5253,8 @@ def trajectory(force,
     the trajectory has to be calculated. The primary inputs for this
     computation are the gravitational magnitude, the initial velocity,
     the starting point, the launch angle, and the gravity direction.
+    The y-axis values are written directly into the provided part of
+    the curve's output row, using in-place operations only.
 
     Parameters:
     -----------
@@ -810,11 +5274,6 @@ def trajectory(force,
         partial trajectory, i.e. an either positive or negative value
         to indicate in which direction a vertical force is applied.
 
-    step_size : float
-        The step size for the x-axis measurement points at which the
-        location of the projectile along the y-axis are to be measured.
-        Like the gravitational force, this value remains constant.
-
     start_point : list with two single floats
         The starting point of the trajectoty calculation, i.e. the
         point from which the projectile starts its flight with a given
@@ -825,18 +5284,26 @@ def trajectory(force,
         calculation starts its path, i.e. the firing angle from which
         the projectile is accelerated to build a curve path.
 
-    partial_steps : list of single floats
+    partial_steps : numpy.ndarray
         The x-axis measurement points at which the location of the
         projectile along the y-axis are to be measured for the partial
         trajectory for the given part of the curve calculation.
 
+    offsets : numpy.ndarray
+        The horizontal displacements of the measurement points from the
+        starting point, with the same length as 'partial_steps'.
+
+    curve : numpy.ndarray
+        The part of the curve's output row that corresponds to the
+        measurement points in 'partial_steps', which is overwritten
+        with the y-axis values of the partial trajectory.
+
+    scratch : numpy.ndarray
+        The work space for intermediate results, with the same length
+        as 'partial_steps', which is overwritten by this function.
+
     Returns:
     --------
-    points : list of float tuples
-        The x-axis and y-axis values for each given x-axis point of
-        measurement that is provided to the function, as a list with
-        list elements of the form [x-axis value, y-axis value].
-
     last_point : list of two single floats
         The x-axis and y-axis value of the particle's final location at
         the end of the calculation, as [x-axis value, y-axis value]. If
@@ -860,44 +5327,537 @@ def trajectory(force,
     -----------
     None
     """
-    # Initialize the horizontal displacement of the particle
-    horizontal_displacement = [0.0]
     # Calculate the first horizontal and vertical velocities
     horizontal_velocity = np.multiply(velocity, np.cos(launch_angle))
-    vertical_velocity = np.multiply(velocity, np.sin(launch_angle))
-    # Save the initial velocity for consecutive calculations
-    start_velocity = velocity
-    # Initialize a list for storing the measurement points
-    points = [start_point]
-    # Loop over the number of steps minus the initial step
-    for i in range(1, len(partial_steps)):
-        # Get the horizontal distance, displacement and time
-        distance = partial_steps[i]
-        horizontal_displacement = horizontal_displacement + step_size
-        time = np.divide(horizontal_displacement, horizontal_velocity)
-        # Calculate the vertical velocity and displacement
-        interim = np.multiply(start_velocity, np.sin(launch_angle))
-        vertical_velocity = interim - np.multiply(force, time)
-        velocity_part = np.multiply(start_velocity,
-                                    np.multiply(np.sin(launch_angle), time))
-        force_part = np.multiply(0.5, np.multiply(force, np.square(time)))
-        vertical_displacement = np.negative(velocity_part - force_part)
-        # Calculate the total velocity at the given point
+    interim = np.multiply(velocity, np.sin(launch_angle))
+    # Get the flight time at each measurement point in place
+    np.divide(offsets, horizontal_velocity, out = curve)
+    time = np.divide(offsets[-1], horizontal_velocity)
+    half_force = np.multiply(0.5, force)
+    # Calculate the vertical displacement from the flight times
+    np.multiply(curve, half_force, out = scratch)
+    np.subtract(scratch, interim, out = scratch)
+    np.multiply(curve, scratch, out = scratch)
+    # Turn the displacements into the y-axis measurement points
+    np.multiply(scratch, direction, out = curve)
+    np.add(curve, start_point[1], out = curve)
+    curve[0] = start_point[1]
+    # Calculate both the final velocity and impact angle
+    vertical_velocity = interim - np.multiply(force, time)
+    if len(curve) > 1:
         velocity = np.sqrt(np.square(horizontal_velocity)
                            + np.square(vertical_velocity))
-        # Append the current measurement point to the list
-        direction_displacement = np.multiply(direction, vertical_displacement)
-        points.append([distance, start_point[1] + direction_displacement])
-    # Calculate both the final velocity and impact angle
-    final_velocity = np.sqrt(np.square(horizontal_velocity)
-                             + np.square(vertical_velocity))
     impact_angle = np.arctan(np.divide(np.negative(vertical_velocity),
                              horizontal_velocity))
-    # Separate the last measurement point from the points
-    last_point = points[-1]
-    points = points[0:-1]
-    # Return the points, last point, angle and velocity
-    return points, last_point, impact_angle, velocity
+    # Keep the last measurement point at the precision of the state
+    if len(curve) > 1:
+        displacement = np.multiply(time, np.multiply(time, half_force)
+                                   - interim)
+        last_y = np.multiply(displacement, direction) + start_point[1]
+    else:
+        last_y = start_point[1]
+    last_point = [partial_steps[-1], last_y]
+    # Return the last point, angle and velocity
+    return last_point, impact_angle, velocity
+
+def kernel(rows,
+           y_starts,
+           directions,
+           launch_angles,
+           change_points,
+           n_changes,
+           uniforms,
+           targets,
+           steps,
+           step_size,
+           x_end,
+           y_intervals,
+           change_ratios,
+           flat_state,
+           antithetic,
+           curves,
+           accepted):
+    """
+    Compute a batch of planned curves in one pass over the curves.
+
+    This function carries out the per-curve loop of the generator()
+    function together with the trajectory() function for a batch of
+    curve plans, writing each curve directly into its row of the output
+    array. It is written in plain loops over scalars so that Numba can
+    compile it into machine code, with the outer loop over the curves
+    running in parallel. Each curve is marked as accepted if it stays
+    within the y-axis interval at all of its measurement points, and it
+    is abandoned at the first point that leaves the y-axis interval.
+
+    Parameters:
+    -----------
+    rows : numpy.ndarray
+        The row indices of the output array into which the curves of the
+        batch are written, with one index per curve plan.
+
+    y_starts : numpy.ndarray
+        The y-axis values from which the projectiles start their flight,
+        with one value per curve plan.
+
+    directions : numpy.ndarray
+        The initial directions of gravitational influence as integers
+        from the set {-1, 1}, with one value per curve plan.
+
+    launch_angles : numpy.ndarray
+        The launch angles with which the projectiles start their flight,
+        with one value per curve plan.
+
+    change_points : numpy.ndarray
+        The sorted change point indices of each curve plan, padded with
+        zeros to the largest number of change points in the batch.
+
+    n_changes : numpy.ndarray
+        The number of valid change points in each row of the parameter
+        'change_points', with one value per curve plan.
+
+    uniforms : numpy.ndarray
+        The uniform variates for the force samples of each curve plan,
+        padded with zeros to the largest number of variates in the batch.
+
+    targets : numpy.ndarray
+        The y-axis values at which the partial paths that end at anchor
+        points are aimed, padded like 'change_points', with NaN for the
+        change points that aren't anchor points.
+
+    steps : numpy.ndarray
+        The x-axis measurement points on the linear scale of the
+        calculation, at which the y-axis values of the curves are taken.
+
+    step_size : float
+        The step size for the x-axis measurement points at which the
+        location of the projectile along the y-axis are to be measured.
+
+    x_end : float
+        The right end of the x-axis interval, from which the remaining
+        flight time is calculated to bound the sampled forces.
+
+    y_intervals : numpy.ndarray
+        The y-axis interval of each curve plan, as one row with [lower
+        point, upper point] per curve plan. This range indicates which
+        y-axis window curves shouldn't leave under any circumstances.
+
+    change_ratios : numpy.ndarray
+        The value by which the previous force is multiplied to limit the
+        next force, with a value of zero indicating that no ratio is set,
+        with one value per curve plan.
+
+    flat_state : bool
+        The indicator whether the first change point marks the end of a
+        flat start, in which case the first partial path has zero force.
+
+    antithetic : bool
+        The indicator whether each curve is later mirrored about its
+        starting point, in which case the y-axis interval is narrowed
+        so that the mirrored curve stays within the interval as well.
+
+    curves : numpy.ndarray
+        The output array with one row per curve and one column per
+        x-axis measurement point, which is modified in place. Its type
+        sets the precision in which the curves are stored and checked.
+
+    accepted : numpy.ndarray
+        The boolean output array marking the curves that stay within
+        the y-axis interval, which is modified in place.
+
+    Returns:
+    --------
+    None
+
+    Attributes:
+    -----------
+    None
+    """
+    n_measure = steps.shape[0]
+    # Loop over the curve plans of the batch in parallel
+    for curve in prange(rows.shape[0]):
+        row = rows[curve]
+        y_interval = y_intervals[curve]
+        change_ratio = change_ratios[curve]
+        # Set the initial state of the projectile from the plan
+        start_y = y_starts[curve]
+        # Narrow the checked interval so that the mirror stays inside
+        low = y_interval[0]
+        high = y_interval[1]
+        if antithetic:
+            low = max(low, 2 * start_y - y_interval[1])
+            high = min(high, 2 * start_y - y_interval[0])
+        direction = directions[curve]
+        launch_angle = launch_angles[curve]
+        velocity = 1.0
+        # Get the maximum force to stay within the intervals
+        rest_time = x_end / velocity
+        if direction > 0:
+            max_range = y_interval[1] - start_y
+        else:
+            max_range = y_interval[0] - start_y
+        abs_max = -direction * max_range
+        spread = velocity * math.sin(launch_angle) - abs_max
+        force_max = 2 * spread / rest_time ** 2
+        force = force_max * uniforms[curve, 0]
+        save_force = 0.0
+        flat_pending = flat_state
+        counter = 0
+        valid = (start_y >= low) and (start_y <= high)
+        # Loop over change points to calculate partial curves
+        n_parts = n_changes[curve] + 1
+        for part in range(0, n_parts):
+            # Abandon the curve as soon as it leaves the y-axis interval
+            if not valid:
+                break
+            if part < n_parts - 1:
+                end = change_points[curve, part]
+                # Sample a random force for the partial curve
+                force_max = force_max * (n_measure / (end - counter + 1))
+                if flat_pending:
+                    force = 0.0
+                    flat_pending = False
+                elif (change_ratio == 0.0) or (part == 0):
+                    force = force_max * uniforms[curve, 2 * part + 1]
+                elif save_force == 0.0:
+                    force = force_max * uniforms[curve, 2 * part + 1]
+                else:
+                    limiter = min(force_max, save_force * change_ratio)
+                    force = limiter * uniforms[curve, 2 * part + 1]
+                # Aim the partial path at the target of an anchor point
+                target = targets[curve, part]
+                if not math.isnan(target):
+                    horizontal = velocity * math.cos(launch_angle)
+                    interim = velocity * math.sin(launch_angle)
+                    time = ((end - counter) * step_size) / horizontal
+                    rise = (target - start_y) * direction
+                    force = 2 * (rise / time + interim) / time
+            else:
+                end = n_measure - 1
+            save_force = force
+            # Calculate the trajectory for the partial curve
+            horizontal_velocity = velocity * math.cos(launch_angle)
+            interim = velocity * math.sin(launch_angle)
+            half_force = 0.5 * force
+            vertical_velocity = interim
+            end_velocity = velocity
+            end_y = start_y
+            curves[row, counter] = start_y
+            for i in range(counter + 1, end + 1):
+                time = ((i - counter) * step_size) / horizontal_velocity
+                vertical_velocity = interim - force * time
+                end_velocity = math.sqrt(horizontal_velocity ** 2
+                                         + vertical_velocity ** 2)
+                displacement = time * (time * half_force - interim)
+                end_y = (displacement * direction) + start_y
+                curves[row, i] = end_y
+                # Check the bounds on the stored value of the curve
+                stored = curves[row, i]
+                if not ((stored >= low) and (stored <= high)):
+                    valid = False
+                    break
+            # Update parameters for the next loop iteration
+            launch_angle = math.atan(-vertical_velocity / horizontal_velocity)
+            velocity = end_velocity
+            start_y = end_y
+            direction = -direction
+            counter = end
+            # Skip the force for the next part after the final part
+            if part < n_parts - 1:
+                # Get the maximum force to stay within the intervals
+                rest_time = (x_end - steps[end]) / velocity
+                if direction > 0:
+                    max_range = y_interval[1] - start_y
+                else:
+                    max_range = y_interval[0] - start_y
+                abs_max = -direction * max_range
+                spread = velocity * math.sin(launch_angle) - abs_max
+                force_max = 2 * spread / rest_time ** 2
+                # Randomly sample the force depending on the maximum
+                if (change_ratio == 0.0) or (save_force == 0.0):
+                    force = force_max * uniforms[curve, 2 * part + 2]
+                else:
+                    limiter = min(save_force, force_max)
+                    force = (limiter * change_ratio
+                             * uniforms[curve, 2 * part + 2])
+        accepted[curve] = valid
+
+# Compile the batch kernel into parallel machine code if possible, and
+# into sequential machine code for threads that run kernels side by side
+if njit is not None:
+    sequential = njit(kernel)
+    kernel = njit(parallel = True)(kernel)
+else:
+    sequential = kernel
+
+def vectorizer(rows,
+               y_starts,
+               directions,
+               launch_angles,
+               change_points,
+               n_changes,
+               uniforms,
+               targets,
+               steps,
+               step_size,
+               x_end,
+               y_intervals,
+               change_ratios,
+               flat_state,
+               antithetic,
+               curves,
+               accepted):
+    """
+    Compute a batch of planned curves with array operations across them.
+
+    This function computes the same curves as the kernel() function, but
+    with NumPy array operations across all curves of the batch instead
+    of loops over single curves. The partial paths are processed one
+    after another for all curves at once, using only the closed-form
+    state at the end of each partial path. Since each partial path is a
+    parabola, its extreme values over the measurement points are found
+    at its end points or next to its vertex, so that curves leaving the
+    y-axis interval are abandoned before their later partial paths are
+    processed. Only the accepted curves are then evaluated at all of
+    their measurement points, in chunks of rows to limit memory use.
+
+    Parameters:
+    -----------
+    rows : numpy.ndarray
+        The row indices of the output array into which the curves of the
+        batch are written, with one index per curve plan.
+
+    y_starts : numpy.ndarray
+        The y-axis values from which the projectiles start their flight,
+        with one value per curve plan.
+
+    directions : numpy.ndarray
+        The initial directions of gravitational influence as integers
+        from the set {-1, 1}, with one value per curve plan.
+
+    launch_angles : numpy.ndarray
+        The launch angles with which the projectiles start their flight,
+        with one value per curve plan.
+
+    change_points : numpy.ndarray
+        The sorted change point indices of each curve plan, padded with
+        zeros to the largest number of change points in the batch.
+
+    n_changes : numpy.ndarray
+        The number of valid change points in each row of the parameter
+        'change_points', with one value per curve plan.
+
+    uniforms : numpy.ndarray
+        The uniform variates for the force samples of each curve plan,
+        padded with zeros to the largest number of variates in the batch.
+
+    targets : numpy.ndarray
+        The y-axis values at which the partial paths that end at anchor
+        points are aimed, padded like 'change_points', with NaN for the
+        change points that aren't anchor points.
+
+    steps : numpy.ndarray
+        The x-axis measurement points on the linear scale of the
+        calculation, at which the y-axis values of the curves are taken.
+
+    step_size : float
+        The step size for the x-axis measurement points at which the
+        location of the projectile along the y-axis are to be measured.
+
+    x_end : float
+        The right end of the x-axis interval, from which the remaining
+        flight time is calculated to bound the sampled forces.
+
+    y_intervals : numpy.ndarray
+        The y-axis interval of each curve plan, as one row with [lower
+        point, upper point] per curve plan. This range indicates which
+        y-axis window curves shouldn't leave under any circumstances.
+
+    change_ratios : numpy.ndarray
+        The value by which the previous force is multiplied to limit the
+        next force, with a value of zero indicating that no ratio is set,
+        with one value per curve plan.
+
+    flat_state : bool
+        The indicator whether the first change point marks the end of a
+        flat start, in which case the first partial path has zero force.
+
+    antithetic : bool
+        The indicator whether each curve is later mirrored about its
+        starting point, in which case the y-axis interval is narrowed
+        so that the mirrored curve stays within the interval as well.
+
+    curves : numpy.ndarray
+        The output array with one row per curve and one column per
+        x-axis measurement point, which is modified in place. Its type
+        sets the precision in which the curves are stored and checked.
+
+    accepted : numpy.ndarray
+        The boolean output array marking the curves that stay within
+        the y-axis interval, which is modified in place.
+
+    Returns:
+    --------
+    None
+
+    Attributes:
+    -----------
+    None
+    """
+    n_measure = len(steps)
+    n_plans = len(rows)
+    width = change_points.shape[1]
+    n_parts = n_changes + 1
+    lower = y_intervals[:, 0]
+    upper = y_intervals[:, 1]
+    # Narrow the checked intervals so that the mirrors stay inside
+    if antithetic:
+        low = np.maximum(lower, 2 * y_starts - upper)
+        high = np.minimum(upper, 2 * y_starts - lower)
+    else:
+        low = lower
+        high = upper
+    # Ignore divisions by zero for degenerate forces and angles
+    with np.errstate(all = "ignore"):
+        # Set the initial state of the projectiles from the plans
+        start_y = np.array(y_starts, dtype = np.float64)
+        direction = np.array(directions, dtype = np.int64)
+        launch_angle = np.array(launch_angles, dtype = np.float64)
+        velocity = np.ones(n_plans)
+        # Get the maximum forces to stay within the intervals
+        rest_time = x_end / velocity
+        max_range = np.where(direction > 0, upper, lower) - start_y
+        abs_max = -direction * max_range
+        spread = velocity * np.sin(launch_angle) - abs_max
+        force_max = 2 * spread / rest_time ** 2
+        force = force_max * uniforms[:, 0]
+        save_force = np.zeros(n_plans)
+        flat_pending = np.full(n_plans, flat_state)
+        counter = np.zeros(n_plans, dtype = np.int64)
+        valid = (start_y >= low) & (start_y <= high)
+        # Initialize the closed-form parameters of all partial paths
+        max_parts = np.max(n_parts, initial = 1)
+        precision = curves.dtype
+        part_start = np.zeros((n_plans, max_parts), dtype = precision)
+        part_y = np.zeros((n_plans, max_parts), dtype = precision)
+        part_direction = np.zeros((n_plans, max_parts), dtype = precision)
+        part_horizontal = np.ones((n_plans, max_parts), dtype = precision)
+        part_interim = np.zeros((n_plans, max_parts), dtype = precision)
+        part_half = np.zeros((n_plans, max_parts), dtype = precision)
+        # Loop over the partial paths for all curves at once
+        for part in range(0, max_parts):
+            active = valid & (part < n_parts)
+            if not np.any(active):
+                break
+            top = active & (part < n_parts - 1)
+            if part < width:
+                end = np.where(top, change_points[:, min(part, width - 1)],
+                               n_measure - 1)
+            else:
+                end = np.full(n_plans, n_measure - 1)
+            # Sample random forces for the partial paths
+            u_top = uniforms[:, 2 * part + 1]
+            scaled = force_max * (n_measure / (end - counter + 1))
+            force_max = np.where(top, scaled, force_max)
+            plain = (change_ratios == 0.0) | (part == 0) | (save_force == 0.0)
+            limiter = np.minimum(force_max, save_force * change_ratios)
+            sampled = np.where(plain, force_max * u_top, limiter * u_top)
+            sampled = np.where(flat_pending, 0.0, sampled)
+            force = np.where(top, sampled, force)
+            flat_pending = flat_pending & ~top
+            # Aim the partial paths at the targets of anchor points
+            if part < width:
+                target = targets[:, part]
+                horizontal = velocity * np.cos(launch_angle)
+                interim = velocity * np.sin(launch_angle)
+                time = ((end - counter) * step_size) / horizontal
+                rise = (target - start_y) * direction
+                aimed = 2 * (rise / time + interim) / time
+                force = np.where(top & ~np.isnan(target), aimed, force)
+            save_force = np.where(active, force, save_force)
+            # Save the closed-form parameters of the partial paths
+            horizontal_velocity = velocity * np.cos(launch_angle)
+            interim = velocity * np.sin(launch_angle)
+            half_force = 0.5 * force
+            part_start[:, part] = counter
+            part_y[:, part] = start_y
+            part_direction[:, part] = direction
+            part_horizontal[:, part] = horizontal_velocity
+            part_interim[:, part] = interim
+            part_half[:, part] = half_force
+            # Check the end points and the vertex of the partial paths
+            length = end - counter
+            vertex = interim / force * horizontal_velocity / step_size
+            vertex = np.nan_to_num(vertex, nan = 0.0, posinf = 0.0,
+                                   neginf = 0.0)
+            vertex = np.clip(np.floor(vertex), 0, length).astype(np.int64)
+            for offset in [length, vertex, np.minimum(vertex + 1, length)]:
+                time = (offset * step_size) / horizontal_velocity
+                displacement = time * (time * half_force - interim)
+                point = (displacement * direction) + start_y
+                point = np.where(offset > 0, point, start_y)
+                inside = (point >= low) & (point <= high)
+                valid = valid & (inside | ~active)
+            # Calculate the state at the end of the partial paths
+            time = (length * step_size) / horizontal_velocity
+            displacement = time * (time * half_force - interim)
+            end_y = (displacement * direction) + start_y
+            end_y = np.where(length > 0, end_y, start_y)
+            vertical_velocity = interim - force * time
+            end_velocity = np.sqrt(horizontal_velocity ** 2
+                                   + vertical_velocity ** 2)
+            end_velocity = np.where(length > 0, end_velocity, velocity)
+            end_angle = np.arctan(-vertical_velocity / horizontal_velocity)
+            # Update parameters for the next loop iteration
+            launch_angle = np.where(active, end_angle, launch_angle)
+            velocity = np.where(active, end_velocity, velocity)
+            start_y = np.where(active, end_y, start_y)
+            direction = np.where(active, -direction, direction)
+            counter = np.where(active, end, counter)
+            # Sample the forces for the next parts of unfinished curves
+            rest_time = (x_end - steps[end]) / velocity
+            max_range = np.where(direction > 0, upper, lower) - start_y
+            abs_max = -direction * max_range
+            spread = velocity * np.sin(launch_angle) - abs_max
+            next_max = 2 * spread / rest_time ** 2
+            u_bottom = uniforms[:, 2 * part + 2]
+            plain = (change_ratios == 0.0) | (save_force == 0.0)
+            limiter = np.minimum(save_force, next_max)
+            sampled = np.where(plain, next_max * u_bottom,
+                               limiter * change_ratios * u_bottom)
+            force_max = np.where(top, next_max, force_max)
+            force = np.where(top, sampled, force)
+        # Evaluate the surviving curves at all measurement points
+        survivors = np.flatnonzero(valid)
+        chunk = max(1, 2 ** 20 // max(1, n_measure))
+        indices = np.arange(0, n_measure, dtype = precision)
+        for first in range(0, len(survivors), chunk):
+            selection = survivors[first:first + chunk]
+            # Find the partial path of each measurement point
+            marks = np.zeros((len(selection), n_measure), dtype = np.int64)
+            used = (np.arange(0, width)[np.newaxis, :]
+                    < n_changes[selection][:, np.newaxis])
+            plan_index, change_index = np.nonzero(used)
+            marks[plan_index,
+                  change_points[selection][plan_index, change_index]] = 1
+            part_index = np.cumsum(marks, axis = 1)
+            plan_index = selection[:, np.newaxis]
+            # Calculate the y-axis values of the partial paths
+            offset = indices - part_start[plan_index, part_index]
+            time = ((offset * step_size)
+                    / part_horizontal[plan_index, part_index])
+            displacement = time * (time * part_half[plan_index, part_index]
+                                   - part_interim[plan_index, part_index])
+            values = ((displacement * part_direction[plan_index, part_index])
+                      + part_y[plan_index, part_index])
+            values = np.where(offset > 0, values,
+                              part_y[plan_index, part_index])
+            # Confirm the bounds at every single measurement point
+            inside = np.all((values >= low[selection][:, np.newaxis])
+                            & (values <= high[selection][:, np.newaxis]),
+                            axis = 1)
+            valid[selection] = inside
+            curves[rows[selection]] = values
+    accepted[:] = valid
 
 def check(n_curves,
           x_interval,
@@ -911,7 +5871,19 @@ def check(n_curves,
           change_range,
           change_spacing,
           change_ratio,
-          start_force):
+          start_force,
+          seed,
+          first_curve,
+          engine,
+          dense,
+          dtype,
+          backend,
+          n_workers,
+          sampling,
+          antithetic,
+          accept,
+          anchors,
+          time_budget):
     """
     Check the user-provided parameter to make sure they are valid inputs.
 
@@ -1009,6 +5981,60 @@ def check(n_curves,
         if a function perturbation should only happen after a certain
         point, which can be specified by setting this parameter.
 
+    seed : int or None
+        The seed that keys the counter-based random number generators of
+        all curves. Each curve index draws from its own stream, so that
+        the same seed always reproduces the same curve for a given index.
+        If no seed is provided, a fresh seed is drawn from the system.
+
+    first_curve : int
+        The index of the first curve that is to be generated. Together
+        with 'seed', this allows regenerating any slice of a seeded set
+        of curves, e.g. the curves with indices 1000 to 1009, without
+        having to generate all of the curves that come before them.
+
+    engine : str
+        The backend that computes the curves, as either "numpy" for the
+        reference implementation that computes one curve at a time,
+        "vectorized" for NumPy array operations across whole batches of
+        curves, or "numba" for a compiled kernel that computes batches
+        in parallel across curves.
+
+    dense : bool
+        The indicator whether the curves should be returned as a single
+        array of y-axis values together with the x-axis values that are
+        shared by all curves, instead of a list with one array per curve.
+
+    dtype : numpy.dtype
+        The floating-point type of the generated curves, as either
+        numpy.float64 or numpy.float32.
+
+    backend : str
+        The way in which the work is spread over several workers, as
+        either "serial", "threads" or "processes".
+
+    n_workers : int or None
+        The number of threads or processes of the backend, with None
+        using the number of processors of the machine.
+
+    sampling : str
+        The way in which the random values of the first attempt of each
+        curve are drawn, as either "random", "sobol" or "lhs".
+
+    antithetic : bool
+        The indicator whether the curves should be generated in mirrored
+        pairs about their starting points.
+
+    accept : callable or None
+        The acceptance test of the user for each new batch of curves.
+
+    anchors : list or None
+        The points through which all curves should pass, as a list of
+        (x-axis value, y-axis value, tolerance) tuples.
+
+    time_budget : float or None
+        The number of seconds after which the generation stops.
+
     Returns:
     --------
     None
@@ -1018,7 +6044,7 @@ def check(n_curves,
     None
     """
     # Create a boolean vector to mark all incorrect inputs
-    incorrect_inputs = np.zeros(15, dtype = bool)
+    incorrect_inputs = np.zeros(30, dtype = bool)
     # Check if the number of curves is a positive integer
     if type(n_curves) is not int:
         incorrect_inputs[0] = True
@@ -1108,6 +6134,81 @@ def check(n_curves,
         if convergence_point is not None:
             if np.log10(convergence_point[0]).is_integer() is False:
                 incorrect_inputs[14] = True
+    # Check if the seed is None or a non-negative integer
+    if seed is not None:
+        if type(seed) is not int:
+            incorrect_inputs[15] = True
+        elif seed < 0:
+            incorrect_inputs[15] = True
+    # Check if the first curve index is a non-negative integer
+    if type(first_curve) is not int:
+        incorrect_inputs[16] = True
+    elif first_curve < 0:
+        incorrect_inputs[16] = True
+    # Check if the engine is one of the available backends
+    if engine not in ["numpy", "vectorized", "numba"]:
+        incorrect_inputs[17] = True
+    # Check if the dense output indicator is a boolean
+    if type(dense) is not bool:
+        incorrect_inputs[18] = True
+    # Check if the floating-point type is single or double precision
+    if dtype not in [np.float32, np.float64]:
+        incorrect_inputs[19] = True
+    # Check if the backend is one of the available backends
+    if backend not in ["serial", "threads", "processes"]:
+        incorrect_inputs[20] = True
+    # Check if the number of workers is None or a positive integer
+    if n_workers is not None:
+        if type(n_workers) is not int:
+            incorrect_inputs[21] = True
+        elif n_workers < 1:
+            incorrect_inputs[21] = True
+    # Check if the sampling is one of the available sampling schemes
+    if sampling not in ["random", "sobol", "lhs"]:
+        incorrect_inputs[22] = True
+    # Check if the mirrored pairs indicator is a boolean
+    if type(antithetic) is not bool:
+        incorrect_inputs[23] = True
+    # Check if the acceptance test is None or a callable
+    if (accept is not None) and (callable(accept) is False):
+        incorrect_inputs[24] = True
+    # Check if the anchor points are None or a list of valid points
+    if anchors is not None:
+        if (type(anchors) is not list) or (len(anchors) == 0):
+            incorrect_inputs[25] = True
+        else:
+            for anchor in anchors:
+                if ((type(anchor) not in [list, tuple])
+                    or (len(anchor) != 3)
+                    or any(type(value) is not float for value in anchor)):
+                    incorrect_inputs[25] = True
+                elif ((anchor[0] <= x_interval[0])
+                      or (anchor[0] > x_interval[1])
+                      or (anchor[1] < y_interval[0])
+                      or (anchor[1] > y_interval[1])
+                      or (anchor[2] < 0)):
+                    incorrect_inputs[25] = True
+                elif (start_force is not None) and (anchor[0] <= start_force):
+                    incorrect_inputs[25] = True
+        # Check if the anchor points are combined with mirrored pairs
+        if antithetic == True:
+            incorrect_inputs[26] = True
+        # Check if any order of the sampled change points leaves room for
+        # the last one, as each change point blocks its spaced window
+        if not any(incorrect_inputs[[3, 4, 9, 10, 25]]):
+            spread = [0.1, 0.9] if change_range is None else change_range
+            width = int(n_measure * spread[1]) - int(n_measure * spread[0])
+            spacing = 1 if change_spacing is None else change_spacing
+            if ((len(anchors) + direction_maximum - 1) * (2 * spacing - 1)
+                >= width):
+                incorrect_inputs[29] = True
+    # Check if the time budget is None or a positive number of seconds
+    if time_budget is not None:
+        if (type(time_budget) not in [int, float]) or (time_budget <= 0):
+            incorrect_inputs[27] = True
+        # Check if the time budget is combined with starting processes
+        if backend == "processes":
+            incorrect_inputs[28] = True
     # Define error messages for each unsuitable parameter input
     errors = ['ERROR: n_curves: Must be an integer > 0',
               'ERROR: x_interval: Must be a list of length 2, ' +
@@ -1142,10 +6243,72 @@ def check(n_curves,
               'valid log-scale values, e.g. 0.01 or 10.0',
               'ERROR: convergence_point, log_scale: If log_scale ' +
               'is True, the first element of convergence_points ' +
-              'has to be a valid log-scale value, e.g. 0.01 or 10.0']
+              'has to be a valid log-scale value, e.g. 0.01 or 10.0',
+              'ERROR: seed: Must be either None or an integer >= 0',
+              'ERROR: first_curve: Must be an integer >= 0',
+              'ERROR: engine: Must be either "numpy", "vectorized" ' +
+              'or "numba"',
+              'ERROR: dense: Must be a boolean value',
+              'ERROR: dtype: Must be either numpy.float32 or numpy.float64',
+              'ERROR: backend: Must be either "serial", "threads" ' +
+              'or "processes"',
+              'ERROR: n_workers: Must be either None or an integer >= 1',
+              'ERROR: sampling: Must be either "random", "sobol" or "lhs"',
+              'ERROR: antithetic: Must be a boolean value',
+              'ERROR: accept: Must be either None or a callable',
+              'ERROR: anchors: Must be either None or a list of ' +
+              '(x, y, tolerance) tuples of floats, with x after the ' +
+              'first point of x_interval and after start_force, y in ' +
+              'y_interval and tolerance >= 0',
+              'ERROR: anchors, antithetic: Anchor points can\'t be ' +
+              'combined with mirrored pairs',
+              'ERROR: time_budget: Must be either None or a number > 0',
+              'ERROR: time_budget, backend: A time budget can\'t be ' +
+              'combined with the "processes" backend, whose start-up ' +
+              'alone takes longer than typical budgets',
+              'ERROR: anchors, change_spacing: The anchor points and ' +
+              'direction_maximum change points, each with a window of ' +
+              '2 * change_spacing - 1 measurement points, must fit into ' +
+              'the measurement points of change_range']
     # If there are unsuitable inputs, print errors and terminate
     if any(value == True for value in incorrect_inputs):
         for i in range(0, len(errors)):
             if incorrect_inputs[i] == True:
                 print(errors[i])
         sys.exit()
+
+def main(arguments = None):
+    """
+    Run the command-line interface, i.e. "smurves.py serve".
+
+    Parameters:
+    -----------
+    arguments : list of str, defaults to None
+        The command-line arguments, with None using the ones of the call.
+
+    Returns:
+    --------
+    None
+
+    Attributes:
+    -----------
+    None
+    """
+    parser = argparse.ArgumentParser(prog = "smurves")
+    commands = parser.add_subparsers(dest = "command", required = True)
+    server = commands.add_parser("serve",
+                                 help = "serve curves on a Unix domain socket")
+    server.add_argument("--socket", default = "smurves.sock",
+                        help = "the path of the socket")
+    server.add_argument("--directory", default = None,
+                        help = "the directory for the result files")
+    server.add_argument("--sessions", type = int, default = 32,
+                        help = "the number of warm sessions that are kept")
+    arguments = parser.parse_args(arguments)
+    if arguments.command == "serve":
+        serve(socket_path = arguments.socket,
+              directory = arguments.directory,
+              n_sessions = arguments.sessions)
+
+if __name__ == "__main__":
+    main()